@@ -0,0 +1,181 @@
+"""
+크롤링 성능 벤치마크 스크립트
+로컬 KTour 대체 사이트(fake_ktour_site.py)를 띄우고 KTourCrawler를 처음부터 끝까지 실행하여
+날짜/분, 예약/분, 단계별 소요 시간을 측정
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+from datetime import datetime, timedelta
+
+import config
+import metrics
+import resilience
+from crawler import KTourCrawler
+from orchestrator import build_slots, crawl_with_orchestrator
+from fake_ktour_site import FakeKTourSite
+
+
+def run_benchmark(dates, teams_per_day=5, latency=0.0, render_delay=0.1, workers=1, backend='browser',
+                  profile=None, capture_network=False, headless=True, rate_limit=0, empty_every=0):
+    """
+    대체 사이트에서 크롤링 1회 실행 및 측정
+
+    Args:
+        dates (list): 크롤링할 날짜 리스트 (YYYY-MM-DD)
+        teams_per_day (int): 날짜별 팀(예약) 수
+        latency (float): 모든 HTTP 응답에 추가할 지연(초)
+        render_delay (float): 화면 갱신 지연(초)
+        workers (int): 브라우저 슬롯 수
+        backend (str): browser, http
+        profile (str): 브라우저 프로필 full, lean
+        capture_network (bool): 네트워크 응답(JSON)에서 예약 정보 추출 여부
+        headless (bool): 헤드리스 모드 사용 여부
+        rate_limit (float): 초당 최대 작업 시작 수 (0이면 제한 없음)
+        empty_every (int): N일마다 예약 없는 날짜 (0이면 없음)
+
+    Returns:
+        dict: 벤치마크 결과 (처리량, 정확도, 단계별 소요 시간 보고서)
+    """
+    site = FakeKTourSite(
+        teams_per_day=teams_per_day,
+        latency=latency,
+        render_delay=render_delay,
+        empty_every=empty_every,
+        initial_date=dates[0]
+    )
+    site.start()
+
+    # 크롤러가 대체 사이트를 보도록 설정
+    config.BASE_URL = site.url
+    config.LOGIN_ID = config.LOGIN_ID or 'benchmark@example.com'
+    config.LOGIN_PASSWORD = config.LOGIN_PASSWORD or 'benchmark'
+    config.API_RESERVATIONS_URL = site.api_url
+    config.DEFAULT_STORE_NAME = site.store_name
+    config.STORE_NAMES = [site.store_name]
+
+    run_metrics = metrics.start_run(f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    resilience.start_run()
+    crawler_options = {
+        'headless': headless,
+        'use_session_cache': False,  # 로그인 시간도 측정
+        'capture_network': capture_network,
+        'profile': profile,
+        'traffic_stats': True,  # 프로필별 전송량 비교용
+    }
+    crawler = KTourCrawler(**crawler_options)
+
+    started = time.perf_counter()
+    try:
+        slots = build_slots(
+            crawler,
+            backend=backend,
+            workers=workers,
+            crawler_factory=lambda: KTourCrawler(**crawler_options)
+        )
+        reservations, failed_dates = crawl_with_orchestrator(
+            slots, site.store_name, dates, rate_limit=rate_limit
+        )
+    finally:
+        elapsed = time.perf_counter() - started
+        crawler.close()
+        site.stop()
+
+    minutes = elapsed / 60 if elapsed else 0
+    expected = site.expected_reservations(dates)
+
+    return {
+        'params': {
+            'dates': len(dates),
+            'teams_per_day': teams_per_day,
+            'latency': latency,
+            'render_delay': render_delay,
+            'workers': workers,
+            'backend': backend,
+            'profile': profile or config.BROWSER_PROFILE,
+            'capture_network': capture_network,
+            'rate_limit': rate_limit,
+        },
+        'elapsed': round(elapsed, 3),
+        'dates_per_minute': round(len(dates) / minutes, 2) if minutes else 0,
+        'reservations_per_minute': round(len(reservations) / minutes, 2) if minutes else 0,
+        'reservations': len(reservations),
+        'expected_reservations': expected,
+        'failed_dates': failed_dates,
+        'site_requests': site.requests,
+        'metrics': run_metrics.report()
+    }
+
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='로컬 대체 사이트 크롤링 벤치마크')
+    parser.add_argument('--dates', type=int, default=5, help='크롤링할 날짜 수 (기본값: 5)')
+    parser.add_argument('--start-date', type=str, help='시작 날짜 (YYYY-MM-DD, 기본값: 오늘)')
+    parser.add_argument('--teams', type=int, default=5, help='날짜별 팀 수 (기본값: 5)')
+    parser.add_argument('--latency', type=float, default=0.0, help='HTTP 응답 지연(초)')
+    parser.add_argument('--render-delay', type=float, default=0.1, help='화면 갱신 지연(초, 기본값: 0.1)')
+    parser.add_argument('--empty-every', type=int, default=0, help='N일마다 예약 없는 날짜 (기본값: 없음)')
+    parser.add_argument('--workers', type=int, default=1, help='브라우저 수 (기본값: 1)')
+    parser.add_argument('--backend', type=str, choices=['browser', 'http'], default='browser')
+    parser.add_argument('--profile', type=str, choices=['full', 'lean'])
+    parser.add_argument('--capture-network', action='store_true')
+    parser.add_argument('--rate-limit', type=float, default=0, help='초당 최대 날짜 작업 시작 수 (기본값: 제한 없음)')
+    parser.add_argument('--show-browser', action='store_true', help='브라우저 화면 표시')
+    parser.add_argument('--output', type=str, help='결과 JSON 파일 (기본값: output/benchmarks/)')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    logger = logging.getLogger('benchmark')
+    logger.setLevel(logging.INFO)
+
+    start = datetime.strptime(args.start_date, '%Y-%m-%d') if args.start_date else datetime.now()
+    dates = [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(args.dates)]
+
+    result = run_benchmark(
+        dates,
+        teams_per_day=args.teams,
+        latency=args.latency,
+        render_delay=args.render_delay,
+        workers=args.workers,
+        backend=args.backend,
+        profile=args.profile,
+        capture_network=args.capture_network,
+        headless=not args.show_browser,
+        rate_limit=args.rate_limit,
+        empty_every=args.empty_every
+    )
+
+    logger.info("=" * 60)
+    logger.info("벤치마크 결과")
+    logger.info("=" * 60)
+    logger.info(f"설정: {result['params']}")
+    logger.info(f"소요 시간: {result['elapsed']}초")
+    logger.info(f"처리량: {result['dates_per_minute']} 날짜/분, {result['reservations_per_minute']} 예약/분")
+    logger.info(f"예약 수집: {result['reservations']}/{result['expected_reservations']}건, "
+                f"실패 날짜 {len(result['failed_dates'])}개")
+
+    report_metrics = metrics.current_run()
+    report_metrics.log_summary(logger)
+
+    output = args.output
+    if not output:
+        directory = os.path.join(config.OUTPUT_DIR, 'benchmarks')
+        os.makedirs(directory, exist_ok=True)
+        output = os.path.join(directory, f"{report_metrics.run_id}.json")
+
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    logger.info(f"결과 저장: {output}")
+
+    # 수집 건수가 맞지 않으면 실패 코드 반환 (성능 변경이 결과를 바꾸지 않았는지 확인용)
+    return 0 if result['reservations'] == result['expected_reservations'] and not result['failed_dates'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
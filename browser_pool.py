@@ -0,0 +1,190 @@
+"""
+로그인된 브라우저 세션 풀 모듈
+웹 서버 프로세스가 로그인된 KTourCrawler 세션을 유지하고, 작업마다 빌려주고 돌려받아 재사용
+"""
+
+import time
+import threading
+import logging
+
+from selenium.common.exceptions import WebDriverException
+
+from crawler import KTourCrawler
+import config
+
+
+class _PooledSession:
+    """풀에 보관 중인 세션"""
+
+    def __init__(self, crawler, key):
+        self.crawler = crawler
+        self.key = key
+        self.last_used = time.time()
+
+
+class WarmBrowserPool:
+    """로그인 상태를 유지하는 브라우저 세션 풀 클래스"""
+
+    def __init__(self, size=None, idle_timeout=None, headless=True):
+        """
+        초기화
+
+        Args:
+            size (int): 유지할 최대 세션 수 (없으면 config.WARM_POOL_SIZE)
+            idle_timeout (int): 이 시간(초) 동안 사용되지 않은 세션은 종료 (없으면 config.WARM_POOL_IDLE_TIMEOUT)
+            headless (bool): 헤드리스 모드 사용 여부
+        """
+        self.size = max(1, int(size or config.WARM_POOL_SIZE))
+        self.idle_timeout = config.WARM_POOL_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        self.headless = headless
+        self.logger = logging.getLogger(__name__)
+
+        self._idle = []  # 대기 중인 세션
+        self._in_use = {}  # id(crawler) -> 키
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+        self._reaper = threading.Thread(target=self._reap_loop, name='warm-pool-reaper')
+        self._reaper.daemon = True
+        self._reaper.start()
+
+    @staticmethod
+    def _key(options):
+        """
+        크롤러 옵션으로 세션 종류 구분 (옵션이 같은 세션만 재사용)
+        생략하거나 None으로 준 옵션은 KTourCrawler와 같은 기본값으로 채우고, 꺼진(False) 옵션은 빼서
+        warm_up()처럼 옵션 없이 만든 세션과 기본값을 직접 넘긴 요청이 같은 키가 되도록 함
+        """
+        resolved = {
+            'capture_network': config.NETWORK_CAPTURE_ENABLED,
+            'profile': config.BROWSER_PROFILE,
+            'traffic_stats': config.BROWSER_TRAFFIC_STATS,
+        }
+        resolved.update((name, value) for name, value in options.items() if value is not None)
+        return tuple(sorted((name, value) for name, value in resolved.items() if value is not False))
+
+    def _create(self, options):
+        """새 세션 생성 및 로그인"""
+        crawler = KTourCrawler(headless=self.headless, **options)
+        try:
+            crawler.setup_driver()
+            crawler.login()
+        except Exception:
+            crawler.close()
+            raise
+        return crawler
+
+    def _prepare(self, crawler):
+        """
+        재사용할 세션 점검: 메인 페이지로 이동 후 로그인이 풀렸으면 다시 로그인
+
+        Returns:
+            bool: 사용 가능하면 True (브라우저가 죽었으면 False)
+        """
+        try:
+            crawler.return_to_main_page()
+            if not crawler.is_logged_in():
+                self.logger.info("세션 만료, 다시 로그인")
+                crawler.login()
+            return True
+        except WebDriverException as e:
+            self.logger.warning(f"세션 점검 실패, 새 세션으로 교체: {e}")
+            return False
+
+    def _discard(self, crawler):
+        """세션 종료 (오류 무시)"""
+        try:
+            crawler.close()
+        except Exception as e:
+            self.logger.debug(f"세션 종료 실패: {e}")
+
+    def acquire(self, **options):
+        """
+        로그인된 세션 빌리기 (메인 페이지 상태, 수집 결과 초기화)
+
+        Args:
+            **options: KTourCrawler 생성 옵션 (capture_network, profile 등)
+
+        Returns:
+            KTourCrawler: 로그인된 크롤러
+        """
+        key = self._key(options)
+
+        with self._lock:
+            session = next((s for s in self._idle if s.key == key), None)
+            if session:
+                self._idle.remove(session)
+            elif self._idle and len(self._idle) + len(self._in_use) >= self.size:
+                # 옵션이 다른 세션만 남아 있으면 가장 오래된 세션을 정리하여 자리 확보
+                stale = min(self._idle, key=lambda s: s.last_used)
+                self._idle.remove(stale)
+                self._discard(stale.crawler)
+
+        crawler = None
+        if session:
+            if self._prepare(session.crawler):
+                crawler = session.crawler
+                self.logger.info("대기 중인 세션 재사용")
+            else:
+                self._discard(session.crawler)
+
+        if crawler is None:
+            self.logger.info("새 세션 생성")
+            crawler = self._create(options)
+
+        crawler.reset_results()
+
+        with self._lock:
+            self._in_use[id(crawler)] = key
+
+        return crawler
+
+    def release(self, crawler, discard=False):
+        """
+        세션 반납 (풀이 가득 찼거나 discard=True면 종료)
+
+        Args:
+            crawler (KTourCrawler): acquire()로 빌린 크롤러
+            discard (bool): 재사용하지 않고 종료할지 여부
+        """
+        with self._lock:
+            key = self._in_use.pop(id(crawler), None)
+            keep = (
+                not discard and key is not None and not self._closed.is_set()
+                and len(self._idle) + len(self._in_use) < self.size
+            )
+            if keep:
+                self._idle.append(_PooledSession(crawler, key))
+
+        if not keep:
+            self._discard(crawler)
+
+    def warm_up(self, **options):
+        """세션 하나를 미리 만들어 풀에 보관 (서버 시작 시)"""
+        try:
+            self.release(self.acquire(**options))
+        except Exception as e:
+            self.logger.error(f"세션 미리 준비 실패: {e}")
+
+    def _reap_loop(self):
+        """유휴 시간이 지난 세션을 주기적으로 종료"""
+        interval = max(1, min(60, self.idle_timeout / 2))
+        while not self._closed.wait(interval):
+            now = time.time()
+            with self._lock:
+                expired = [s for s in self._idle if now - s.last_used > self.idle_timeout]
+                for session in expired:
+                    self._idle.remove(session)
+
+            for session in expired:
+                self.logger.info("유휴 세션 종료")
+                self._discard(session.crawler)
+
+    def close(self):
+        """대기 중인 모든 세션 종료 (사용 중인 세션은 반납 시 종료)"""
+        self._closed.set()
+        with self._lock:
+            sessions, self._idle = self._idle, []
+
+        for session in sessions:
+            self._discard(session.crawler)
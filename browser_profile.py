@@ -0,0 +1,180 @@
+"""
+브라우저 프로필 모듈
+lean 프로필: 이미지/폰트/미디어/외부 분석 스크립트 요청을 CDP로 차단하고 작은 고정 창 크기 사용
+브라우저 네트워크 트래픽(요청 수, 전송 바이트, 차단 요청)을 기록하여 프로필별로 비교
+"""
+
+import os
+import json
+import threading
+import logging
+
+import config
+
+
+BROWSER_PROFILES = ('full', 'lean')
+
+# 여러 워커가 같은 통계 파일에 누적할 때 사용
+_STATS_LOCK = threading.Lock()
+
+
+def apply_profile_options(chrome_options, profile):
+    """
+    ChromeOptions에 프로필별 설정 추가
+
+    Args:
+        chrome_options: selenium ChromeOptions
+        profile (str): full, lean
+    """
+    if profile != 'lean':
+        return
+
+    width, height = config.LEAN_WINDOW_SIZE
+    chrome_options.add_argument(f'--window-size={width},{height}')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-remote-fonts')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--mute-audio')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+
+
+def block_resources(driver, patterns=None):
+    """
+    CDP로 URL 패턴에 맞는 요청 차단 (이후 모든 페이지 로드에 적용)
+
+    Args:
+        driver: Chrome WebDriver
+        patterns (list): 차단할 URL 와일드카드 패턴 (없으면 config.LEAN_BLOCKED_URL_PATTERNS)
+    """
+    patterns = config.LEAN_BLOCKED_URL_PATTERNS if patterns is None else patterns
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+
+
+class TrafficStats:
+    """CDP 성능 로그로 브라우저 트래픽을 집계하는 클래스"""
+
+    def __init__(self, driver, profile, path=None):
+        """
+        초기화
+
+        Args:
+            driver: 성능 로그가 활성화된 Chrome WebDriver
+            profile (str): 브라우저 프로필 이름
+            path (str): 프로필별 누적 통계 파일 (없으면 config.TRAFFIC_STATS_FILE)
+        """
+        self.driver = driver
+        self.profile = profile
+        self.path = path or config.TRAFFIC_STATS_FILE
+        self.logger = logging.getLogger(__name__)
+
+        self.pages = 0
+        self.requests = 0
+        self.bytes = 0
+        self.blocked = {}
+
+    def observe(self, message):
+        """
+        CDP 네트워크 이벤트 하나 반영 (NetworkCapture가 성능 로그를 먼저 읽는 경우에도 호출됨)
+
+        Args:
+            message (dict): 성능 로그의 message ({'method', 'params'})
+        """
+        method = message.get('method')
+        params = message.get('params', {})
+
+        if method == 'Network.requestWillBeSent' and params.get('type') == 'Document':
+            self.pages += 1
+        elif method == 'Network.loadingFinished':
+            self.requests += 1
+            self.bytes += int(params.get('encodedDataLength') or 0)
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            resource_type = params.get('type', 'Other')
+            self.blocked[resource_type] = self.blocked.get(resource_type, 0) + 1
+
+    def update(self):
+        """쌓인 성능 로그를 읽어 통계 반영 (로그 버퍼가 계속 커지지 않도록 날짜마다 호출)"""
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            self.logger.debug(f"성능 로그 읽기 실패: {e}")
+            return
+
+        for entry in entries:
+            try:
+                self.observe(json.loads(entry['message'])['message'])
+            except (KeyError, ValueError):
+                continue
+
+    @property
+    def blocked_requests(self):
+        """차단된 요청 수"""
+        return sum(self.blocked.values())
+
+    def _load(self):
+        """프로필별 누적 통계 읽기"""
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def estimated_saved_bytes(self, history=None):
+        """
+        full 프로필의 페이지당 평균 전송량 기준으로 절약한 바이트 추정
+
+        Args:
+            history (dict): 프로필별 누적 통계 (없으면 파일에서 읽음)
+
+        Returns:
+            int: 추정 절약 바이트 (full 기준 기록이 없으면 None)
+        """
+        history = self._load() if history is None else history
+        baseline = history.get('full')
+        if self.profile == 'full' or not baseline or not baseline.get('pages') or not self.pages:
+            return None
+
+        bytes_per_page = baseline['bytes'] / baseline['pages']
+        return max(0, int(bytes_per_page * self.pages - self.bytes))
+
+    def summary(self):
+        """
+        이번 세션의 트래픽 요약
+
+        Returns:
+            dict: 페이지 수, 요청 수, 전송 바이트, 차단 요청, 추정 절약 바이트
+        """
+        return {
+            'profile': self.profile,
+            'pages': self.pages,
+            'requests': self.requests,
+            'bytes': self.bytes,
+            'blocked_requests': self.blocked_requests,
+            'blocked_by_type': dict(self.blocked),
+            'estimated_saved_bytes': self.estimated_saved_bytes()
+        }
+
+    def save(self):
+        """프로필별 누적 통계 파일에 이번 세션 통계 추가 (임시 파일에 쓴 뒤 교체)"""
+        with _STATS_LOCK:
+            history = self._load()
+            totals = history.setdefault(self.profile, {'pages': 0, 'requests': 0, 'bytes': 0, 'blocked': 0})
+            totals['pages'] += self.pages
+            totals['requests'] += self.requests
+            totals['bytes'] += self.bytes
+            totals['blocked'] += self.blocked_requests
+
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(history, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,185 @@
+"""
+크롤링 체크포인트 모듈
+날짜가 끝날 때마다 완료/실패 날짜와 예약 정보를 디스크에 기록하여, 중단된 실행을 이어서 진행
+"""
+
+import os
+import json
+import time
+import threading
+import logging
+from datetime import datetime
+
+import config
+
+
+class CrawlCheckpoint:
+    """실행(run) 단위 체크포인트 클래스"""
+
+    def __init__(self, run_id=None, directory=None):
+        """
+        초기화
+
+        Args:
+            run_id (str): 실행 ID (없으면 현재 시각으로 생성)
+            directory (str): 체크포인트 디렉토리 (없으면 config.CHECKPOINT_DIR)
+        """
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.directory = directory or config.CHECKPOINT_DIR
+        self.path = os.path.join(self.directory, f"{self.run_id}.json")
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        self.state = {
+            'run_id': self.run_id,
+            'status': 'running',
+            'params': {},
+            'dates': [],
+            'completed': {},
+            'failed': {},
+            'keep_reservations': True,
+            'updated_at': None
+        }
+
+    @classmethod
+    def load(cls, run_id, directory=None):
+        """
+        저장된 체크포인트 불러오기
+
+        Args:
+            run_id (str): 실행 ID
+            directory (str): 체크포인트 디렉토리
+
+        Returns:
+            CrawlCheckpoint: 체크포인트
+
+        Raises:
+            FileNotFoundError: 체크포인트가 없는 경우
+        """
+        checkpoint = cls(run_id, directory)
+        if not os.path.exists(checkpoint.path):
+            raise FileNotFoundError(f"체크포인트를 찾을 수 없습니다: {checkpoint.path}")
+
+        with open(checkpoint.path, 'r', encoding='utf-8') as f:
+            checkpoint.state.update(json.load(f))
+
+        checkpoint.state['status'] = 'running'
+        checkpoint.logger.info(
+            f"체크포인트 불러오기: {run_id} (완료 {len(checkpoint.state['completed'])}일, "
+            f"남은 날짜 {len(checkpoint.pending_dates())}일)"
+        )
+        return checkpoint
+
+    def start(self, dates, params=None, keep_reservations=True):
+        """
+        새 실행 시작 기록
+
+        Args:
+            dates (list): 크롤링할 전체 날짜 리스트
+            params (dict): 실행 옵션 (재개 시 참고용)
+            keep_reservations (bool): 날짜별 예약 정보까지 기록할지 여부
+                (False면 건수만 기록, 예약 정보가 스트림 파일에 따로 저장될 때 사용)
+        """
+        with self._lock:
+            self.state['dates'] = list(dates)
+            self.state['params'] = params or {}
+            self.state['keep_reservations'] = keep_reservations
+            self._save()
+        self.logger.info(f"체크포인트 시작: {self.path}")
+
+    @property
+    def params(self):
+        """실행 옵션"""
+        return self.state['params']
+
+    @property
+    def keep_reservations(self):
+        """날짜별 예약 정보까지 기록하는 실행인지 여부"""
+        return self.state.get('keep_reservations', True)
+
+    @property
+    def dates(self):
+        """전체 날짜 리스트"""
+        return list(self.state['dates'])
+
+    def record_date(self, target_date, reservations, success=True):
+        """
+        날짜 결과 기록 (오케스트레이터의 날짜 결과마다 호출)
+
+        Args:
+            target_date (str): 날짜 (YYYY-MM-DD)
+            reservations (list): 해당 날짜의 예약 정보 (실패 시 부분 결과)
+            success (bool): 성공 여부
+        """
+        # 예약 정보를 기록하지 않는 실행은 건수만 남겨 체크포인트 파일이 커지지 않게 함
+        record = list(reservations) if self.keep_reservations else len(reservations)
+        with self._lock:
+            if success:
+                self.state['completed'][target_date] = record
+                self.state['failed'].pop(target_date, None)
+            else:
+                self.state['failed'][target_date] = record
+            self._save()
+
+    def pending_dates(self):
+        """
+        아직 완료되지 않은 날짜 (실패한 날짜 포함, 원래 순서 유지)
+
+        Returns:
+            list: 날짜 리스트
+        """
+        return [d for d in self.state['dates'] if d not in self.state['completed']]
+
+    def completed_reservations(self):
+        """
+        완료된 날짜별 예약 정보
+
+        Returns:
+            dict: {날짜: 예약 정보 리스트} (건수만 기록한 실행이면 빈 딕셔너리)
+        """
+        return {d: list(r) for d, r in self.state['completed'].items() if isinstance(r, list)}
+
+    def finish(self, status='completed'):
+        """
+        실행 종료 상태 기록
+
+        Args:
+            status (str): completed, interrupted, failed
+        """
+        with self._lock:
+            self.state['status'] = status
+            self._save()
+        self.logger.info(f"체크포인트 상태 저장: {self.run_id} ({status})")
+
+    def _save(self):
+        """체크포인트 파일 저장 (임시 파일에 쓴 뒤 교체하여 중단되어도 깨지지 않음)"""
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+
+        self.state['updated_at'] = time.time()
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+def merge_with_checkpoint(dates, previous, reservations):
+    """
+    이전 실행에서 완료된 날짜의 결과와 이번 실행 결과를 날짜 순서대로 병합
+
+    Args:
+        dates (list): 전체 날짜 리스트
+        previous (dict): 이전에 완료된 {날짜: 예약 정보 리스트}
+        reservations (list): 이번 실행의 예약 정보 리스트
+
+    Returns:
+        list: 병합된 예약 정보 리스트
+    """
+    current = {}
+    for reservation in reservations:
+        current.setdefault(reservation['date'], []).append(reservation)
+
+    merged = []
+    for target_date in dates:
+        merged.extend(previous.get(target_date, current.get(target_date, [])))
+    return merged
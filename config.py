@@ -17,9 +17,79 @@ IMPLICIT_WAIT = 10  # 암묵적 대기 시간 (초)
 EXPLICIT_WAIT = 15  # 명시적 대기 시간 (초)
 PAGE_LOAD_TIMEOUT = 30  # 페이지 로드 타임아웃 (초)
 
+# 기본 상호명
+DEFAULT_STORE_NAME = "마리엠헤어"
+# 상호명 목록 (날짜 화면에서 글자가 같은 h6만 상호로 인식, 모든 상호 크롤링은 이 중 화면에 보이는 상호)
+STORE_NAMES = [name.strip() for name in os.getenv('STORE_NAMES', DEFAULT_STORE_NAME).split(',') if name.strip()]
+
+# 네트워크 캡처 설정 (CDP로 사이트의 JSON 응답을 직접 읽음)
+NETWORK_CAPTURE_ENABLED = False  # 기본 크롤러 모드에서 네트워크 캡처 사용 여부
+API_URL_PATTERNS = [r'/api/']  # 수집할 응답 URL 정규식 (비어 있으면 모든 JSON 응답)
+
+# 브라우저 프로필 설정 (full: 일반 크롬, lean: 이미지/폰트/미디어/외부 스크립트 차단 + 작은 고정 창 크기)
+BROWSER_PROFILE = "full"
+LEAN_WINDOW_SIZE = (1280, 900)  # lean 프로필 창 크기 (가로, 세로)
+# lean 프로필에서 차단할 URL 패턴 (CDP Network.setBlockedURLs 와일드카드)
+LEAN_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.ico',  # 이미지
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',  # 웹 폰트
+    '*.mp4', '*.webm', '*.mp3',  # 미디어
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',  # 분석/광고
+    '*facebook.net*', '*hotjar.com*', '*clarity.ms*', '*sentry.io*',
+    '*fonts.googleapis.com*', '*fonts.gstatic.com*', '*gravatar.com*',  # 외부 폰트/아바타
+]
+BROWSER_TRAFFIC_STATS = False  # 브라우저 요청 수/전송량 기록 여부 (CDP 성능 로그 사용, --traffic-stats와 벤치마크에서 켬)
+TRAFFIC_STATS_FILE = os.path.join("output", ".browser_traffic.json")  # 프로필별 누적 트래픽 통계
+
+# HTTP 재생 크롤러 설정 (로그인 후 브라우저 없이 데이터 API 직접 호출)
+API_RESERVATIONS_URL = os.getenv('API_RESERVATIONS_URL', "")  # 날짜별 예약 API URL ({date} 포함)
+API_AUTH_STORAGE_KEY = os.getenv('API_AUTH_STORAGE_KEY', "")  # 인증 토큰이 저장된 localStorage 키 (없으면 쿠키만 사용)
+HTTP_WORKERS = 8  # 동시 HTTP 요청 수
+
+# 웹 인터페이스 브라우저 세션 풀 설정 (로그인된 브라우저를 작업 사이에 유지)
+WARM_POOL_ENABLED = True  # 세션 풀 사용 여부
+WARM_POOL_SIZE = 1  # 유지할 최대 세션 수
+WARM_POOL_IDLE_TIMEOUT = 15 * 60  # 이 시간(초) 동안 사용되지 않은 세션은 종료
+WARM_POOL_PREWARM = True  # 서버 시작 시 세션을 미리 로그인해 둘지 여부
+
+# 오케스트레이터 설정
+SITE_RATE_LIMIT = 2.0  # 사이트로 보내는 날짜 작업 시작 횟수 상한 (초당, 0이면 제한 없음)
+
+# 재시도 및 회로 차단 설정
+RETRY_BACKOFF = 2.0  # 재시도마다 대기 시간 배수
+RETRY_MAX_DELAY = 30  # 재시도 최대 대기 시간(초)
+RETRY_JITTER = 0.5  # 재시도 대기 시간을 무작위로 줄이는 비율 (0~1)
+RETRY_BUDGET = 50  # 실행 전체 최대 재시도 횟수 (소진되면 크롤링 중단, 0이면 제한 없음)
+CIRCUIT_FAILURE_THRESHOLD = 5  # 크롤링을 일시 정지하는 연속 실패 날짜 수 (0이면 사용 안 함)
+CIRCUIT_COOLDOWN = 60  # 일시 정지 시간(초)
+CIRCUIT_MAX_PAUSES = 2  # 허용하는 일시 정지 횟수 (초과하면 남은 날짜를 실패로 처리하고 중단)
+
+# 증분 크롤링 설정
+LEDGER_FILE = os.path.join("output", ".freshness_ledger.json")  # 날짜별 크롤링 기록 파일
+# (크롤링한 날부터 남은 일수 상한, TTL 초) - 위에서부터 처음 맞는 규칙 적용, TTL None은 다시 크롤링하지 않음
+FRESHNESS_TTL_RULES = [
+    (-1, None),  # 지난 날짜: 다시 크롤링하지 않음
+    (7, 15 * 60),  # 오늘 ~ 7일 후: 15분
+    (None, 6 * 60 * 60),  # 그 이후: 6시간
+]
+
+# 체크포인트 설정 (날짜별 진행 상황 저장, --resume으로 이어서 실행)
+CHECKPOINT_DIR = os.path.join("output", "checkpoints")
+
+# ChromeDriver 설정
+CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH', "")  # 고정 드라이버 경로 (설정 시 다운로드하지 않음)
+DRIVER_CACHE_FILE = os.path.join(".drivers", "chromedriver.json")  # Chrome 주 버전별 드라이버 경로 기록
+
+# 단계별 소요 시간 측정 설정
+METRICS_ENABLED = True  # 크롤러 단계별 소요 시간/재시도 횟수 기록 여부
+METRICS_DIR = os.path.join("output", "metrics")  # 실행별 측정 보고서 저장 디렉토리
+
 # 데이터 저장 설정
 OUTPUT_DIR = "output"
 OUTPUT_FORMAT = "csv"  # csv 또는 json
+RESERVATION_DB_FILE = os.path.join("output", "reservations.db")  # SQLite 예약 저장소 (--output-format sqlite)
+EXCEL_WIDTH_SAMPLE_SIZE = 1000  # Excel 열 너비를 정할 때 보는 앞쪽 행 수
+EXCEL_MAX_COLUMN_WIDTH = 50  # Excel 최대 열 너비
 
 # 크롤링할 날짜 범위 (YYYY-MM-DD 형식) - 환경변수에서 로드
 START_DATE = os.getenv('START_DATE', "2025-12-05")
@@ -30,6 +100,26 @@ SHORT_DELAY = 1
 MEDIUM_DELAY = 2
 LONG_DELAY = 3
 
+# 조건 기반 대기 설정
+CONDITION_WAITS = True  # True면 고정 대기 대신 DOM 조건을 기다림 (암묵적 대기 비활성화)
+WAIT_POLL_INTERVAL = 0.1  # 조건 확인 주기 (초)
+OPTIONAL_PROBE_TIMEOUT = 0.5  # 선택 항목(없을 수 있는 필드) 확인 제한 시간 (초)
+NETWORK_IDLE_TIME = 0.5  # 요청이 이 시간 동안 없으면 네트워크 유휴로 판단 (초)
+EMPTY_DATE_SETTLE_TIME = 0.3  # 날짜 조회 요청이 모두 끝난 뒤 상호 없이 이 시간이 지나면 예약 없는 날짜로 판단 (초)
+EMPTY_DATE_FALLBACK_TIME = 5  # 요청 추적이 안 되는 페이지에서 상호 없이 네트워크가 이 시간 동안 조용하면 예약 없는 날짜로 판단 (초)
+EMPTY_DATE_MARKERS = ('예약이 없습니다', 'No reservations', 'No data')  # 예약 없음 안내 문구
+
+# 팀 요소가 화면 갱신으로 무효화(stale)되었을 때 다시 찾는 횟수
+STALE_ELEMENT_RETRIES = 3
+
+# 날짜 선택기 설정
+PICKER_YEAR_JUMP_THRESHOLD = 12  # 이동할 개월 수가 이 값 이상이면 연도 보기로 바로 이동
+
+# 로그인 세션 캐시 설정
+SESSION_CACHE_ENABLED = True  # 로그인 세션 재사용 여부
+SESSION_FILE = os.path.join(".session", "ktour_session.json")  # 세션 저장 파일
+SESSION_MAX_AGE = 12 * 60 * 60  # 세션 최대 보관 시간 (초)
+
 # 구글 시트 설정
 GOOGLE_SHEETS_ENABLED = False  # 구글 시트 사용 여부
 GOOGLE_SHEETS_CREDENTIALS = "credentials.json"  # 서비스 계정 인증 파일
@@ -2,36 +2,99 @@
 KTour 예약 현황 크롤러
 """
 
-import time
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, WebDriverException, StaleElementReferenceException,
+    SessionNotCreatedException
+)
 
 import config
-from utils import retry, PasswordFilter
+from utils import retry, PasswordFilter, clean_field_value, generate_dates, split_stores, join_stores, ALL_STORES
+from session_store import SessionStore
+from waits import (
+    WaitEngine, wait_or_sleep, no_implicit_wait, install_request_tracker, TEAM_ITEM_SELECTOR, store_xpath
+)
+from network_capture import NetworkCapture, enable_performance_logging
+from browser_profile import apply_profile_options, block_resources, TrafficStats
+from driver_resolver import resolve_chromedriver
+from metrics import timed, timer, date_scope
+
+
+# 날짜 선택기 헤더의 월 이름
+MONTH_NAMES = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+
+# 예약 상세 필드별 셀렉터 (필드 순서 = 출력 컬럼 순서)
+RESERVATION_FIELD_SELECTORS = {
+    'team': 'span.MuiChip-label.MuiChip-labelSmall.css-19imqg1',
+    'customer_name': 'h6.MuiTypography-root.MuiTypography-subtitle1.css-qdk4z1',
+    'reservation_number': 'h6.MuiTypography-root.MuiTypography-subtitle2.css-1r042ka',
+    'channel': 'div.MuiAvatar-root.MuiAvatar-circular.MuiAvatar-colorDefault.MuiChip-avatar.MuiChip-avatarSmall.MuiChip-avatarColorPrimary.css-1buxfho',
+    'people_count': 'p.MuiTypography-root.MuiTypography-subtitle2.css-mdkayp',
+    'country': 'span.MuiTypography-root.MuiTypography-subtitle2.css-xcju41',
+    'product': 'p.MuiTypography-root.MuiTypography-subtitle2.css-1q5lgor',
+    'time_request': 'p.MuiTypography-root.MuiTypography-subtitle2.css-17exa0r',
+}
+
+# 모든 필드를 한 번에 읽는 스크립트 (없는 필드는 null)
+BULK_EXTRACT_SCRIPT = """
+const selectors = arguments[0];
+const result = {};
+for (const [field, selector] of Object.entries(selectors)) {
+    const element = document.querySelector(selector);
+    result[field] = element ? element.innerText.trim() : null;
+}
+return result;
+"""
 
 
 class KTourCrawler:
     """KTour 예약 현황 크롤러 클래스"""
 
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, use_session_cache=None, capture_network=None, profile=None,
+                 sink=None, buffer_results=True, traffic_stats=None):
         """
         크롤러 초기화
 
         Args:
             headless (bool): 헤드리스 모드 사용 여부
+            use_session_cache (bool): 로그인 세션 캐시 사용 여부 (없으면 config 값)
+            capture_network (bool): 네트워크 응답(JSON)에서 예약 정보 추출 여부 (없으면 config 값)
+            profile (str): 브라우저 프로필 full, lean (없으면 config.BROWSER_PROFILE)
+            sink (ReservationSink): 예약 정보를 추출할 때마다 전달할 저장소 (sinks.py 참고)
+            buffer_results (bool): 전체 예약 정보를 메모리에 보관할지 여부 (get_reservations 용)
+            traffic_stats (bool): 브라우저 요청 수/전송량 기록 여부 (없으면 config.BROWSER_TRAFFIC_STATS)
         """
         self.driver = None
         self.wait = None
+        self.waits = None
         self.headless = headless
         self.reservations = []
+        self.date_reservations = []  # 현재 날짜에서 수집한 예약 정보
+        self.failed_dates = []
+        self.empty_dates = []  # 예약이 없는 날짜 (실패와 구분)
+        self.sink = sink
+        self.buffer_results = buffer_results
+
+        if use_session_cache is None:
+            use_session_cache = config.SESSION_CACHE_ENABLED
+        self.session_store = SessionStore() if use_session_cache else None
+
+        self.capture_network = config.NETWORK_CAPTURE_ENABLED if capture_network is None else capture_network
+        self.network = None
+
+        self.profile = profile or config.BROWSER_PROFILE
+        self.traffic_stats = config.BROWSER_TRAFFIC_STATS if traffic_stats is None else traffic_stats
+        self.traffic = None
 
         # 로깅 설정
         logging.basicConfig(
@@ -49,6 +112,7 @@ class KTourCrawler:
         for handler in logging.root.handlers:
             handler.addFilter(password_filter)
 
+    @timed()
     def setup_driver(self):
         """Selenium WebDriver 설정"""
         try:
@@ -64,34 +128,72 @@ class KTourCrawler:
             chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
             chrome_options.add_experimental_option('useAutomationExtension', False)
 
+            # 브라우저 프로필 (lean: 리소스 차단용 옵션과 고정 창 크기)
+            apply_profile_options(chrome_options, self.profile)
+
+            # 네트워크 캡처 모드/트래픽 통계: CDP 성능 로그 수집
+            if self.capture_network or self.traffic_stats:
+                enable_performance_logging(chrome_options)
+
             # User-Agent 설정
             chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
 
-            # WebDriver 초기화
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-
-            # 대기 시간 설정
-            self.driver.implicitly_wait(config.IMPLICIT_WAIT)
+            # WebDriver 초기화 (Chrome 버전별로 기록된 드라이버 재사용)
+            try:
+                service = Service(resolve_chromedriver())
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            except SessionNotCreatedException:
+                if config.CHROMEDRIVER_PATH:
+                    raise
+                # 기록된 드라이버가 Chrome 버전과 맞지 않으면 다시 받아서 한 번 더 시도
+                self.logger.warning("ChromeDriver 버전 불일치, 드라이버를 다시 받습니다")
+                service = Service(resolve_chromedriver(refresh=True))
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+
+            # 대기 시간 설정 (조건 기반 대기 사용 시 암묵적 대기는 끄고 필요한 곳에서만 대기)
+            self.driver.implicitly_wait(0 if config.CONDITION_WAITS else config.IMPLICIT_WAIT)
             self.driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
             self.wait = WebDriverWait(self.driver, config.EXPLICIT_WAIT)
+            self.waits = WaitEngine(self.driver) if config.CONDITION_WAITS else None
 
-            # 창 크기 최대화
-            self.driver.maximize_window()
+            # 진행 중인 fetch/XHR 수 추적 (요청이 끝나기 전에 빈 날짜로 판단하지 않기 위함)
+            install_request_tracker(self.driver)
 
-            self.logger.info("WebDriver 설정 완료")
+            if self.profile == 'lean':
+                block_resources(self.driver)
+
+            if self.traffic_stats:
+                self.traffic = TrafficStats(self.driver, self.profile)
+
+            if self.capture_network:
+                # 성능 로그는 한 번 읽으면 사라지므로 트래픽 통계에도 함께 전달
+                self.network = NetworkCapture(
+                    self.driver,
+                    log_listener=self.traffic.observe if self.traffic else None
+                )
+                self.network.start()
+
+            # 창 크기 최대화 (lean 프로필은 고정 크기 유지)
+            if self.profile != 'lean':
+                self.driver.maximize_window()
+
+            self.logger.info(f"WebDriver 설정 완료 (프로필: {self.profile})")
 
         except Exception as e:
             self.logger.error(f"WebDriver 설정 실패: {e}")
             raise
 
     @retry(max_attempts=3, delay=2, exceptions=(TimeoutException, NoSuchElementException))
+    @timed()
     def login(self):
-        """사이트 로그인"""
+        """사이트 로그인 (저장된 세션이 유효하면 로그인 폼 생략)"""
+        if self.session_store and self._restore_session():
+            return
+
         try:
             self.logger.info(f"로그인 시도: {config.BASE_URL}")
             self.driver.get(config.BASE_URL)
-            time.sleep(config.MEDIUM_DELAY)
+            wait_or_sleep(self.waits, 'login_page', config.MEDIUM_DELAY)
 
             # 로그인 페이지인지 확인 및 로그인 수행
             # 실제 로그인 필드의 셀렉터를 찾아야 합니다
@@ -103,27 +205,66 @@ class KTourCrawler:
             )
             email_input.clear()
             email_input.send_keys(config.LOGIN_ID)
-            time.sleep(config.SHORT_DELAY)
+            wait_or_sleep(self.waits, 'login_input', config.SHORT_DELAY)
 
             # 비밀번호 입력 필드 찾기 (실제 셀렉터로 수정 필요)
             password_input = self.driver.find_element(By.CSS_SELECTOR, 'input[type="password"]')
             password_input.clear()
             password_input.send_keys(config.LOGIN_PASSWORD)
-            time.sleep(config.SHORT_DELAY)
+            wait_or_sleep(self.waits, 'login_input', config.SHORT_DELAY)
 
             # 로그인 버튼 클릭 (실제 셀렉터로 수정 필요)
             login_button = self.driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
             login_button.click()
 
-            time.sleep(config.LONG_DELAY)
+            wait_or_sleep(self.waits, 'login_submit', config.LONG_DELAY, WaitEngine.page_ready())
 
             self.logger.info("로그인 완료")
 
+            if self.session_store:
+                self.session_store.save(self.driver)
+
         except Exception as e:
             self.logger.error(f"로그인 실패: {e}")
             raise
 
+    def _restore_session(self):
+        """
+        저장된 로그인 세션 복원 및 검증
+
+        Returns:
+            bool: 복원된 세션이 유효하면 True
+        """
+        if not self.session_store.restore(self.driver):
+            return False
+
+        if self.is_logged_in():
+            self.logger.info("저장된 세션으로 로그인 완료 (로그인 폼 생략)")
+            return True
+
+        self.logger.info("저장된 세션이 만료되어 로그인 폼으로 진행")
+        self.session_store.clear()
+        return False
+
+    def is_logged_in(self):
+        """
+        로그인 상태 확인 (날짜 표시 요소와 비밀번호 입력 필드 중 먼저 나타나는 것으로 판단)
+
+        Returns:
+            bool: 로그인 상태 여부
+        """
+        try:
+            element = self.wait.until(EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'p.MuiTypography-root.MuiTypography-body1.css-1a5pbt3')),
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="password"]'))
+            ))
+            return element.get_attribute('type') != 'password'
+
+        except TimeoutException:
+            return False
+
     @retry(max_attempts=3, delay=1, exceptions=(TimeoutException, NoSuchElementException))
+    @timed()
     def click_date_picker(self):
         """날짜 선택기 클릭"""
         try:
@@ -132,7 +273,7 @@ class KTourCrawler:
                 EC.element_to_be_clickable((By.CSS_SELECTOR, 'p.MuiTypography-root.MuiTypography-body1.css-1a5pbt3'))
             )
             date_element.click()
-            time.sleep(config.SHORT_DELAY)
+            wait_or_sleep(self.waits, 'picker_open', config.SHORT_DELAY, WaitEngine.picker_open())
 
             self.logger.info("날짜 선택기 열기 완료")
 
@@ -140,55 +281,46 @@ class KTourCrawler:
             self.logger.error(f"날짜 선택기 클릭 실패: {e}")
             raise
 
+    @timed()
     def select_month(self, year, month):
         """
-        년월 선택
+        년월 선택 (월 차이를 한 번 계산하여 바로 이동하고 마지막에 한 번 확인)
 
         Args:
             year (int): 연도
             month (int): 월 (1-12)
         """
         try:
-            month_names = [
-                "January", "February", "March", "April", "May", "June",
-                "July", "August", "September", "October", "November", "December"
-            ]
-            target_month = f"{month_names[month-1]} {year}"
-
-            # 현재 표시된 년월 확인
-            current_month_element = self.driver.find_element(
-                By.CSS_SELECTOR,
-                'div.MuiPickersCalendarHeader-label.css-1v994a0'
-            )
-            current_month = current_month_element.text
-
-            # 목표 년월과 다르면 화살표 클릭
-            max_attempts = 24  # 최대 2년치
-            attempts = 0
-
-            while current_month != target_month and attempts < max_attempts:
-                if self._should_click_next(current_month, target_month):
-                    # 다음 달 화살표 클릭
-                    next_button = self.driver.find_element(
-                        By.CSS_SELECTOR,
-                        'button[aria-label="Next month"]'
-                    )
-                    next_button.click()
-                else:
-                    # 이전 달 화살표 클릭
-                    prev_button = self.driver.find_element(
+            target_month = f"{MONTH_NAMES[month-1]} {year}"
+
+            # 현재 표시된 년월 확인 (이미 대상 년월이면 이동 없음)
+            current_month = self._read_picker_month()
+            delta = self._month_delta(current_month, target_month)
+
+            # 연도 차이가 크면 연도 보기에서 먼저 연도를 선택
+            if abs(delta) >= config.PICKER_YEAR_JUMP_THRESHOLD and self._jump_to_year(year):
+                current_month = self._read_picker_month()
+                delta = self._month_delta(current_month, target_month)
+
+            if delta != 0:
+                # 화살표를 필요한 횟수만큼 연속 클릭 (클릭마다 헤더를 다시 읽지 않음)
+                button_label = "Next month" if delta > 0 else "Previous month"
+                for _ in range(abs(delta)):
+                    self.driver.find_element(
                         By.CSS_SELECTOR,
-                        'button[aria-label="Previous month"]'
-                    )
-                    prev_button.click()
+                        f'button[aria-label="{button_label}"]'
+                    ).click()
 
-                time.sleep(0.5)
-                current_month_element = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'div.MuiPickersCalendarHeader-label.css-1v994a0'
+                # 마지막에 한 번만 확인
+                wait_or_sleep(
+                    self.waits, 'month_change', 0.5,
+                    WaitEngine.picker_month_is(target_month), soft=True
                 )
-                current_month = current_month_element.text
-                attempts += 1
+                current_month = self._read_picker_month()
+
+                if current_month != target_month:
+                    self.logger.warning(f"년월 이동 확인 실패 ({current_month}), 한 달씩 이동으로 재시도")
+                    self._step_to_month(current_month, target_month)
 
             self.logger.info(f"년월 선택 완료: {target_month}")
 
@@ -196,29 +328,97 @@ class KTourCrawler:
             self.logger.error(f"년월 선택 실패: {e}")
             raise
 
-    def _should_click_next(self, current, target):
-        """다음 달 화살표를 클릭해야 하는지 판단"""
-        months = [
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ]
+    def _read_picker_month(self):
+        """날짜 선택기에 현재 표시된 년월 (예: "December 2025")"""
+        return self.driver.find_element(
+            By.CSS_SELECTOR,
+            'div.MuiPickersCalendarHeader-label.css-1v994a0'
+        ).text
 
-        current_parts = current.split()
-        target_parts = target.split()
+    def _step_to_month(self, current_month, target_month):
+        """
+        화살표를 한 번씩 클릭하며 목표 년월로 이동 (매 클릭 후 헤더 확인)
 
-        current_year = int(current_parts[1])
-        target_year = int(target_parts[1])
+        Args:
+            current_month (str): 현재 년월
+            target_month (str): 목표 년월
+        """
+        max_attempts = 24  # 최대 2년치
+        attempts = 0
 
-        current_month_idx = months.index(current_parts[0])
-        target_month_idx = months.index(target_parts[0])
+        while current_month != target_month and attempts < max_attempts:
+            button_label = "Next month" if self._should_click_next(current_month, target_month) else "Previous month"
+            self.driver.find_element(
+                By.CSS_SELECTOR,
+                f'button[aria-label="{button_label}"]'
+            ).click()
+
+            changed_label = wait_or_sleep(
+                self.waits, 'month_change', 0.5,
+                WaitEngine.picker_month_changed(current_month), soft=True
+            )
+            current_month = changed_label or self._read_picker_month()
+            attempts += 1
+
+    def _jump_to_year(self, year):
+        """
+        년월 헤더를 클릭해 연도 보기로 전환한 뒤 목표 연도 선택
+
+        Args:
+            year (int): 목표 연도
 
-        if target_year > current_year:
+        Returns:
+            bool: 연도 선택 성공 여부
+        """
+        header_selector = 'div.MuiPickersCalendarHeader-label.css-1v994a0'
+        year_xpath = (
+            f'//button[(contains(@class, "MuiPickersYear-yearButton") or '
+            f'contains(@class, "PrivatePickersYear-yearButton")) and normalize-space()="{year}"]'
+        )
+
+        try:
+            self.driver.find_element(By.CSS_SELECTOR, header_selector).click()
+            year_button = WebDriverWait(self.driver, config.SHORT_DELAY).until(
+                EC.element_to_be_clickable((By.XPATH, year_xpath))
+            )
+            year_button.click()
+            wait_or_sleep(self.waits, 'picker_open', config.SHORT_DELAY, WaitEngine.picker_open(), soft=True)
+            self.logger.info(f"연도 보기에서 {year}년 선택")
             return True
-        elif target_year < current_year:
+
+        except Exception as e:
+            self.logger.warning(f"연도 보기 이동 실패, 화살표로 이동: {e}")
+            # 연도 보기가 열린 상태라면 다시 일 보기로 전환
+            if not self.driver.find_elements(By.CSS_SELECTOR, 'button[aria-label="Next month"]'):
+                headers = self.driver.find_elements(By.CSS_SELECTOR, header_selector)
+                if headers:
+                    headers[0].click()
             return False
-        else:
-            return target_month_idx > current_month_idx
 
+    def _month_delta(self, current, target):
+        """
+        현재 년월에서 목표 년월까지의 개월 수 (양수면 다음 달 방향)
+
+        Args:
+            current (str): 현재 년월 (예: "December 2025")
+            target (str): 목표 년월
+
+        Returns:
+            int: 개월 차이
+        """
+        current_name, current_year = current.split()
+        target_name, target_year = target.split()
+
+        current_index = int(current_year) * 12 + MONTH_NAMES.index(current_name)
+        target_index = int(target_year) * 12 + MONTH_NAMES.index(target_name)
+
+        return target_index - current_index
+
+    def _should_click_next(self, current, target):
+        """다음 달 화살표를 클릭해야 하는지 판단"""
+        return self._month_delta(current, target) > 0
+
+    @timed()
     def select_day(self, day):
         """
         특정 날짜 선택
@@ -236,7 +436,10 @@ class KTourCrawler:
             for button in day_buttons:
                 if button.text == str(day) and 'MuiPickersDay-hiddenDaySpacingFiller' not in button.get_attribute('class'):
                     button.click()
-                    time.sleep(config.SHORT_DELAY)
+                    wait_or_sleep(
+                        self.waits, 'day_selected', config.SHORT_DELAY,
+                        WaitEngine.element_has_class(button, 'Mui-selected'), soft=True
+                    )
                     self.logger.info(f"날짜 선택 완료: {day}일")
                     return
 
@@ -246,6 +449,7 @@ class KTourCrawler:
             self.logger.error(f"날짜 선택 실패: {e}")
             raise
 
+    @timed()
     def click_ok_button(self):
         """OK 버튼 클릭"""
         try:
@@ -253,7 +457,8 @@ class KTourCrawler:
                 EC.element_to_be_clickable((By.XPATH, '//button[text()="OK"]'))
             )
             ok_button.click()
-            time.sleep(config.MEDIUM_DELAY)
+            wait_or_sleep(self.waits, 'picker_closed', config.MEDIUM_DELAY, WaitEngine.picker_closed(), soft=True)
+            wait_or_sleep(self.waits, 'date_loaded', 0, WaitEngine.network_idle(), soft=True)
 
             self.logger.info("OK 버튼 클릭 완료")
 
@@ -261,44 +466,102 @@ class KTourCrawler:
             self.logger.error(f"OK 버튼 클릭 실패: {e}")
             raise
 
-    def click_store(self, store_name="마리엠헤어"):
+    @timed()
+    def click_store(self, store_name=None):
         """
         상호 클릭
 
         Args:
-            store_name (str): 클릭할 상호명
+            store_name (str): 클릭할 상호명 (없으면 config.DEFAULT_STORE_NAME)
 
         Raises:
             TimeoutException: 상호 요소를 찾지 못한 경우 (예약 없음)
             NoSuchElementException: 상호 요소가 없는 경우 (예약 없음)
         """
+        store_name = store_name or config.DEFAULT_STORE_NAME
         store_element = self.wait.until(
             EC.element_to_be_clickable((By.XPATH, f'//h6[text()="{store_name}"]'))
         )
         store_element.click()
-        time.sleep(config.MEDIUM_DELAY)
+        wait_or_sleep(self.waits, 'store_loaded', config.MEDIUM_DELAY, WaitEngine.network_idle(), soft=True)
 
         self.logger.info(f"상호 클릭 완료: {store_name}")
 
-    def get_team_list(self):
-        """팀 목록 가져오기"""
-        try:
-            # 팀 정보가 있는 요소들 찾기
-            team_elements = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                'div.MuiBox-root.css-k008qs'
-            )
+    @timed()
+    def list_stores(self, stores=None):
+        """
+        선택한 날짜 화면에 표시된 상호명 목록 (지정한 상호명과 글자가 같은 h6만 상호로 인식)
+        예약 없는 날짜는 상호 대기 시간(EXPLICIT_WAIT)을 다 쓰지 않고, 안내 문구가 보이거나
+        날짜 조회 요청이 모두 끝난 뒤(EMPTY_DATE_SETTLE_TIME) 상호가 없으면 바로 빈 목록으로 판단
+
+        Args:
+            stores (list): 찾을 상호명 (없으면 config.STORE_NAMES)
+
+        Returns:
+            list: 화면 순서대로 상호명 (상호가 없으면 빈 리스트)
 
-            teams = []
-            for element in team_elements:
+        Raises:
+            TimeoutException: 제한 시간 안에 조회 결과가 확정되지 않은 경우 (빈 날짜로 처리하지 않음)
+        """
+        stores = stores or config.STORE_NAMES
+        if self.waits:
+            self.waits.until('date_result', WaitEngine.date_result_settled(stores=stores))
+        else:
+            WebDriverWait(self.driver, config.EXPLICIT_WAIT).until(WaitEngine.date_result_settled(stores=stores))
+
+        with no_implicit_wait(self.driver):
+            names = []
+            for element in self.driver.find_elements(By.XPATH, store_xpath(stores)):
                 try:
-                    team_chips = element.find_elements(By.CSS_SELECTOR, 'div.MuiChip-root')
-                    if team_chips:
-                        team_name = team_chips[0].text
-                        teams.append({'name': team_name, 'element': element})
-                except:
+                    names.append(element.text.strip())
+                except StaleElementReferenceException:
                     continue
 
+        stores = [name for name in dict.fromkeys(names) if name]
+        self.logger.info(f"상호 {len(stores)}개: {', '.join(stores)}")
+        return stores
+
+    def _store_visible(self, store_name):
+        """상호 목록에 해당 상호가 표시되어 있는지 대기 없이 확인"""
+        with no_implicit_wait(self.driver):
+            elements = self.driver.find_elements(By.XPATH, f'//h6[text()="{store_name}"]')
+            return any(element.is_displayed() for element in elements)
+
+    def _find_team_elements(self):
+        """
+        팀 칩이 있는 팀 요소들을 화면 순서대로 찾기
+
+        Returns:
+            list: [(WebElement, 팀명), ...]
+        """
+        team_elements = self.driver.find_elements(By.CSS_SELECTOR, TEAM_ITEM_SELECTOR)
+
+        found = []
+        for element in team_elements:
+            try:
+                team_chips = element.find_elements(By.CSS_SELECTOR, 'div.MuiChip-root')
+                if team_chips:
+                    found.append((element, team_chips[0].text))
+            except StaleElementReferenceException:
+                continue
+
+        return found
+
+    @timed()
+    def get_team_list(self):
+        """
+        팀 목록 가져오기
+
+        Returns:
+            list: [{'name': 팀명, 'index': 화면 순서, 'element': WebElement}, ...]
+                  element는 화면이 갱신되면 무효화될 수 있으므로 open_team()이 index/이름으로 다시 찾음
+        """
+        try:
+            teams = [
+                {'name': name, 'index': index, 'element': element}
+                for index, (element, name) in enumerate(self._find_team_elements())
+            ]
+
             self.logger.info(f"팀 목록 가져오기 완료: {len(teams)}개")
             return teams
 
@@ -306,127 +569,156 @@ class KTourCrawler:
             self.logger.error(f"팀 목록 가져오기 실패: {e}")
             return []
 
+    def _resolve_team(self, team_info):
+        """
+        팀 요소를 현재 화면에서 다시 찾기 (같은 순서에 같은 이름이 있으면 우선, 없으면 이름으로 검색)
+
+        Args:
+            team_info (dict): get_team_list()의 팀 정보
+
+        Returns:
+            WebElement: 팀 요소
+
+        Raises:
+            NoSuchElementException: 팀을 찾을 수 없는 경우
+        """
+        found = self._find_team_elements()
+        index = team_info['index']
+
+        if index < len(found) and found[index][1] == team_info['name']:
+            return found[index][0]
+
+        for element, name in found:
+            if name == team_info['name']:
+                return element
+
+        raise NoSuchElementException(f"팀을 찾을 수 없습니다: {team_info['name']}")
+
+    def open_team(self, team_info):
+        """
+        팀 상세 열기 (요소가 무효화되었으면 다시 찾아서 재시도)
+
+        Args:
+            team_info (dict): get_team_list()의 팀 정보
+        """
+        for attempt in range(1, config.STALE_ELEMENT_RETRIES + 1):
+            try:
+                element = team_info.get('element') or self._resolve_team(team_info)
+                self.click_team(element)
+                return
+
+            except StaleElementReferenceException:
+                team_info['element'] = None
+                if attempt == config.STALE_ELEMENT_RETRIES:
+                    raise
+                self.logger.info(f"팀 요소 갱신 후 재시도: {team_info['name']} ({attempt}/{config.STALE_ELEMENT_RETRIES})")
+
+    def _team_list_visible(self):
+        """팀 목록이 현재 화면에 있는지 확인 (대기 없이)"""
+        with no_implicit_wait(self.driver):
+            return bool(self.driver.find_elements(By.CSS_SELECTOR, TEAM_ITEM_SELECTOR))
+
+    @timed()
     def click_team(self, team_element):
         """팀 클릭"""
         try:
+            previous_detail = WaitEngine.detail_signature(self.driver) if self.waits else None
             team_element.click()
-            time.sleep(config.MEDIUM_DELAY)
+            wait_or_sleep(
+                self.waits, 'detail_changed', config.MEDIUM_DELAY,
+                WaitEngine.detail_changed(previous_detail), soft=True
+            )
             self.logger.info("팀 클릭 완료")
 
         except Exception as e:
             self.logger.error(f"팀 클릭 실패: {e}")
             raise
 
-    def extract_reservation_details(self, target_date):
+    def _find_optional(self, selector):
         """
-        예약 상세 정보 추출
+        없을 수 있는 필드 요소 찾기 (조건 대기 사용 시 짧은 확인 후 실패)
+
+        Args:
+            selector (str): CSS 셀렉터
+
+        Returns:
+            WebElement: 찾은 요소
+
+        Raises:
+            NoSuchElementException: 요소가 없는 경우
+        """
+        if not self.waits:
+            return self.driver.find_element(By.CSS_SELECTOR, selector)
+
+        element = self.waits.probe(By.CSS_SELECTOR, selector)
+        if element is None:
+            raise NoSuchElementException(f"요소 없음: {selector}")
+        return element
+
+    def extract_reservation_record(self, target_date, store_name=None):
+        """
+        예약 상세 정보를 한 번의 execute_script 호출로 추출
 
         Args:
             target_date (str): 예약 날짜 (YYYY-MM-DD)
+            store_name (str): 상호명 (예약 정보의 store 필드)
 
         Returns:
-            dict: 예약 정보
+            dict: 예약 정보 (페이지에 없는 필드는 None으로 표시)
         """
-        try:
-            reservation = {
-                'date': target_date,
-                'team': '',
-                'customer_name': '',
-                'reservation_number': '',
-                'channel': '',
-                'people_count': '',
-                'country': '',
-                'product': '',
-                'time_request': ''
-            }
-
-            # 팀 정보
-            try:
-                team_label = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'span.MuiChip-label.MuiChip-labelSmall.css-19imqg1'
-                )
-                reservation['team'] = team_label.text
-            except:
-                pass
+        raw = self.driver.execute_script(BULK_EXTRACT_SCRIPT, RESERVATION_FIELD_SELECTORS) or {}
 
-            # 고객명
-            try:
-                customer_name = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'h6.MuiTypography-root.MuiTypography-subtitle1.css-qdk4z1'
-                )
-                reservation['customer_name'] = customer_name.text
-            except:
-                pass
+        record = {'date': target_date, 'store': store_name or ''}
+        for field in RESERVATION_FIELD_SELECTORS:
+            text = raw.get(field)
+            record[field] = None if text is None else clean_field_value(field, text)
 
-            # 예약번호
-            try:
-                reservation_number = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'h6.MuiTypography-root.MuiTypography-subtitle2.css-1r042ka'
-                )
-                reservation['reservation_number'] = reservation_number.text
-            except:
-                pass
+        return record
 
-            # 채널약자
-            try:
-                channel = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'div.MuiAvatar-root.MuiAvatar-circular.MuiAvatar-colorDefault.MuiChip-avatar.MuiChip-avatarSmall.MuiChip-avatarColorPrimary.css-1buxfho'
-                )
-                reservation['channel'] = channel.text
-            except:
-                pass
+    def _extract_reservation_record_by_field(self, target_date, store_name=None):
+        """
+        예약 상세 정보를 필드별 find_element 호출로 추출 (일괄 추출 실패 시 사용)
 
-            # 인원구분 및 수
-            try:
-                people_count = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'p.MuiTypography-root.MuiTypography-subtitle2.css-mdkayp'
-                )
-                reservation['people_count'] = people_count.text.strip()
-            except:
-                pass
+        Args:
+            target_date (str): 예약 날짜 (YYYY-MM-DD)
+            store_name (str): 상호명 (예약 정보의 store 필드)
 
-            # 국가
+        Returns:
+            dict: 예약 정보 (페이지에 없는 필드는 None으로 표시)
+        """
+        record = {'date': target_date, 'store': store_name or ''}
+        for field, selector in RESERVATION_FIELD_SELECTORS.items():
             try:
-                country = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'span.MuiTypography-root.MuiTypography-subtitle2.css-xcju41'
-                )
-                reservation['country'] = country.text
-            except:
-                pass
+                record[field] = clean_field_value(field, self._find_optional(selector).text)
+            except Exception:
+                record[field] = None
 
-            # 예약상품
-            try:
-                product = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'p.MuiTypography-root.MuiTypography-subtitle2.css-1q5lgor'
-                )
-                product_text = product.text
-                # "AB: " 제거 (대소문자 구분 없이)
-                if ':' in product_text:
-                    product_text = product_text.split(':', 1)[1].strip()
-                reservation['product'] = product_text
-            except:
-                pass
-
-            # 예약시간
+        return record
+
+    @timed()
+    def extract_reservation_details(self, target_date, store_name=None):
+        """
+        예약 상세 정보 추출
+
+        Args:
+            target_date (str): 예약 날짜 (YYYY-MM-DD)
+            store_name (str): 상호명 (예약 정보의 store 필드)
+
+        Returns:
+            dict: 예약 정보 (없는 필드는 빈 문자열)
+        """
+        try:
             try:
-                time_request = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'p.MuiTypography-root.MuiTypography-subtitle2.css-17exa0r'
-                )
-                time_text = time_request.text
-                # "Time Request: " 제거
-                if ':' in time_text:
-                    time_text = time_text.split(':', 1)[1].strip()
-                reservation['time_request'] = time_text
-            except:
-                pass
+                record = self.extract_reservation_record(target_date, store_name)
+            except WebDriverException as e:
+                self.logger.warning(f"일괄 추출 실패, 필드별 추출로 진행: {e}")
+                record = self._extract_reservation_record_by_field(target_date, store_name)
+
+            absent = [field for field, value in record.items() if value is None]
+            if absent:
+                self.logger.debug(f"없는 필드: {', '.join(absent)}")
+
+            reservation = {field: '' if value is None else value for field, value in record.items()}
 
             self.logger.info(f"예약 정보 추출 완료: {reservation['reservation_number']}")
             return reservation
@@ -435,65 +727,200 @@ class KTourCrawler:
             self.logger.error(f"예약 정보 추출 실패: {e}")
             return None
 
-    def crawl_date(self, target_date):
+    def crawl_date(self, target_date, store_name=None):
         """
         특정 날짜의 예약 정보 크롤링
 
         Args:
             target_date (str): 크롤링할 날짜 (YYYY-MM-DD)
+            store_name (str): 상호명, 쉼표로 구분한 여러 상호명 또는 ALL_STORES (없으면 config.DEFAULT_STORE_NAME)
+
+        Returns:
+            bool: 성공 여부 (예약이 없는 날짜도 성공이며 empty_dates에 기록, 실패한 날짜는 failed_dates에 기록)
         """
+        self.date_reservations = []
+
         try:
             self.logger.info(f"날짜 크롤링 시작: {target_date}")
+            # 단계별 소요 시간을 날짜 단위로 묶어서 기록
+            with date_scope(target_date), timer('crawl_date'):
+                success = self._crawl_date(target_date, store_name)
 
-            # 날짜 파싱
-            date_obj = datetime.strptime(target_date, '%Y-%m-%d')
-            year = date_obj.year
-            month = date_obj.month
-            day = date_obj.day
+        except Exception as e:
+            self.logger.error(f"날짜 크롤링 실패 ({target_date}): {e}")
+            self.failed_dates.append(target_date)
+            success = False
 
-            # 날짜 선택 프로세스
-            self.click_date_picker()
-            self.select_month(year, month)
-            self.select_day(day)
-            self.click_ok_button()
+        if success and not self.date_reservations:
+            self.empty_dates.append(target_date)
 
-            # 상호 클릭 시도
-            try:
-                self.click_store()
-            except (TimeoutException, NoSuchElementException) as e:
-                self.logger.info(f"날짜 {target_date}에 예약이 없습니다 (상호 없음)")
-                return  # 예약이 없는 경우 정상 종료
+        # 성능 로그가 쌓이지 않도록 날짜마다 트래픽 통계 반영
+        if self.traffic:
+            self.traffic.update()
 
-            # 팀 목록 가져오기
-            teams = self.get_team_list()
+        # 날짜가 끝날 때마다 저장소에 반영
+        if self.sink:
+            self.sink.flush()
 
-            # 팀이 없으면 예약 없음
-            if not teams:
-                self.logger.info(f"날짜 {target_date}에 예약이 없습니다 (팀 없음)")
-                return
+        return success
 
-            # 각 팀별로 예약 정보 수집
-            for team_info in teams:
-                try:
-                    self.click_team(team_info['element'])
+    def _crawl_date(self, target_date, store_name=None):
+        """
+        특정 날짜의 예약 정보 크롤링 (실패 시 예외 발생)
+        날짜를 한 번 선택한 뒤 지정한 상호들을 차례로 열어 팀별 예약 정보를 수집
 
-                    # 예약 상세 정보 추출
-                    reservation = self.extract_reservation_details(target_date)
-                    if reservation:
-                        self.reservations.append(reservation)
+        Args:
+            target_date (str): 크롤링할 날짜 (YYYY-MM-DD)
+            store_name (str): 상호명, 쉼표로 구분한 여러 상호명 또는 ALL_STORES (없으면 config.DEFAULT_STORE_NAME)
 
-                    # 뒤로 가기 (다음 팀을 위해)
-                    self.driver.back()
-                    time.sleep(config.SHORT_DELAY)
+        Returns:
+            bool: True
+        """
+        stores = split_stores(store_name)
 
-                except Exception as e:
-                    self.logger.error(f"팀 처리 중 오류: {e}")
-                    continue
+        # 이전 날짜의 네트워크 응답 비우기
+        if self.network:
+            self.network.clear()
+
+        self._select_date(target_date)
 
+        # 네트워크 캡처 모드: 날짜 조회 응답에서 바로 추출
+        if self.network and self._collect_network_reservations(target_date, join_stores(stores)):
             self.logger.info(f"날짜 크롤링 완료: {target_date}")
+            return True
+
+        # 화면에 표시된 상호 중 크롤링할 상호 (모든 상호이면 config.STORE_NAMES 중 표시된 상호)
+        targets = self.list_stores(None if stores == ALL_STORES else stores)
+
+        if not targets:
+            self.logger.info(f"날짜 {target_date}에 예약이 없습니다 (상호 없음)")
+            return True  # 예약이 없는 경우 정상 종료
+
+        for index, store in enumerate(targets):
+            # 이전 상호를 보는 동안 상호 목록이 사라졌으면 날짜를 다시 선택
+            if index > 0 and not self._store_visible(store):
+                self.return_to_main_page()
+                self._select_date(target_date)
+
+            self._crawl_store(target_date, store)
+
+        self.logger.info(f"날짜 크롤링 완료: {target_date}")
+        return True
+
+    def _select_date(self, target_date):
+        """
+        날짜 선택기로 날짜 선택
+
+        Args:
+            target_date (str): 선택할 날짜 (YYYY-MM-DD)
+        """
+        date_obj = datetime.strptime(target_date, '%Y-%m-%d')
+
+        self.click_date_picker()
+        self.select_month(date_obj.year, date_obj.month)
+        self.select_day(date_obj.day)
+        self.click_ok_button()
+
+    def _crawl_store(self, target_date, store_name):
+        """
+        선택한 날짜에서 상호 하나의 팀별 예약 정보 수집
 
+        Args:
+            target_date (str): 예약 날짜 (YYYY-MM-DD)
+            store_name (str): 상호명
+        """
+        self.click_store(store_name)
+
+        # 네트워크 캡처 모드: 상호 조회 응답에서 추출 (없으면 화면에서 팀별 추출)
+        if self.network and self._collect_network_reservations(target_date, store_name):
+            return
+
+        # 팀 목록 가져오기
+        teams = self.get_team_list()
+
+        # 팀이 없으면 예약 없음
+        if not teams:
+            self.logger.info(f"날짜 {target_date} {store_name}에 예약이 없습니다 (팀 없음)")
+            return
+
+        # 각 팀별로 예약 정보 수집
+        for team_info in teams:
+            try:
+                self.open_team(team_info)
+
+                # 예약 상세 정보 추출
+                reservation = self.extract_reservation_details(target_date, store_name)
+                if reservation:
+                    self._add_reservation(reservation)
+
+                # 상세가 같은 화면에 열리면 바로 다음 팀으로 진행
+                # 상세 화면이 목록을 대체한 경우에만 뒤로 가기
+                if not self._team_list_visible():
+                    with timer('driver_back'):
+                        self.driver.back()
+                        wait_or_sleep(
+                            self.waits, 'team_list_rendered', config.SHORT_DELAY,
+                            WaitEngine.team_list_rendered(), soft=True
+                        )
+                    # 뒤로 가기 후에는 기존 요소가 무효화되므로 다시 찾도록 표시
+                    for team in teams:
+                        team['element'] = None
+
+            except Exception as e:
+                self.logger.error(f"팀 처리 중 오류: {e}")
+                continue
+
+    def _collect_network_reservations(self, target_date, store_name=None):
+        """
+        캡처된 네트워크 응답에서 예약 정보 추출
+
+        Args:
+            target_date (str): 예약 날짜 (YYYY-MM-DD)
+            store_name (str): 상호명, 쉼표로 구분한 여러 상호명 또는 ALL_STORES (없으면 config.DEFAULT_STORE_NAME)
+
+        Returns:
+            bool: 예약 정보를 찾았으면 True
+        """
+        try:
+            reservations = self.network.collect_reservations(target_date, store_name or config.DEFAULT_STORE_NAME)
         except Exception as e:
-            self.logger.error(f"날짜 크롤링 실패 ({target_date}): {e}")
+            self.logger.warning(f"네트워크 응답 추출 실패, 화면 추출로 진행: {e}")
+            return False
+
+        if not reservations:
+            return False
+
+        for reservation in reservations:
+            self._add_reservation(reservation)
+        self.logger.info(f"네트워크 응답에서 예약 정보 추출 완료: {target_date} ({len(reservations)}건)")
+        return True
+
+    def _add_reservation(self, reservation):
+        """추출한 예약 정보를 현재 날짜 결과, 저장소, (보관하는 경우) 전체 결과에 추가"""
+        self.date_reservations.append(reservation)
+        if self.buffer_results:
+            self.reservations.append(reservation)
+        if self.sink:
+            self.sink.write(reservation)
+
+    def crawl_dates(self, dates):
+        """
+        여러 날짜의 예약 정보를 순서대로 크롤링
+
+        Args:
+            dates (list): 크롤링할 날짜 리스트 (YYYY-MM-DD)
+        """
+        for idx, date_str in enumerate(dates):
+            # 첫 날짜가 아니면 메인 페이지로 이동하여 상태 초기화
+            if idx > 0:
+                try:
+                    self.return_to_main_page()
+                except Exception as e:
+                    self.logger.error(f"메인 페이지 이동 실패 ({date_str}): {e}")
+                    self.failed_dates.append(date_str)
+                    continue
+
+            self.crawl_date(date_str)
 
     def crawl_date_range(self, start_date, end_date):
         """
@@ -504,34 +931,62 @@ class KTourCrawler:
             end_date (str): 종료 날짜 (YYYY-MM-DD)
         """
         try:
-            start = datetime.strptime(start_date, '%Y-%m-%d')
-            end = datetime.strptime(end_date, '%Y-%m-%d')
-
-            current = start
-            while current <= end:
-                # 각 날짜마다 메인 페이지로 이동하여 상태 초기화
-                if current != start:  # 첫 날짜가 아니면 메인 페이지로 이동
-                    self.logger.info("다음 날짜를 위해 메인 페이지로 이동")
-                    self.driver.get(config.BASE_URL)
-                    time.sleep(config.MEDIUM_DELAY)
-
-                date_str = current.strftime('%Y-%m-%d')
-                self.crawl_date(date_str)
-                current += timedelta(days=1)
-
+            self.crawl_dates(generate_dates(start_date, end_date))
             self.logger.info(f"날짜 범위 크롤링 완료: {start_date} ~ {end_date}")
 
         except Exception as e:
             self.logger.error(f"날짜 범위 크롤링 실패: {e}")
 
+    @timed()
+    def return_to_main_page(self):
+        """다음 날짜를 위해 메인 페이지로 이동하여 상태 초기화"""
+        self.logger.info("다음 날짜를 위해 메인 페이지로 이동")
+        self.driver.get(config.BASE_URL)
+        wait_or_sleep(self.waits, 'page_ready', config.MEDIUM_DELAY, WaitEngine.page_ready(), soft=True)
+
     def close(self):
         """브라우저 종료"""
+        if self.waits:
+            for name, stats in self.waits.get_timing_summary().items():
+                self.logger.info(
+                    f"대기 시간 [{name}] {stats['count']}회, 평균 {stats['avg']}초, 최대 {stats['max']}초"
+                )
+
+        if self.traffic:
+            self._log_traffic_summary()
+
         if self.driver:
             self.driver.quit()
             self.logger.info("브라우저 종료")
 
+    def _log_traffic_summary(self):
+        """브라우저 트래픽 통계 로그 출력 및 프로필별 누적 통계 저장"""
+        try:
+            self.traffic.update()
+            stats = self.traffic.summary()
+            self.traffic.save()
+        except Exception as e:
+            self.logger.warning(f"트래픽 통계 저장 실패: {e}")
+            return
+
+        blocked = ', '.join(f"{kind} {count}" for kind, count in sorted(stats['blocked_by_type'].items()))
+        self.logger.info(
+            f"브라우저 트래픽 ({stats['profile']}): 페이지 {stats['pages']}회, 요청 {stats['requests']}건, "
+            f"{stats['bytes'] / 1024:.1f}KB, 차단 {stats['blocked_requests']}건" + (f" ({blocked})" if blocked else "")
+        )
+        if stats['estimated_saved_bytes'] is not None:
+            self.logger.info(f"full 프로필 대비 절약 추정: {stats['estimated_saved_bytes'] / 1024:.1f}KB")
+
+    def reset_results(self):
+        """수집 결과, 저장소 초기화 (브라우저 세션을 다른 작업에 재사용할 때)"""
+        self.reservations = []
+        self.date_reservations = []
+        self.failed_dates = []
+        self.empty_dates = []
+        self.sink = None
+
     def get_reservations(self):
-        """수집된 예약 정보 반환"""
+        """수집된 예약 정보 반환 (buffer_results=False이면 빈 리스트)"""
         return self.reservations
 
 
@@ -3,10 +3,36 @@
 """
 
 import os
+import csv
 import json
+import hashlib
+import shutil
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, date
+from urllib.parse import quote
 import logging
+from itertools import chain, islice
+
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+
+import config
+from utils import RESERVATION_FIELDS
+from reservation_store import ReservationStore
+from summary_aggregator import SummaryAggregator
+
+# Parquet 출력은 pyarrow가 설치된 경우에만 사용 (선택 패키지)
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Parquet 파티션 폴더에서 값이 없는 경우 (Hive 규칙)
+PARQUET_NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+# Parquet 파티션 폴더 이름에서 인코딩할 문자
+PARQUET_UNSAFE_CHARS = set('%/\\:*?"<>|=')
 
 
 class DataSaver:
@@ -65,19 +91,25 @@ class DataSaver:
             self.logger.error(f"CSV 저장 실패: {e}")
             return None
 
-    def save_to_excel(self, data, filename=None):
+    def save_to_excel(self, data, filename=None, split_by=None):
         """
         Excel 파일로 저장
+        write-only 모드로 행을 바로 파일에 기록하므로 통합 문서 전체를 메모리에 두지 않음
+        (열 너비는 앞쪽 일부 행만 보고 결정)
 
         Args:
-            data (list): 저장할 데이터 (딕셔너리 리스트)
+            data (iterable): 저장할 데이터 (딕셔너리 리스트 또는 이터레이터)
             filename (str): 파일명 (없으면 자동 생성)
+            split_by (str): 시트 나누기 기준 ('month': 월별, 'team': 팀별, 없으면 시트 1개)
 
         Returns:
             str: 저장된 파일 경로
         """
         try:
-            if not data:
+            rows = iter(data)
+            # 열 목록과 너비를 정할 표본 (표본 이후에 처음 나오는 필드는 저장하지 않음)
+            sample = list(islice(rows, config.EXCEL_WIDTH_SAMPLE_SIZE))
+            if not sample:
                 self.logger.warning("저장할 데이터가 없습니다")
                 return None
 
@@ -92,31 +124,53 @@ class DataSaver:
 
             filepath = os.path.join(self.output_dir, filename)
 
-            # DataFrame 생성 및 저장
-            df = pd.DataFrame(data)
-
-            # Excel 작성
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Reservations')
-
-                # 워크시트 가져오기
-                worksheet = writer.sheets['Reservations']
-
-                # 열 너비 자동 조정
-                for idx, col in enumerate(df.columns):
-                    max_length = max(
-                        df[col].astype(str).apply(len).max(),
-                        len(str(col))
-                    )
-                    worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
-
-            self.logger.info(f"Excel 저장 완료: {filepath} ({len(data)}건)")
+            columns = list(dict.fromkeys(key for row in sample for key in row))
+            widths = [
+                min(max([len(str(column))] + [len(str(row.get(column, ''))) for row in sample]) + 2,
+                    config.EXCEL_MAX_COLUMN_WIDTH)
+                for column in columns
+            ]
+
+            workbook = Workbook(write_only=True)
+            sheets = {}
+            count = 0
+
+            for row in chain(sample, rows):
+                sheet_name = self._excel_sheet_name(row, split_by)
+                worksheet = sheets.get(sheet_name)
+                if worksheet is None:
+                    # write-only 시트는 행을 쓰기 전에 열 너비를 지정해야 함
+                    worksheet = workbook.create_sheet(sheet_name)
+                    for idx, width in enumerate(widths, start=1):
+                        worksheet.column_dimensions[get_column_letter(idx)].width = width
+                    worksheet.append(columns)
+                    sheets[sheet_name] = worksheet
+
+                worksheet.append([row.get(column) for column in columns])
+                count += 1
+
+            workbook.save(filepath)
+
+            self.logger.info(f"Excel 저장 완료: {filepath} ({count}건, 시트 {len(sheets)}개)")
             return filepath
 
         except Exception as e:
             self.logger.error(f"Excel 저장 실패: {e}")
             return None
 
+    @staticmethod
+    def _excel_sheet_name(row, split_by):
+        """행이 들어갈 시트 이름 (Excel 시트 이름 규칙: 31자 이내, []:*?/\\ 사용 불가)"""
+        if split_by == 'month':
+            name = str(row.get('date') or '')[:7]
+        elif split_by == 'team':
+            name = str(row.get('team') or '')
+        else:
+            return 'Reservations'
+
+        name = ''.join('_' if char in '[]:*?/\\' else char for char in name)[:31]
+        return name or '미지정'
+
     def save_to_json(self, data, filename=None):
         """
         JSON 파일로 저장
@@ -155,13 +209,15 @@ class DataSaver:
             self.logger.error(f"JSON 저장 실패: {e}")
             return None
 
-    def append_to_csv(self, data, filename):
+    def append_to_csv(self, data, filename, dedup=False):
         """
         기존 CSV 파일에 데이터 추가
+        기존 파일은 헤더만 읽어 컬럼을 확인하고, 새 행만 추가 모드로 기록 (파일 전체를 다시 쓰지 않음)
 
         Args:
             data (list): 추가할 데이터 (딕셔너리 리스트)
             filename (str): 파일명
+            dedup (bool): 이미 기록된 예약번호는 추가하지 않음 (파일 옆 .index 파일에 예약번호 기록)
 
         Returns:
             str: 저장된 파일 경로
@@ -172,19 +228,44 @@ class DataSaver:
                 return None
 
             filepath = os.path.join(self.output_dir, filename)
+            header = self._read_csv_header(filepath)
+
+            # 새 데이터의 컬럼 (처음 나온 순서)
+            columns = list(dict.fromkeys(key for row in data for key in row))
 
-            # DataFrame 생성
-            df_new = pd.DataFrame(data)
+            if header and not set(columns) <= set(header):
+                # 기존 헤더에 없는 컬럼이 있으면 컬럼을 합쳐서 다시 작성
+                self.logger.warning(f"CSV 컬럼 불일치, 파일 전체를 다시 작성합니다: {filepath}")
+                return self._rewrite_csv(filepath, data, dedup)
 
-            # 기존 파일이 있으면 추가, 없으면 새로 생성
-            if os.path.exists(filepath):
-                df_existing = pd.read_csv(filepath, encoding='utf-8-sig')
-                df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-                df_combined.to_csv(filepath, index=False, encoding='utf-8-sig')
-                self.logger.info(f"CSV 추가 완료: {filepath} (+{len(data)}건)")
+            if dedup:
+                index, index_valid = self._load_csv_index(filepath, header)
+                rows = self._drop_indexed(data, index)
             else:
-                df_new.to_csv(filepath, index=False, encoding='utf-8-sig')
-                self.logger.info(f"CSV 생성 완료: {filepath} ({len(data)}건)")
+                rows = data
+
+            if header:
+                if rows:
+                    with open(filepath, 'a', encoding='utf-8', newline='') as f:
+                        if not self._ends_with_newline(filepath):
+                            f.write(os.linesep)
+                        writer = csv.DictWriter(f, fieldnames=header, restval='', lineterminator=os.linesep)
+                        writer.writerows(rows)
+                self.logger.info(f"CSV 추가 완료: {filepath} (+{len(rows)}건)")
+            else:
+                # 새 파일은 Excel 호환을 위해 BOM 포함
+                with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=columns, restval='', lineterminator=os.linesep)
+                    writer.writeheader()
+                    writer.writerows(rows)
+                self.logger.info(f"CSV 생성 완료: {filepath} ({len(rows)}건)")
+
+            if dedup:
+                if len(rows) < len(data):
+                    self.logger.info(f"중복 예약번호 {len(data) - len(rows)}건 제외")
+                # 인덱스가 유효했으면 새 예약번호만 추가, 아니면 전체 다시 작성
+                added = [row['reservation_number'] for row in rows if row.get('reservation_number')]
+                self._save_csv_index(filepath, index, added if index_valid else None)
 
             return filepath
 
@@ -192,6 +273,308 @@ class DataSaver:
             self.logger.error(f"CSV 추가 실패: {e}")
             return None
 
+    @staticmethod
+    def _read_csv_header(filepath):
+        """CSV 파일의 헤더만 읽기 (파일이 없거나 비어 있으면 None, utf-8-sig로 BOM 제거)"""
+        if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+            return None
+
+        with open(filepath, encoding='utf-8-sig', newline='') as f:
+            return next(csv.reader(f), None)
+
+    @staticmethod
+    def _ends_with_newline(filepath):
+        """파일이 줄바꿈으로 끝나는지 확인 (마지막 행 뒤에 바로 이어 쓰지 않기 위함)"""
+        with open(filepath, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) in (b'\n', b'\r')
+
+    @staticmethod
+    def _csv_index_path(filepath):
+        return filepath + '.index'
+
+    def _load_csv_index(self, filepath, header):
+        """
+        예약번호 인덱스 불러오기
+        인덱스에 마지막으로 기록된 CSV 크기가 실제 파일과 다르면(직접 수정 등) CSV를 한 번 읽어 다시 만듦
+
+        Returns:
+            tuple: (기록된 예약번호 set, 인덱스 파일이 유효했는지 여부)
+        """
+        index_path = self._csv_index_path(filepath)
+        size = os.path.getsize(filepath) if header else 0
+
+        if os.path.exists(index_path):
+            index = set()
+            recorded_size = None
+            with open(index_path, encoding='utf-8') as f:
+                for line in f:
+                    line = line.rstrip('\n')
+                    if line.startswith('#size='):
+                        recorded_size = line[len('#size='):]
+                    elif line:
+                        index.add(line)
+            if recorded_size == str(size):
+                return index, True
+
+        index = set()
+        if header and 'reservation_number' in header:
+            with open(filepath, encoding='utf-8-sig', newline='') as f:
+                for row in csv.DictReader(f):
+                    if row.get('reservation_number'):
+                        index.add(row['reservation_number'])
+            self.logger.info(f"예약번호 인덱스 생성: {index_path} ({len(index)}건)")
+
+        return index, False
+
+    def _save_csv_index(self, filepath, index, added=None):
+        """
+        예약번호 인덱스 저장 (한 줄에 예약번호 하나, 추가할 때마다 끝에 CSV 크기 기록)
+
+        Args:
+            filepath (str): CSV 파일 경로
+            index (set): 전체 예약번호
+            added (list): 이번에 추가된 예약번호 (없으면 인덱스 전체를 다시 작성)
+        """
+        index_path = self._csv_index_path(filepath)
+        size = os.path.getsize(filepath)
+
+        if added is not None and os.path.exists(index_path):
+            with open(index_path, 'a', encoding='utf-8') as f:
+                for number in added:
+                    f.write(f"{number}\n")
+                f.write(f"#size={size}\n")
+            return
+
+        with open(index_path + '.tmp', 'w', encoding='utf-8') as f:
+            for number in sorted(index):
+                f.write(f"{number}\n")
+            f.write(f"#size={size}\n")
+        os.replace(index_path + '.tmp', index_path)
+
+    @staticmethod
+    def _drop_indexed(data, index):
+        """인덱스에 있거나 같은 묶음 안에서 중복된 예약번호 행 제외 (예약번호가 없는 행은 유지)"""
+        rows = []
+        for row in data:
+            number = row.get('reservation_number')
+            if number:
+                if number in index:
+                    continue
+                index.add(number)
+            rows.append(row)
+        return rows
+
+    def _rewrite_csv(self, filepath, data, dedup=False):
+        """기존 CSV와 새 데이터를 합쳐 파일 전체를 다시 작성 (컬럼이 바뀐 경우)"""
+        df_existing = pd.read_csv(filepath, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+
+        if dedup:
+            index = set(df_existing['reservation_number']) - {''} if 'reservation_number' in df_existing else set()
+            data = self._drop_indexed(data, index)
+
+        df_combined = pd.concat([df_existing, pd.DataFrame(data)], ignore_index=True)
+        df_combined.to_csv(filepath, index=False, encoding='utf-8-sig')
+
+        if dedup:
+            self._save_csv_index(filepath, index)
+
+        self.logger.info(f"CSV 추가 완료: {filepath} (+{len(data)}건)")
+        return filepath
+
+    def save_to_parquet(self, data, dataset="reservations", dates=None):
+        """
+        날짜/상호별로 나눈 Parquet 데이터셋으로 저장
+        <dataset>/date=YYYY-MM-DD/store=<상호>/part-0.parquet 구조로, 이번 데이터에 있는 날짜는 날짜 단위로
+        교체하고(이번에 없는 상호 파티션은 삭제) 나머지 날짜는 그대로 둠 (내용이 같은 파티션은 다시 쓰지 않음)
+
+        Args:
+            data (list): 저장할 데이터 (딕셔너리 리스트)
+            dataset (str): 데이터셋 폴더명
+            dates (list): 예약이 없어도 교체할 날짜 (크롤링에 성공한 날짜, 예약이 모두 취소된 날짜의 파티션 삭제용)
+
+        Returns:
+            str: 데이터셋 폴더 경로
+        """
+        try:
+            if not data and not dates:
+                self.logger.warning("저장할 데이터가 없습니다")
+                return None
+
+            if pa is None:
+                self.logger.error("Parquet 저장 실패: pyarrow가 설치되어 있지 않습니다 (pip install pyarrow)")
+                return None
+
+            dataset_dir = os.path.join(self.output_dir, dataset)
+
+            # 날짜/상호별로 묶기 (날짜가 없는 행은 파티션을 정할 수 없어 제외)
+            partitions = {}
+            for row in data:
+                if not row.get('date'):
+                    continue
+                partitions.setdefault((row['date'], row.get('store')), []).append(row)
+
+            skipped = len(data) - sum(len(rows) for rows in partitions.values())
+            if skipped:
+                self.logger.warning(f"날짜가 없는 {skipped}건은 Parquet에 저장하지 않습니다")
+
+            written = 0
+            for (date_str, store), rows in sorted(partitions.items(), key=lambda item: (item[0][0], item[0][1] or '')):
+                if self._write_parquet_partition(dataset_dir, date_str, store, rows):
+                    written += 1
+
+            # 날짜 단위 교체: 이번 데이터에 없는 상호 파티션(예약이 모두 취소된 상호 등) 삭제
+            kept = {}
+            for date_str, store in partitions:
+                kept.setdefault(date_str, set()).add(self._parquet_store_dir(store))
+            for date_str in dates or []:
+                kept.setdefault(date_str, set())
+
+            removed = 0
+            for date_str, store_dirs in kept.items():
+                date_dir = os.path.join(dataset_dir, f"date={date_str}")
+                if not os.path.isdir(date_dir):
+                    continue
+                for name in os.listdir(date_dir):
+                    if name.startswith('store=') and name[len('store='):] not in store_dirs:
+                        shutil.rmtree(os.path.join(date_dir, name))
+                        removed += 1
+                if not os.listdir(date_dir):
+                    os.rmdir(date_dir)
+
+            self.logger.info(
+                f"Parquet 저장 완료: {dataset_dir} "
+                f"(파티션 {len(partitions)}개 중 {written}개 작성, {len(partitions) - written}개 변경 없음, "
+                f"{removed}개 삭제)"
+            )
+            return dataset_dir
+
+        except Exception as e:
+            self.logger.error(f"Parquet 저장 실패: {e}")
+            return None
+
+    def _write_parquet_partition(self, dataset_dir, date_str, store, rows):
+        """
+        파티션 하나를 임시 파일에 쓴 뒤 교체
+
+        Returns:
+            bool: 파일을 새로 썼는지 여부 (기존 파티션과 내용이 같으면 False)
+        """
+        partition_dir = os.path.join(dataset_dir, f"date={date_str}", f"store={self._parquet_store_dir(store)}")
+        filepath = os.path.join(partition_dir, 'part-0.parquet')
+
+        # 파티션 컬럼(date, store)은 폴더 이름에 있으므로 파일에는 나머지 컬럼만 저장
+        # date는 읽을 때 날짜 타입, 나머지는 사이트에 표시된 문자열 그대로 저장
+        # (인원구분도 "Ad: 1 Kd: 0 Bb: 0" 형식의 문자열이고, 파티션마다 타입이 달라지면 데이터셋을 합쳐 읽을 수 없음)
+        columns = list(RESERVATION_FIELDS) + sorted(
+            {key for row in rows for key in row} - set(RESERVATION_FIELDS) - {'date', 'store'}
+        )
+        table = pa.table({
+            column: pa.array(
+                [None if row.get(column) is None else str(row[column]) for row in rows],
+                type=pa.string()
+            )
+            for column in columns
+        })
+
+        # 내용 해시를 파일 메타데이터에 기록해 같은 내용이면 다시 쓰지 않음
+        digest = hashlib.sha1(
+            json.dumps(table.to_pylist(), ensure_ascii=False, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        if os.path.exists(filepath):
+            metadata = pq.read_schema(filepath).metadata or {}
+            if metadata.get(b'content_hash') == digest.encode():
+                return False
+
+        os.makedirs(partition_dir, exist_ok=True)
+        table = table.replace_schema_metadata({'content_hash': digest})
+        # 이름이 '.'으로 시작하는 파일은 데이터셋을 읽을 때 무시됨
+        tmp_path = os.path.join(partition_dir, '.part-0.parquet.tmp')
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, filepath)
+        return True
+
+    @staticmethod
+    def _parquet_store_dir(store):
+        """상호 파티션 폴더 이름의 값 (쓸 수 없는 문자만 URL 인코딩, 한글 상호는 그대로 보이도록)"""
+        if not store:
+            return PARQUET_NULL_PARTITION
+        return ''.join(quote(char, safe='') if char in PARQUET_UNSAFE_CHARS else char for char in store)
+
+    def read_parquet(self, dataset="reservations", start_date=None, end_date=None, stores=None):
+        """
+        Parquet 데이터셋에서 날짜 범위 읽기 (범위 밖 날짜/상호 파티션은 열지 않음)
+
+        Args:
+            dataset (str): 데이터셋 폴더명
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 없으면 처음부터)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 없으면 끝까지)
+            stores (list): 읽을 상호 (없으면 전체)
+
+        Returns:
+            DataFrame: 예약 정보 (date 컬럼은 날짜 타입)
+        """
+        if pa is None:
+            raise ImportError("Parquet 읽기에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+        dataset_dir = os.path.join(self.output_dir, dataset)
+        # 폴더 이름의 날짜는 날짜 타입으로, 상호는 URL 인코딩을 풀어서 읽음
+        partitioning = ds.HivePartitioning(
+            pa.schema([('date', pa.date32()), ('store', pa.string())]),
+            null_fallback=PARQUET_NULL_PARTITION,
+            segment_encoding='uri',
+        )
+        reservations = ds.dataset(dataset_dir, format='parquet', partitioning=partitioning)
+
+        conditions = []
+        if start_date:
+            conditions.append(ds.field('date') >= date.fromisoformat(start_date))
+        if end_date:
+            conditions.append(ds.field('date') <= date.fromisoformat(end_date))
+        if stores:
+            conditions.append(ds.field('store').isin(list(stores)))
+
+        condition = None
+        for item in conditions:
+            condition = item if condition is None else condition & item
+
+        df = reservations.to_table(filter=condition).to_pandas()
+        df = df[['date', 'store'] + [column for column in df.columns if column not in ('date', 'store')]]
+        return df.sort_values(['date', 'store'], kind='stable', ignore_index=True)
+
+    def save_to_sqlite(self, data, filename="reservations.db", dates=None):
+        """
+        SQLite 예약 저장소에 저장 (예약번호 기준으로 갱신)
+
+        Args:
+            data (list): 저장할 데이터 (딕셔너리 리스트)
+            filename (str): 데이터베이스 파일명
+            dates (list): 이번 데이터로 교체할 날짜 (크롤링에 성공한 날짜, 없어진 예약 삭제용)
+
+        Returns:
+            str: 데이터베이스 파일 경로
+        """
+        try:
+            if not data and not dates:
+                self.logger.warning("저장할 데이터가 없습니다")
+                return None
+
+            # 확장자 자동 추가
+            if not filename.endswith('.db'):
+                filename = filename + '.db'
+
+            filepath = os.path.join(self.output_dir, filename)
+            with ReservationStore(filepath) as store:
+                store.upsert(data, replace_dates=dates)
+                total = store.count()
+
+            self.logger.info(f"SQLite 저장 완료: {filepath} ({len(data)}건 반영, 전체 {total}건)")
+            return filepath
+
+        except Exception as e:
+            self.logger.error(f"SQLite 저장 실패: {e}")
+            return None
+
     def get_summary_statistics(self, data):
         """
         데이터 요약 통계
@@ -206,39 +589,27 @@ class DataSaver:
             if not data:
                 return {}
 
-            df = pd.DataFrame(data)
-
-            summary = {
-                'total_count': len(df),
-                'date_range': {
-                    'start': df['date'].min() if 'date' in df.columns else None,
-                    'end': df['date'].max() if 'date' in df.columns else None
-                },
-                'by_date': df.groupby('date').size().to_dict() if 'date' in df.columns else {},
-                'by_team': df.groupby('team').size().to_dict() if 'team' in df.columns else {},
-                'by_channel': df.groupby('channel').size().to_dict() if 'channel' in df.columns else {},
-                'by_country': df.groupby('country').size().to_dict() if 'country' in df.columns else {}
-            }
-
-            return summary
+            return SummaryAggregator(data).snapshot()
 
         except Exception as e:
             self.logger.error(f"통계 생성 실패: {e}")
             return {}
 
-    def save_summary(self, data, filename=None):
+    def save_summary(self, data=None, filename=None, summary=None):
         """
         요약 통계를 JSON 파일로 저장
 
         Args:
             data (list): 분석할 데이터
             filename (str): 파일명 (없으면 자동 생성)
+            summary (dict): 이미 집계한 요약 통계 (있으면 data 대신 사용)
 
         Returns:
             str: 저장된 파일 경로
         """
         try:
-            summary = self.get_summary_statistics(data)
+            if summary is None:
+                summary = self.get_summary_statistics(data)
 
             if filename is None:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
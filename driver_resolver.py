@@ -0,0 +1,189 @@
+"""
+ChromeDriver 경로 결정 모듈
+설치된 Chrome 주 버전별로 chromedriver 경로를 로컬에 기록해 두고, 다음 실행부터는 네트워크 없이 재사용
+버전이 바뀌었거나 기록된 파일이 없을 때만 webdriver-manager로 다시 받음
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import threading
+import subprocess
+import logging
+
+import config
+
+
+# 플랫폼별 Chrome 실행 파일 후보
+CHROME_BINARIES = {
+    'linux': ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'),
+    'darwin': ('/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',),
+}
+
+# Windows 레지스트리의 Chrome 버전 위치
+CHROME_REGISTRY_KEYS = (
+    r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon',
+    r'HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon',
+    r'HKEY_LOCAL_MACHINE\Software\Wow6432Node\Google\Chrome\BLBeacon',
+)
+
+_VERSION_PATTERN = re.compile(r'(\d+)\.\d+\.\d+(?:\.\d+)?')
+
+# 같은 프로세스의 워커들은 한 번만 결정
+_resolved_path = None
+_resolve_lock = threading.Lock()
+
+
+def _run(command):
+    """명령 실행 결과(stdout) 반환 (실패 시 빈 문자열)"""
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=5)
+        return result.stdout
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def detect_chrome_major_version():
+    """
+    설치된 Chrome 주 버전 확인 (네트워크 사용 안 함)
+
+    Returns:
+        int: 주 버전 (확인할 수 없으면 None)
+    """
+    outputs = []
+
+    if sys.platform.startswith('win'):
+        for key in CHROME_REGISTRY_KEYS:
+            outputs.append(_run(['reg', 'query', key, '/v', 'version']))
+    else:
+        platform = 'darwin' if sys.platform == 'darwin' else 'linux'
+        for binary in CHROME_BINARIES[platform]:
+            if os.path.isabs(binary) and not os.path.exists(binary):
+                continue
+            if not os.path.isabs(binary) and not shutil.which(binary):
+                continue
+            outputs.append(_run([binary, '--version']))
+
+    for output in outputs:
+        match = _VERSION_PATTERN.search(output or '')
+        if match:
+            return int(match.group(1))
+
+    return None
+
+
+class DriverCache:
+    """Chrome 주 버전별 chromedriver 경로 기록 클래스"""
+
+    def __init__(self, path=None):
+        """
+        초기화
+
+        Args:
+            path (str): 기록 파일 경로 (없으면 config.DRIVER_CACHE_FILE)
+        """
+        self.path = path or config.DRIVER_CACHE_FILE
+        self.logger = logging.getLogger(__name__)
+        self.entries = self._load()
+
+    def _load(self):
+        """기록 파일 읽기"""
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"드라이버 기록 파일 읽기 실패: {e}")
+            return {}
+
+    def save(self):
+        """기록 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def get(self, major_version):
+        """
+        주 버전에 기록된 chromedriver 경로 (파일이 없으면 None)
+
+        Args:
+            major_version (int): Chrome 주 버전 (None이면 가장 최근 버전의 기록)
+
+        Returns:
+            str: chromedriver 경로
+        """
+        if major_version is None:
+            if not self.entries:
+                return None
+            major_version = max(self.entries, key=int)
+
+        path = self.entries.get(str(major_version))
+        return path if path and os.path.exists(path) else None
+
+    def set(self, major_version, path):
+        """주 버전의 chromedriver 경로 기록"""
+        self.entries[str(major_version or 0)] = path
+        self.save()
+
+    def remove(self, major_version):
+        """주 버전의 기록 삭제 (드라이버가 맞지 않을 때)"""
+        if self.entries.pop(str(major_version or 0), None) is not None:
+            self.save()
+
+
+def _download_chromedriver():
+    """webdriver-manager로 chromedriver 설치 (네트워크 사용)"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def resolve_chromedriver(refresh=False):
+    """
+    chromedriver 경로 결정
+
+    1. config.CHROMEDRIVER_PATH가 있으면 그대로 사용
+    2. 설치된 Chrome 주 버전의 기록이 있으면 재사용 (네트워크 사용 안 함)
+    3. 없거나 refresh=True면 webdriver-manager로 받아서 기록
+
+    Args:
+        refresh (bool): 기록을 무시하고 다시 받을지 여부 (버전 불일치 시)
+
+    Returns:
+        str: chromedriver 경로
+    """
+    global _resolved_path
+    logger = logging.getLogger(__name__)
+
+    if config.CHROMEDRIVER_PATH:
+        return config.CHROMEDRIVER_PATH
+
+    with _resolve_lock:
+        if _resolved_path and not refresh and os.path.exists(_resolved_path):
+            return _resolved_path
+
+        cache = DriverCache()
+        major_version = detect_chrome_major_version()
+
+        if refresh:
+            cache.remove(major_version)
+        else:
+            path = cache.get(major_version)
+            if path:
+                logger.info(f"기록된 ChromeDriver 사용 (Chrome {major_version or '버전 확인 불가'}): {path}")
+                _resolved_path = path
+                return path
+
+        logger.info(f"ChromeDriver 설치 (Chrome {major_version or '버전 확인 불가'})")
+        path = _download_chromedriver()
+        cache.set(major_version, path)
+        _resolved_path = path
+        return path
@@ -0,0 +1,361 @@
+"""
+로컬 KTour 대체 사이트 모듈
+실제 사이트와 같은 셀렉터(로그인 폼, MUI 날짜 선택기, 상호 h6, 팀 칩, 상세 패널)를 가진 페이지와
+날짜별 예약 JSON API를 제공하여, 실제 사이트 없이 KTourCrawler를 끝까지 실행할 수 있게 함
+"""
+
+import json
+import time
+import threading
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+SESSION_COOKIE = 'ktour_fake_session'
+
+CHANNELS = ('KK', 'VT', 'GG', 'TR')
+COUNTRIES = ('US', 'JP', 'CN', 'TW', 'SG')
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>KTour Guide</title></head>
+<body>
+<form method="post" action="/login">
+    <input type="email" name="email" id="email">
+    <input type="password" name="password">
+    <button type="submit">Login</button>
+</form>
+</body></html>"""
+
+# 실제 사이트의 MUI 클래스를 그대로 사용하는 단일 페이지 앱
+APP_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>KTour Guide</title>
+<style>
+    .MuiPickersDay-root { width: 36px; height: 36px; }
+    .Mui-selected { background: #1976d2; color: white; }
+    .css-k008qs { cursor: pointer; padding: 4px; border-bottom: 1px solid #ddd; }
+</style>
+</head>
+<body>
+<div id="app">
+    <!-- 상호가 아닌 MUI h6 제목 (상호명으로 잘못 인식하지 않는지 확인용) -->
+    <h6 class="MuiTypography-root MuiTypography-h6">예약 현황</h6>
+    <p class="MuiTypography-root MuiTypography-body1 css-1a5pbt3" id="date-display"></p>
+    <div id="picker"></div>
+    <div id="stores"></div>
+    <div id="teams"></div>
+    <div id="detail"></div>
+</div>
+<script>
+const CONFIG = __CONFIG__;
+const MONTHS = ["January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December"];
+
+let selected = CONFIG.initialDate ? new Date(CONFIG.initialDate + "T00:00:00") : new Date();
+let view = null;  // {year, month, mode, pendingDay}
+let reservations = [];
+
+function pad(n) { return String(n).padStart(2, "0"); }
+function isoDate(d) { return d.getFullYear() + "-" + pad(d.getMonth() + 1) + "-" + pad(d.getDate()); }
+function el(tag, className, text) {
+    const node = document.createElement(tag);
+    if (className) node.className = className;
+    if (text !== undefined) node.textContent = text;
+    return node;
+}
+function later(fn, delay) { setTimeout(fn, delay === undefined ? CONFIG.renderDelay : delay); }
+
+function renderDateDisplay() {
+    document.getElementById("date-display").textContent = isoDate(selected);
+}
+
+function renderPicker() {
+    const picker = document.getElementById("picker");
+    picker.innerHTML = "";
+    if (!view) return;
+
+    const header = el("div", "MuiPickersCalendarHeader-label css-1v994a0", MONTHS[view.month] + " " + view.year);
+    header.onclick = () => { view.mode = view.mode === "year" ? "day" : "year"; renderPicker(); };
+    picker.appendChild(header);
+
+    if (view.mode === "year") {
+        for (let year = view.year - 5; year <= view.year + 5; year++) {
+            const button = el("button", "MuiPickersYear-yearButton", String(year));
+            button.onclick = () => { view.year = year; view.mode = "day"; view.pendingDay = null; renderPicker(); };
+            picker.appendChild(button);
+        }
+        return;
+    }
+
+    const prev = el("button", "MuiIconButton-root", "<");
+    prev.setAttribute("aria-label", "Previous month");
+    prev.onclick = () => { moveMonth(-1); };
+    const next = el("button", "MuiIconButton-root", ">");
+    next.setAttribute("aria-label", "Next month");
+    next.onclick = () => { moveMonth(1); };
+    picker.appendChild(prev);
+    picker.appendChild(next);
+
+    const grid = el("div", "MuiDayCalendar-monthContainer");
+    const first = new Date(view.year, view.month, 1).getDay();
+    for (let i = 0; i < first; i++) {
+        grid.appendChild(el("button",
+            "MuiButtonBase-root MuiPickersDay-root MuiPickersDay-dayWithMargin MuiPickersDay-hiddenDaySpacingFiller", ""));
+    }
+    const days = new Date(view.year, view.month + 1, 0).getDate();
+    for (let day = 1; day <= days; day++) {
+        const button = el("button", "MuiButtonBase-root MuiPickersDay-root MuiPickersDay-dayWithMargin", String(day));
+        if (view.pendingDay === day) button.classList.add("Mui-selected");
+        button.onclick = () => {
+            grid.querySelectorAll(".Mui-selected").forEach(b => b.classList.remove("Mui-selected"));
+            view.pendingDay = day;
+            button.classList.add("Mui-selected");
+        };
+        grid.appendChild(button);
+    }
+    picker.appendChild(grid);
+
+    const ok = el("button", "MuiButton-root", "OK");
+    ok.onclick = () => {
+        if (view.pendingDay) selected = new Date(view.year, view.month, view.pendingDay);
+        view = null;
+        renderPicker();
+        renderDateDisplay();
+        loadDate();
+    };
+    picker.appendChild(ok);
+}
+
+function moveMonth(delta) {
+    const moved = new Date(view.year, view.month + delta, 1);
+    view.year = moved.getFullYear();
+    view.month = moved.getMonth();
+    view.pendingDay = null;
+    renderPicker();
+}
+
+function clearResults() {
+    ["stores", "teams", "detail"].forEach(id => { document.getElementById(id).innerHTML = ""; });
+}
+
+function loadDate() {
+    clearResults();
+    fetch("/api/reservations?date=" + isoDate(selected))
+        .then(r => r.json())
+        .then(payload => later(() => renderStores(payload)));
+}
+
+function renderStores(payload) {
+    const stores = document.getElementById("stores");
+    payload.data.stores.forEach(store => {
+        if (!store.reservations.length) return;
+        const title = el("h6", "MuiTypography-root MuiTypography-h6", store.storeName);
+        title.onclick = () => { reservations = store.reservations; later(renderTeams); };
+        stores.appendChild(title);
+    });
+}
+
+function renderTeams() {
+    const teams = document.getElementById("teams");
+    teams.innerHTML = "";
+    reservations.forEach(reservation => {
+        const item = el("div", "MuiBox-root css-k008qs");
+        const chip = el("div", "MuiChip-root MuiChip-outlined");
+        chip.appendChild(el("span", "MuiChip-label", reservation.teamName));
+        item.appendChild(chip);
+        item.appendChild(el("span", "MuiTypography-root", reservation.customerName));
+        item.onclick = () => later(() => renderDetail(reservation), CONFIG.renderDelay / 2);
+        teams.appendChild(item);
+    });
+}
+
+function renderDetail(r) {
+    const detail = document.getElementById("detail");
+    detail.innerHTML = "";
+    const chip = el("div", "MuiChip-root MuiChip-sizeSmall");
+    chip.appendChild(el("div",
+        "MuiAvatar-root MuiAvatar-circular MuiAvatar-colorDefault MuiChip-avatar MuiChip-avatarSmall MuiChip-avatarColorPrimary css-1buxfho",
+        r.channel));
+    chip.appendChild(el("span", "MuiChip-label MuiChip-labelSmall css-19imqg1", r.teamName));
+    detail.appendChild(chip);
+    detail.appendChild(el("h6", "MuiTypography-root MuiTypography-subtitle1 css-qdk4z1", r.customerName));
+    detail.appendChild(el("h6", "MuiTypography-root MuiTypography-subtitle2 css-1r042ka", r.reservationNumber));
+    detail.appendChild(el("p", "MuiTypography-root MuiTypography-subtitle2 css-mdkayp", r.peopleText));
+    detail.appendChild(el("span", "MuiTypography-root MuiTypography-subtitle2 css-xcju41", r.country));
+    detail.appendChild(el("p", "MuiTypography-root MuiTypography-subtitle2 css-1q5lgor", r.productName));
+    detail.appendChild(el("p", "MuiTypography-root MuiTypography-subtitle2 css-17exa0r", r.timeRequest));
+}
+
+document.getElementById("date-display").onclick = () => {
+    view = {year: selected.getFullYear(), month: selected.getMonth(), mode: "day", pendingDay: selected.getDate()};
+    later(renderPicker, CONFIG.renderDelay / 2);
+};
+
+later(() => { renderDateDisplay(); loadDate(); });
+</script>
+</body></html>"""
+
+
+def build_reservations(target_date, teams_per_day, store_name, empty_every=0):
+    """
+    날짜별 가짜 예약 데이터 (같은 날짜는 항상 같은 결과)
+
+    Args:
+        target_date (str): 날짜 (YYYY-MM-DD)
+        teams_per_day (int): 날짜별 팀(예약) 수
+        store_name (str): 상호명
+        empty_every (int): N일마다 예약 없는 날짜 (0이면 없음)
+
+    Returns:
+        list: 예약 레코드 리스트 (JSON 응답 형식)
+    """
+    day = datetime.strptime(target_date, '%Y-%m-%d')
+    if empty_every and day.toordinal() % empty_every == 0:
+        return []
+
+    compact = target_date.replace('-', '')
+    records = []
+    for i in range(1, teams_per_day + 1):
+        adults, kids = 1 + i % 3, i % 2
+        records.append({
+            'reservationNumber': f"R{compact}{i:03d}",
+            'customerName': f"Customer {compact}-{i}",
+            'teamName': f"Team {i}",
+            'channel': CHANNELS[i % len(CHANNELS)],
+            'people': {'adult': adults, 'kid': kids},
+            'peopleText': f"Ad {adults}" + (f" Kd {kids}" if kids else ""),
+            'country': COUNTRIES[i % len(COUNTRIES)],
+            'productName': f"AB: Hair Styling {i}",
+            'timeRequest': f"Time Request: {9 + i % 9:02d}:00",
+            'storeName': store_name
+        })
+    return records
+
+
+class FakeKTourSite:
+    """로컬 KTour 대체 사이트 서버 클래스"""
+
+    def __init__(self, teams_per_day=5, latency=0.0, render_delay=0.1, store_name='마리엠헤어',
+                 other_stores=1, empty_every=0, initial_date=None):
+        """
+        초기화
+
+        Args:
+            teams_per_day (int): 날짜별 팀(예약) 수
+            latency (float): 모든 HTTP 응답에 추가할 지연(초)
+            render_delay (float): 화면 갱신(선택기, 상호, 팀 목록) 지연(초)
+            store_name (str): 크롤링 대상 상호명
+            other_stores (int): 함께 표시할 다른 상호 수
+            empty_every (int): N일마다 예약 없는 날짜 (0이면 없음)
+            initial_date (str): 첫 화면에 선택된 날짜 (없으면 오늘)
+        """
+        self.teams_per_day = teams_per_day
+        self.latency = latency
+        self.render_delay = render_delay
+        self.store_name = store_name
+        self.other_stores = other_stores
+        self.empty_every = empty_every
+        self.initial_date = initial_date
+
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def url(self):
+        """사이트 주소 (끝에 / 포함)"""
+        return f"http://127.0.0.1:{self._server.server_port}/"
+
+    @property
+    def api_url(self):
+        """날짜별 예약 API URL 템플릿 (config.API_RESERVATIONS_URL 형식)"""
+        return self.url + 'api/reservations?date={date}'
+
+    def expected_reservations(self, dates):
+        """날짜들에서 크롤링되어야 하는 예약 수"""
+        return sum(
+            len(build_reservations(d, self.teams_per_day, self.store_name, self.empty_every))
+            for d in dates
+        )
+
+    def payload(self, target_date):
+        """날짜별 예약 JSON 응답"""
+        stores = [{
+            'storeName': self.store_name,
+            'reservations': build_reservations(target_date, self.teams_per_day, self.store_name, self.empty_every)
+        }]
+        for i in range(1, self.other_stores + 1):
+            name = f"다른상호 {i}"
+            stores.append({'storeName': name, 'reservations': build_reservations(target_date, 2, name)})
+        return {'data': {'date': target_date, 'stores': stores}}
+
+    def app_page(self):
+        """선택기/상호/팀/상세 화면 HTML"""
+        options = {'renderDelay': int(self.render_delay * 1000), 'initialDate': self.initial_date}
+        return APP_PAGE.replace('__CONFIG__', json.dumps(options))
+
+    def _handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status, body, content_type, headers=None):
+                with site._lock:
+                    site.requests += 1
+                if site.latency:
+                    time.sleep(site.latency)
+
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _logged_in(self):
+                return f"{SESSION_COOKIE}=ok" in (self.headers.get('Cookie') or '')
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+
+                if parsed.path == '/api/reservations':
+                    if not self._logged_in():
+                        self._send(401, '{"error": "unauthorized"}', 'application/json')
+                        return
+                    target_date = parse_qs(parsed.query).get('date', [''])[0]
+                    body = json.dumps(site.payload(target_date), ensure_ascii=False)
+                    self._send(200, body, 'application/json; charset=utf-8')
+                elif self._logged_in():
+                    self._send(200, site.app_page(), 'text/html; charset=utf-8')
+                else:
+                    self._send(200, LOGIN_PAGE, 'text/html; charset=utf-8')
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self.rfile.read(length)
+                self._send(302, '', 'text/plain', {
+                    'Set-Cookie': f"{SESSION_COOKIE}=ok; Path=/",
+                    'Location': '/'
+                })
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        thread = threading.Thread(target=self._server.serve_forever, name='fake-ktour-site')
+        thread.daemon = True
+        thread.start()
+        return self.url
+
+    def stop(self):
+        """서버 종료"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
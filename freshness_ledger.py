@@ -0,0 +1,226 @@
+"""
+날짜별 신선도 원장 모듈
+상호/날짜별로 마지막 크롤링 시각과 결과 지문(fingerprint)을 기록하여, 아직 신선한 날짜는 다시 크롤링하지 않음
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from datetime import datetime, date
+
+import config
+
+
+class FreshnessLedger:
+    """상호/날짜별 크롤링 기록 원장 클래스"""
+
+    def __init__(self, path=None, ttl_rules=None):
+        """
+        초기화
+
+        Args:
+            path (str): 원장 파일 경로 (없으면 config.LEDGER_FILE)
+            ttl_rules (list): [(최대 남은 일수, TTL초), ...] (없으면 config.FRESHNESS_TTL_RULES)
+        """
+        self.path = path or config.LEDGER_FILE
+        self.ttl_rules = config.FRESHNESS_TTL_RULES if ttl_rules is None else ttl_rules
+        self.logger = logging.getLogger(__name__)
+        self.entries = self._load()
+
+    def _load(self):
+        """원장 파일 읽기"""
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"원장 파일 읽기 실패, 새로 시작합니다: {e}")
+            return {}
+
+    def save(self):
+        """원장 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _key(store_name, target_date):
+        return f"{store_name}|{target_date}"
+
+    @staticmethod
+    def fingerprint(reservations):
+        """
+        예약 결과 지문 (순서와 무관)
+
+        Args:
+            reservations (list): 예약 정보 리스트
+
+        Returns:
+            str: SHA-256 해시
+        """
+        rows = sorted(json.dumps(r, ensure_ascii=False, sort_keys=True) for r in reservations)
+        return hashlib.sha256('\n'.join(rows).encode('utf-8')).hexdigest()
+
+    def ttl_for(self, target_date, today=None):
+        """
+        날짜에 적용할 TTL
+
+        Args:
+            target_date (str): 날짜 (YYYY-MM-DD)
+            today (date): 기준 날짜 (없으면 오늘)
+
+        Returns:
+            int: TTL(초), None이면 만료되지 않음
+        """
+        today = today or date.today()
+        days_ahead = (datetime.strptime(target_date, '%Y-%m-%d').date() - today).days
+
+        for max_days, ttl in self.ttl_rules:
+            if max_days is None or days_ahead <= max_days:
+                return ttl
+
+        return 0
+
+    def is_fresh(self, store_name, target_date, now=None):
+        """
+        다시 크롤링하지 않아도 되는지 확인
+
+        Args:
+            store_name (str): 상호명
+            target_date (str): 날짜 (YYYY-MM-DD)
+            now (float): 기준 시각 (없으면 현재)
+
+        Returns:
+            bool: 신선하면 True
+        """
+        entry = self.entries.get(self._key(store_name, target_date))
+        if not entry:
+            return False
+
+        # TTL은 크롤링한 날 기준으로 적용 (날짜가 지난 뒤에 크롤링한 결과만 최종 결과로 간주)
+        ttl = self.ttl_for(target_date, today=date.fromtimestamp(entry['crawled_at']))
+        if ttl is None:
+            return True
+
+        now = time.time() if now is None else now
+        return now - entry['crawled_at'] < ttl
+
+    def get(self, store_name, target_date):
+        """
+        저장된 날짜 결과
+
+        Args:
+            store_name (str): 상호명
+            target_date (str): 날짜 (YYYY-MM-DD)
+
+        Returns:
+            list: 예약 정보 리스트 (기록이 없으면 빈 리스트)
+        """
+        entry = self.entries.get(self._key(store_name, target_date))
+        return list(entry['reservations']) if entry else []
+
+    def record(self, store_name, target_date, reservations):
+        """
+        날짜 크롤링 결과 기록
+
+        Args:
+            store_name (str): 상호명
+            target_date (str): 날짜 (YYYY-MM-DD)
+            reservations (list): 해당 날짜의 예약 정보 리스트
+
+        Returns:
+            bool: 이전 결과와 달라졌으면 True
+        """
+        key = self._key(store_name, target_date)
+        fingerprint = self.fingerprint(reservations)
+        previous = self.entries.get(key)
+
+        self.entries[key] = {
+            'crawled_at': time.time(),
+            'fingerprint': fingerprint,
+            'reservations': list(reservations)
+        }
+
+        return previous is None or previous['fingerprint'] != fingerprint
+
+    def partition(self, store_name, dates):
+        """
+        날짜들을 신선한 날짜와 다시 크롤링할 날짜로 분류
+
+        Args:
+            store_name (str): 상호명
+            dates (list): 날짜 리스트 (YYYY-MM-DD)
+
+        Returns:
+            tuple: (신선한 날짜 리스트, 크롤링할 날짜 리스트)
+        """
+        fresh, stale = [], []
+        for target_date in dates:
+            (fresh if self.is_fresh(store_name, target_date) else stale).append(target_date)
+        return fresh, stale
+
+
+def crawl_incremental(ledger, store_name, dates, crawl_func, on_merged=None):
+    """
+    신선한 날짜는 원장에서, 나머지는 crawl_func로 크롤링하여 날짜 순서대로 병합
+
+    Args:
+        ledger (FreshnessLedger): 원장
+        store_name (str): 상호명
+        dates (list): 날짜 리스트 (YYYY-MM-DD)
+        crawl_func (callable): 날짜 리스트를 받아 (예약 정보 리스트, 실패 날짜 리스트)를 반환
+        on_merged (callable): 이번에 크롤링에 성공하지 않은 날짜(신선한 날짜, 실패한 날짜)를 병합할 때
+                              (날짜, 병합한 예약 정보 리스트)를 받아 호출 (요약 통계 누적용)
+
+    Returns:
+        tuple: (예약 정보 리스트, 실패 날짜 리스트)
+    """
+    logger = logging.getLogger(__name__)
+
+    fresh, stale = ledger.partition(store_name, dates)
+    logger.info(f"증분 크롤링: 신선한 날짜 {len(fresh)}개 생략, 크롤링할 날짜 {len(stale)}개")
+
+    failed_dates = []
+    crawled = {}
+
+    if stale:
+        reservations, failed_dates = crawl_func(stale)
+        for reservation in reservations:
+            crawled.setdefault(reservation['date'], []).append(reservation)
+
+        # 실패한 날짜는 기록하지 않아 다음 실행에서 다시 크롤링
+        changed = 0
+        for target_date in stale:
+            if target_date in failed_dates:
+                continue
+            if ledger.record(store_name, target_date, crawled.get(target_date, [])):
+                changed += 1
+
+        ledger.save()
+        logger.info(f"증분 크롤링: 결과가 바뀐 날짜 {changed}개")
+
+    # 신선한 날짜와 이번에 실패한 날짜는 마지막으로 저장된 결과 사용
+    merged = []
+    for target_date in dates:
+        stored = ledger.get(store_name, target_date)
+        if target_date in failed_dates and stored:
+            rows = stored
+        elif target_date in stale:
+            rows = crawled.get(target_date, [])
+        else:
+            rows = stored
+        merged.extend(rows)
+
+        if on_merged and (target_date not in stale or target_date in failed_dates):
+            on_merged(target_date, rows)
+
+    return merged, failed_dates
@@ -107,7 +107,7 @@ class GoogleSheetsManager:
 
                 # 헤더 추가
                 headers = [
-                    '날짜', '팀', '고객명', '예약번호', '채널',
+                    '날짜', '상호', '팀', '고객명', '예약번호', '채널',
                     '인원구분', '국가', '예약상품', '예약시간'
                 ]
                 worksheet.append_row(headers)
@@ -165,6 +165,7 @@ class GoogleSheetsManager:
             # 컬럼명 통일 (기존 데이터와 매칭)
             column_mapping = {
                 'date': '날짜',
+                'store': '상호',
                 'team': '팀',
                 'customer_name': '고객명',
                 'reservation_number': '예약번호',
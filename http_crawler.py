@@ -0,0 +1,108 @@
+"""
+HTTP 재생 크롤러 모듈
+Selenium으로 한 번 로그인한 뒤, 세션 쿠키로 사이트의 데이터 API를 직접 호출하여 브라우저 없이 날짜별 예약 정보 수집
+"""
+
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from network_capture import parse_reservations
+import config
+
+
+class HttpReservationCrawler:
+    """세션 쿠키 기반 HTTP 예약 정보 크롤러 클래스"""
+
+    def __init__(self, cookies, user_agent=None, auth_token=None, endpoint=None, workers=None, store_name=None):
+        """
+        초기화
+
+        Args:
+            cookies (list): Selenium get_cookies() 형식의 쿠키 리스트
+            user_agent (str): 브라우저와 같은 User-Agent
+            auth_token (str): Authorization 헤더로 보낼 토큰 (없으면 쿠키만 사용)
+            endpoint (str): 날짜별 예약 API URL 템플릿 ({date} 포함, 없으면 config 값)
+            workers (int): 동시 요청 수 (없으면 config.HTTP_WORKERS)
+            store_name (str): 상호명 (없으면 config.DEFAULT_STORE_NAME)
+        """
+        self.endpoint = endpoint or config.API_RESERVATIONS_URL
+        self.workers = workers or config.HTTP_WORKERS
+        self.store_name = store_name or config.DEFAULT_STORE_NAME
+        self.logger = logging.getLogger(__name__)
+
+        # 연결 재사용(keep-alive) 풀과 일시적 오류 재시도
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.workers,
+            pool_maxsize=self.workers,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+
+        self.session.headers['Accept'] = 'application/json'
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+        if auth_token:
+            self.session.headers['Authorization'] = f"Bearer {auth_token}"
+
+    @classmethod
+    def from_crawler(cls, crawler, **kwargs):
+        """
+        로그인된 KTourCrawler의 브라우저 세션으로 생성
+
+        Args:
+            crawler (KTourCrawler): login()이 완료된 크롤러
+            **kwargs: 생성자 추가 인자
+
+        Returns:
+            HttpReservationCrawler: HTTP 크롤러
+        """
+        driver = crawler.driver
+        auth_token = None
+        if config.API_AUTH_STORAGE_KEY:
+            auth_token = driver.execute_script(
+                'return window.localStorage.getItem(arguments[0]);',
+                config.API_AUTH_STORAGE_KEY
+            )
+
+        return cls(
+            cookies=driver.get_cookies(),
+            user_agent=driver.execute_script('return navigator.userAgent;'),
+            auth_token=auth_token,
+            **kwargs
+        )
+
+    def fetch_date(self, target_date, store_name=None):
+        """
+        특정 날짜의 예약 정보 조회
+
+        Args:
+            target_date (str): 조회할 날짜 (YYYY-MM-DD)
+            store_name (str): 상호명, 쉼표로 구분한 여러 상호명 또는 ALL_STORES (없으면 생성 시 지정한 상호)
+
+        Returns:
+            list: 예약 정보 리스트
+        """
+        url = self.endpoint.format(date=target_date)
+        response = self.session.get(url, timeout=config.PAGE_LOAD_TIMEOUT)
+        response.raise_for_status()
+
+        reservations = parse_reservations(response.json(), target_date, store_name or self.store_name)
+        self.logger.info(f"HTTP 조회 완료: {target_date} ({len(reservations)}건)")
+        return reservations
+
+    def close(self):
+        """HTTP 세션 종료"""
+        self.session.close()
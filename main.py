@@ -4,12 +4,19 @@ KTour 예약 현황 크롤러 메인 실행 스크립트
 
 import argparse
 import logging
-from datetime import datetime
+import signal
 
 from crawler import KTourCrawler
+from orchestrator import build_slots, crawl_with_orchestrator
+from freshness_ledger import FreshnessLedger, crawl_incremental
+from checkpoint import CrawlCheckpoint, merge_with_checkpoint
 from data_saver import DataSaver
+from sinks import open_sink
+from summary_aggregator import SummaryAggregator
 from google_sheets_manager import GoogleSheetsManager
-from utils import PasswordFilter
+from utils import PasswordFilter, generate_dates, join_stores
+from metrics import start_run
+import resilience
 import config
 
 
@@ -30,6 +37,39 @@ def setup_logging():
         handler.addFilter(password_filter)
 
 
+def crawl_dates(args, crawler, crawler_options, store_name, dates, on_result=None, sink=None):
+    """
+    명령줄 옵션에 맞는 슬롯(브라우저 워커 또는 HTTP)으로 날짜들을 크롤링
+
+    Args:
+        args: 명령줄 인자
+        crawler (KTourCrawler): 첫 번째 브라우저 슬롯(HTTP 방식에서는 로그인/대체용) 크롤러
+        crawler_options (dict): 추가 워커 크롤러 생성 옵션
+        store_name (str): 상호명, 쉼표로 구분한 여러 상호명 또는 ALL_STORES
+        dates (list): 크롤링할 날짜 리스트 (YYYY-MM-DD)
+        on_result (callable): 날짜가 끝날 때마다 CrawlResult를 받아 호출
+        sink (ReservationSink): 예약 정보를 추출할 때마다 전달할 저장소 (날짜가 끝날 때마다 flush)
+
+    Returns:
+        tuple: (예약 정보 리스트 (--stream-only이면 빈 리스트), 실패 날짜 리스트)
+    """
+    slots = build_slots(
+        crawler,
+        backend=args.backend,
+        workers=args.workers,
+        crawler_factory=lambda: KTourCrawler(**crawler_options),
+        sink=sink
+    )
+    return crawl_with_orchestrator(
+        slots, store_name, dates, on_result, keep_results=not args.stream_only
+    )
+
+
+def handle_termination(signum, frame):
+    """SIGTERM을 KeyboardInterrupt로 바꿔 SIGINT와 같은 정리 경로를 타도록 함"""
+    raise KeyboardInterrupt
+
+
 def main():
     """메인 실행 함수"""
     # 명령줄 인자 파싱
@@ -38,14 +78,44 @@ def main():
     parser.add_argument('--start-date', type=str, help='시작 날짜 (YYYY-MM-DD)')
     parser.add_argument('--end-date', type=str, help='종료 날짜 (YYYY-MM-DD)')
     parser.add_argument('--headless', action='store_true', help='헤드리스 모드 실행')
-    parser.add_argument('--output-format', type=str, choices=['csv', 'excel', 'json'],
-                        default='csv', help='출력 형식 (기본값: csv)')
+    parser.add_argument('--output-format', type=str, choices=['csv', 'excel', 'json', 'parquet', 'sqlite'],
+                        default='csv',
+                        help='출력 형식 (기본값: csv, parquet/sqlite는 실행마다 같은 데이터셋/DB에 누적)')
     parser.add_argument('--output-file', type=str, help='출력 파일명')
+    parser.add_argument('--excel-split', type=str, choices=['month', 'team'],
+                        help='Excel 출력을 월별 또는 팀별 시트로 나누기')
     parser.add_argument('--google-sheets', action='store_true', help='구글 시트에 저장')
     parser.add_argument('--sheets-url', type=str, help='구글 시트 URL')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='동시에 실행할 브라우저 수 (기본값: 1)')
+    parser.add_argument('--no-session-cache', action='store_true',
+                        help='저장된 로그인 세션을 사용하지 않고 항상 로그인')
+    parser.add_argument('--backend', type=str, choices=['browser', 'http'], default='browser',
+                        help='크롤링 방식 (http: 로그인 후 데이터 API 직접 호출, 기본값: browser)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='최근에 크롤링한 날짜는 건너뛰고 저장된 결과 사용')
+    parser.add_argument('--resume', type=str, metavar='RUN_ID',
+                        help='중단된 실행을 첫 미완료 날짜부터 이어서 진행')
+    parser.add_argument('--capture-network', action='store_true',
+                        help='사이트의 네트워크 응답(JSON)에서 예약 정보 추출 (실패 시 화면 추출)')
+    parser.add_argument('--profile', type=str, choices=['full', 'lean'],
+                        help='브라우저 프로필 (lean: 이미지/폰트/미디어/외부 스크립트 차단, 기본값: config 값)')
+    parser.add_argument('--traffic-stats', action='store_true',
+                        help='브라우저 요청 수/전송량 기록 (CDP 성능 로그 사용, 기본값: config 값)')
+    parser.add_argument('--stores', type=str,
+                        help='크롤링할 상호 (쉼표로 구분, all: STORE_NAMES 중 날짜에 표시된 상호, 기본값: config 값)')
+    parser.add_argument('--stream', type=str, metavar='FILE',
+                        help='날짜가 끝날 때마다 예약 정보를 파일에 추가 (.csv 또는 .ndjson)')
+    parser.add_argument('--stream-only', action='store_true',
+                        help='--stream 파일에만 저장하고 결과를 메모리에 모으지 않음 (출력 파일/요약 생략)')
 
     args = parser.parse_args()
 
+    if args.stream_only and not args.stream:
+        parser.error('--stream-only는 --stream과 함께 사용해야 합니다')
+    if args.stream_only and args.incremental:
+        parser.error('--stream-only는 --incremental과 함께 사용할 수 없습니다')
+
     # 로깅 설정
     setup_logging()
     logger = logging.getLogger(__name__)
@@ -55,50 +125,121 @@ def main():
     logger.info("=" * 80)
 
     # 크롤러 초기화
-    crawler = KTourCrawler(headless=args.headless)
+    crawler_options = {
+        'headless': args.headless,
+        'use_session_cache': False if args.no_session_cache else None,
+        'capture_network': True if args.capture_network else None,
+        'profile': args.profile,
+        'traffic_stats': True if args.traffic_stats else None,
+        # --stream-only: 예약 정보는 스트림 파일에만 두고 크롤러에 모으지 않음
+        'buffer_results': not args.stream_only,
+    }
+    crawler = KTourCrawler(**crawler_options)
     saver = DataSaver(output_dir=config.OUTPUT_DIR)
+    checkpoint = None
+    run_metrics = None
+    sink = None
+
+    # SIGTERM도 SIGINT처럼 체크포인트를 남기고 종료
+    signal.signal(signal.SIGTERM, handle_termination)
 
     try:
-        # WebDriver 설정
-        crawler.setup_driver()
-
-        # 로그인
-        crawler.login()
-
-        # 날짜 정보 파악 (파일명 생성용)
-        start_date = None
-        end_date = None
-
-        # 크롤링 실행
-        if args.date:
-            # 단일 날짜 크롤링
-            logger.info(f"단일 날짜 크롤링: {args.date}")
-            crawler.crawl_date(args.date)
-            start_date = end_date = args.date
-
-        elif args.start_date and args.end_date:
-            # 날짜 범위 크롤링
-            logger.info(f"날짜 범위 크롤링: {args.start_date} ~ {args.end_date}")
-            crawler.crawl_date_range(args.start_date, args.end_date)
-            start_date = args.start_date
-            end_date = args.end_date
+        if args.resume:
+            # 중단된 실행 이어서 진행
+            checkpoint = CrawlCheckpoint.load(args.resume)
+            all_dates = checkpoint.dates
+            start_date = checkpoint.params.get('start_date', all_dates[0])
+            end_date = checkpoint.params.get('end_date', all_dates[-1])
+            store_name = checkpoint.params.get('store_name', config.DEFAULT_STORE_NAME)
+            if not checkpoint.keep_reservations:
+                # --stream-only 실행의 체크포인트에는 날짜별 건수만 있음
+                logger.warning(
+                    "이전에 완료된 날짜의 예약 정보는 스트림 파일에만 있으며, 이번 출력 파일과 요약 통계에는 포함되지 않습니다"
+                )
 
         else:
-            # 기본값: config 파일의 날짜 범위 사용
-            logger.info(f"기본 날짜 범위 크롤링: {config.START_DATE} ~ {config.END_DATE}")
-            crawler.crawl_date_range(config.START_DATE, config.END_DATE)
-            start_date = config.START_DATE
-            end_date = config.END_DATE
+            # 날짜 정보 파악 (파일명 생성용)
+            if args.date:
+                start_date = end_date = args.date
+            elif args.start_date and args.end_date:
+                start_date = args.start_date
+                end_date = args.end_date
+            else:
+                start_date = config.START_DATE
+                end_date = config.END_DATE
+
+            all_dates = generate_dates(start_date, end_date)
+            checkpoint = CrawlCheckpoint()
+            store_name = join_stores(args.stores)
+            checkpoint.start(
+                all_dates,
+                {'start_date': start_date, 'end_date': end_date, 'store_name': store_name},
+                keep_reservations=not args.stream_only
+            )
+
+        logger.info(f"실행 ID: {checkpoint.run_id}")
+        run_metrics = start_run(checkpoint.run_id)
+        resilience.start_run()
+
+        previous = checkpoint.completed_reservations()
+
+        # 요약 통계는 날짜가 끝날 때마다 누적 (이전 실행에서 완료된 날짜부터 집계)
+        aggregator = SummaryAggregator(r for date_reservations in previous.values() for r in date_reservations)
+
+        # 날짜가 끝날 때마다 체크포인트 기록
+        def on_result(result):
+            checkpoint.record_date(result.date, result.reservations, result.success)
+            # 증분 크롤링에서 실패한 날짜는 원장의 결과로 대신할 수 있으므로 병합할 때 집계
+            if result.success or not args.incremental:
+                aggregator.add_many(result.reservations)
+
+        dates = checkpoint.pending_dates()
+        logger.info(f"크롤링 날짜: {start_date} ~ {end_date} ({len(dates)}/{len(all_dates)}일)")
+        logger.info(f"크롤링 상호: {store_name}")
+
+        # 수집하는 대로 파일에 추가 (tail로 진행 상황 확인 가능)
+        if args.stream:
+            sink = open_sink(args.stream)
+            logger.info(f"스트리밍 저장: {args.stream}")
+
+        if args.incremental:
+            # 증분 크롤링: 아직 신선한 날짜는 원장에 저장된 결과 사용
+            ledger = FreshnessLedger()
+            reservations, failed_dates = crawl_incremental(
+                ledger,
+                store_name,
+                dates,
+                lambda stale_dates: crawl_dates(args, crawler, crawler_options, store_name, stale_dates, on_result, sink),
+                # 신선한 날짜와 실패한 날짜는 원장 등에서 병합한 결과로 집계
+                on_merged=lambda _, rows: aggregator.add_many(rows)
+            )
+        else:
+            reservations, failed_dates = crawl_dates(args, crawler, crawler_options, store_name, dates, on_result, sink)
+
+        # 이전 실행에서 완료된 날짜의 결과와 병합 (--stream-only이면 이전 결과는 이미 스트림 파일에 있음)
+        if not args.stream_only:
+            reservations = merge_with_checkpoint(all_dates, previous, reservations)
 
-        # 수집된 데이터 가져오기
-        reservations = crawler.get_reservations()
+        if failed_dates:
+            logger.warning(f"크롤링 실패 날짜: {', '.join(failed_dates)}")
+            logger.warning(f"실패한 날짜만 다시 실행: python main.py --resume {checkpoint.run_id}")
+            checkpoint.finish('incomplete')
+        else:
+            checkpoint.finish('completed')
 
         logger.info("=" * 80)
-        logger.info(f"크롤링 완료: 총 {len(reservations)}건의 예약 정보 수집")
+        if args.stream_only:
+            logger.info(f"크롤링 완료: 총 {sink.count}건의 예약 정보를 {args.stream}에 저장")
+        else:
+            logger.info(f"크롤링 완료: 총 {len(reservations)}건의 예약 정보 수집")
         logger.info("=" * 80)
 
-        # 데이터가 있으면 저장
-        if reservations:
+        # Parquet/SQLite는 크롤링에 성공한 날짜를 날짜 단위로 교체하므로 예약이 없어도 저장 (취소된 예약 삭제)
+        replace_dates = [d for d in all_dates if d not in failed_dates]
+        replaces_dates = not args.stream_only and args.output_format in ('parquet', 'sqlite') and replace_dates
+
+        # 데이터가 있으면 저장 (--stream-only이면 스트림 파일이 결과)
+        if reservations or replaces_dates:
             # 날짜 기반 파일명 생성 (사용자가 지정하지 않은 경우)
             if args.output_file is None:
                 if start_date == end_date:
@@ -112,15 +253,26 @@ def main():
             if args.output_format == 'csv':
                 saved_file = saver.save_to_csv(reservations, base_filename)
             elif args.output_format == 'excel':
-                saved_file = saver.save_to_excel(reservations, base_filename)
+                saved_file = saver.save_to_excel(reservations, base_filename, split_by=args.excel_split)
             elif args.output_format == 'json':
                 saved_file = saver.save_to_json(reservations, base_filename)
+            elif args.output_format == 'parquet':
+                # 실행마다 새 파일을 만들지 않고 같은 데이터셋의 해당 날짜 파티션만 교체
+                saved_file = saver.save_to_parquet(
+                    reservations, args.output_file or 'reservations', dates=replace_dates
+                )
+            elif args.output_format == 'sqlite':
+                # 예약번호 기준으로 갱신하므로 같은 데이터베이스에 계속 누적
+                saved_file = saver.save_to_sqlite(
+                    reservations, args.output_file or 'reservations.db', dates=replace_dates
+                )
 
             if saved_file:
                 logger.info(f"데이터 저장 완료: {saved_file}")
 
+        if reservations:
             # 요약 통계 저장
-            summary_file = saver.save_summary(reservations)
+            summary_file = saver.save_summary(summary=aggregator.snapshot())
             if summary_file:
                 logger.info(f"요약 통계 저장 완료: {summary_file}")
 
@@ -148,7 +300,7 @@ def main():
                     logger.warning("구글 시트 URL이 설정되지 않았습니다")
 
             # 요약 통계 출력
-            summary = saver.get_summary_statistics(reservations)
+            summary = aggregator.snapshot()
             logger.info("\n" + "=" * 80)
             logger.info("요약 통계")
             logger.info("=" * 80)
@@ -162,6 +314,11 @@ def main():
                 for date, count in sorted(summary['by_date'].items()):
                     logger.info(f"  {date}: {count}건")
 
+            if len(summary.get('by_store', {})) > 1:
+                logger.info("\n상호별 예약 건수:")
+                for store, count in summary['by_store'].items():
+                    logger.info(f"  {store}: {count}건")
+
             if summary.get('by_team'):
                 logger.info("\n팀별 예약 건수:")
                 for team, count in summary['by_team'].items():
@@ -174,11 +331,26 @@ def main():
 
             logger.info("=" * 80)
 
-        else:
+        elif args.stream_only and aggregator.total_count:
+            # 결과를 메모리에 모으지 않아도 요약 통계는 누적되어 있음
+            summary_file = saver.save_summary(summary=aggregator.snapshot())
+            if summary_file:
+                logger.info(f"요약 통계 저장 완료: {summary_file}")
+
+        elif not args.stream_only:
             logger.warning("수집된 예약 정보가 없습니다")
 
+    except KeyboardInterrupt:
+        if checkpoint:
+            checkpoint.finish('interrupted')
+            logger.warning(f"크롤링 중단됨. 이어서 실행: python main.py --resume {checkpoint.run_id}")
+        return 130
+
     except Exception as e:
         logger.error(f"크롤링 중 오류 발생: {e}", exc_info=True)
+        if checkpoint:
+            checkpoint.finish('failed')
+            logger.warning(f"이어서 실행: python main.py --resume {checkpoint.run_id}")
         return 1
 
     finally:
@@ -186,6 +358,14 @@ def main():
         crawler.close()
         logger.info("크롤러 종료")
 
+        if sink:
+            sink.close()
+
+        # 단계별 소요 시간 요약 및 보고서 저장 (중단된 실행 포함)
+        if run_metrics and config.METRICS_ENABLED:
+            run_metrics.log_summary(logger)
+            logger.info(f"단계별 소요 시간 보고서: {run_metrics.save()}")
+
     return 0
 
 
@@ -0,0 +1,246 @@
+"""
+단계별 소요 시간 측정 모듈
+크롤러 단계(setup_driver, login, select_month 등)마다 호출 시간, 횟수, 재시도 횟수를 기록하고
+실행 단위로 단계별/날짜별 p50, p95, 최대값 JSON 보고서를 생성
+"""
+
+import os
+import math
+import json
+import time
+import threading
+from contextlib import contextmanager
+from functools import wraps
+
+import config
+
+
+# 날짜 작업은 슬롯 스레드마다 따로 실행되므로 현재 날짜는 스레드별로 기록
+_context = threading.local()
+
+
+def percentile(values, ratio):
+    """
+    정렬 후 nearest-rank 방식 백분위수
+
+    Args:
+        values (list): 값 리스트
+        ratio (float): 0~1 (0.5는 p50)
+
+    Returns:
+        float: 백분위수 (값이 없으면 0)
+    """
+    if not values:
+        return 0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(ratio * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _stats(values, retries=0, errors=0):
+    """소요 시간 리스트 → 요약 통계"""
+    return {
+        'count': len(values),
+        'errors': errors,
+        'retries': retries,
+        'total': round(sum(values), 3),
+        'p50': round(percentile(values, 0.5), 3),
+        'p95': round(percentile(values, 0.95), 3),
+        'max': round(max(values), 3) if values else 0
+    }
+
+
+class RunMetrics:
+    """실행 단위 단계별 소요 시간 기록 클래스"""
+
+    def __init__(self, run_id=None):
+        """
+        초기화
+
+        Args:
+            run_id (str): 실행 ID (보고서 파일명에 사용)
+        """
+        self.run_id = run_id
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+        self.durations = {}  # 단계 -> [초]
+        self.errors = {}  # 단계 -> 실패 횟수
+        self.retries = {}  # 단계 -> 재시도 횟수
+        self.date_durations = {}  # 날짜 -> 단계 -> [초]
+        self.counters = {}  # 이벤트 -> 횟수 (재시도 예산 사용, 회로 차단 등)
+
+    def record(self, step, duration, target_date=None, error=False):
+        """
+        단계 호출 시간 기록
+
+        Args:
+            step (str): 단계 이름
+            duration (float): 소요 시간(초)
+            target_date (str): 날짜 (없으면 현재 스레드의 날짜)
+            error (bool): 예외로 끝났는지 여부
+        """
+        target_date = target_date or current_date()
+
+        with self._lock:
+            self.durations.setdefault(step, []).append(duration)
+            if error:
+                self.errors[step] = self.errors.get(step, 0) + 1
+            if target_date:
+                self.date_durations.setdefault(target_date, {}).setdefault(step, []).append(duration)
+
+    def record_retry(self, step):
+        """재시도 1회 기록"""
+        with self._lock:
+            self.retries[step] = self.retries.get(step, 0) + 1
+
+    def increment(self, name, count=1):
+        """이벤트 횟수 기록"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + count
+
+    def report(self):
+        """
+        단계별/날짜별 요약 보고서
+
+        Returns:
+            dict: {'run_id', 'elapsed', 'retries', 'counters', 'steps': {단계: 통계}, 'dates': {날짜: {단계: 통계}}}
+        """
+        with self._lock:
+            steps = {
+                step: _stats(values, self.retries.get(step, 0), self.errors.get(step, 0))
+                for step, values in self.durations.items()
+            }
+            # 실행되지 않고 재시도만 기록된 단계
+            for step, count in self.retries.items():
+                steps.setdefault(step, _stats([], count))
+
+            dates = {
+                target_date: {step: _stats(values) for step, values in date_steps.items()}
+                for target_date, date_steps in sorted(self.date_durations.items())
+            }
+            retries = sum(self.retries.values())
+            counters = dict(self.counters)
+
+        return {
+            'run_id': self.run_id,
+            'elapsed': round(time.time() - self.started_at, 3),
+            'retries': retries,
+            'counters': counters,
+            'steps': steps,
+            'dates': dates
+        }
+
+    def save(self, directory=None):
+        """
+        보고서 JSON 저장
+
+        Args:
+            directory (str): 저장 디렉토리 (없으면 config.METRICS_DIR)
+
+        Returns:
+            str: 저장된 파일 경로
+        """
+        directory = directory or config.METRICS_DIR
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        run_id = self.run_id or time.strftime('%Y%m%d_%H%M%S', time.localtime(self.started_at))
+        path = os.path.join(directory, f"metrics_{run_id}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def log_summary(self, logger):
+        """단계별 소요 시간 표 로그 출력"""
+        report = self.report()
+        if not report['steps']:
+            return
+
+        logger.info("단계별 소요 시간 (초)")
+        logger.info(f"  {'단계':<28}{'횟수':>6}{'재시도':>6}{'p50':>9}{'p95':>9}{'최대':>9}{'합계':>10}")
+        for step, stats in sorted(report['steps'].items(), key=lambda item: -item[1]['total']):
+            logger.info(
+                f"  {step:<28}{stats['count']:>6}{stats['retries']:>6}"
+                f"{stats['p50']:>9.3f}{stats['p95']:>9.3f}{stats['max']:>9.3f}{stats['total']:>10.3f}"
+            )
+        if report['retries'] or report['counters']:
+            counters = ', '.join(f"{name} {count}" for name, count in sorted(report['counters'].items()))
+            logger.info(f"  전체 재시도 {report['retries']}회" + (f" ({counters})" if counters else ""))
+
+
+# 현재 실행의 측정값 (진입점에서 start_run()으로 새로 시작)
+_current = RunMetrics()
+
+
+def start_run(run_id=None):
+    """
+    새 실행의 측정 시작
+
+    Args:
+        run_id (str): 실행 ID
+
+    Returns:
+        RunMetrics: 새 측정 객체
+    """
+    global _current
+    _current = RunMetrics(run_id)
+    return _current
+
+
+def current_run():
+    """현재 실행의 측정 객체"""
+    return _current
+
+
+def current_date():
+    """현재 스레드에서 크롤링 중인 날짜"""
+    return getattr(_context, 'date', None)
+
+
+@contextmanager
+def date_scope(target_date):
+    """블록 안에서 기록되는 단계 시간을 해당 날짜로 묶음"""
+    previous = current_date()
+    _context.date = target_date
+    try:
+        yield
+    finally:
+        _context.date = previous
+
+
+@contextmanager
+def timer(step):
+    """블록 실행 시간을 단계 시간으로 기록"""
+    if not config.METRICS_ENABLED:
+        yield
+        return
+
+    started = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        _current.record(step, time.perf_counter() - started, error=error)
+
+
+def timed(step=None):
+    """
+    함수 실행 시간을 단계 시간으로 기록하는 데코레이터
+
+    Args:
+        step (str): 단계 이름 (없으면 함수 이름)
+    """
+    def decorator(func):
+        name = step or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,270 @@
+"""
+네트워크 캡처 모듈
+Chrome DevTools Protocol(CDP) 성능 로그로 사이트의 XHR/fetch JSON 응답을 수집하고
+예약 정보 딕셔너리로 변환
+"""
+
+import re
+import json
+import logging
+
+from utils import RESERVATION_FIELDS, ALL_STORES, clean_field_value, split_stores
+import config
+
+
+# 예약 필드별 JSON 키 후보 (점으로 구분된 경로 허용, 앞의 후보가 우선)
+RESERVATION_JSON_KEYS = {
+    'team': ('team', 'teamName', 'team_name', 'team.name', 'group', 'groupName'),
+    'customer_name': ('customerName', 'customer_name', 'customer.name', 'clientName', 'guestName', 'name'),
+    'reservation_number': ('reservationNumber', 'reservation_number', 'reservationNo', 'bookingNumber',
+                           'bookingNo', 'reservationCode'),
+    'channel': ('channel', 'channelCode', 'channel.code', 'agency', 'agencyCode', 'agency.code'),
+    'people_count': ('peopleCount', 'people_count', 'people', 'pax', 'participants'),
+    'country': ('country', 'countryCode', 'nationality', 'customer.country'),
+    'product': ('product', 'productName', 'product.name', 'tourName'),
+    'time_request': ('timeRequest', 'time_request', 'requestTime', 'time'),
+}
+
+# 상호(스토어) 이름 키 후보
+STORE_JSON_KEYS = ('store', 'storeName', 'store.name', 'shop', 'shopName', 'partner', 'partnerName')
+
+# 인원 구분 객체의 키 → 화면 표기
+PEOPLE_COUNT_LABELS = (
+    (('adult', 'adults', 'ad'), 'Ad'),
+    (('kid', 'kids', 'child', 'children', 'kd'), 'Kd'),
+    (('baby', 'babies', 'infant', 'infants', 'bb'), 'Bb'),
+)
+
+
+def enable_performance_logging(chrome_options):
+    """
+    ChromeOptions에 CDP 성능 로그(네트워크 이벤트) 수집 설정 추가
+
+    Args:
+        chrome_options: selenium ChromeOptions
+    """
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+def _lookup(record, path):
+    """점으로 구분된 경로로 값 조회 (없으면 None)"""
+    value = record
+    for key in path.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def _first_value(record, paths):
+    """후보 경로 중 처음으로 값이 있는 항목 반환"""
+    for path in paths:
+        value = _lookup(record, path)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _format_people_count(value):
+    """인원 정보를 화면과 같은 문자열로 변환"""
+    if isinstance(value, dict):
+        parts = []
+        lowered = {str(k).lower(): v for k, v in value.items()}
+        for keys, label in PEOPLE_COUNT_LABELS:
+            for key in keys:
+                if lowered.get(key):
+                    parts.append(f"{label} {lowered[key]}")
+                    break
+        return ' '.join(parts)
+
+    if isinstance(value, list):
+        return ' '.join(str(item) for item in value)
+
+    return str(value)
+
+
+def _to_text(field, value):
+    """JSON 값을 예약 필드 문자열로 변환"""
+    if value is None:
+        return ''
+
+    if field == 'people_count':
+        return _format_people_count(value).strip()
+
+    if isinstance(value, dict):
+        value = _first_value(value, ('name', 'code', 'label', 'value')) or ''
+
+    return clean_field_value(field, str(value))
+
+
+def _iter_records(payload):
+    """JSON 안에서 예약 레코드로 보이는 객체(예약번호 키가 있는 객체)를 모두 순회"""
+    if isinstance(payload, dict):
+        if _first_value(payload, RESERVATION_JSON_KEYS['reservation_number']) is not None:
+            yield payload
+            return
+        for value in payload.values():
+            yield from _iter_records(value)
+
+    elif isinstance(payload, list):
+        for item in payload:
+            yield from _iter_records(item)
+
+
+def _record_store(record):
+    """레코드의 상호명 (없으면 None)"""
+    value = _first_value(record, STORE_JSON_KEYS)
+    if isinstance(value, dict):
+        value = _first_value(value, ('name',))
+    return None if value is None else str(value)
+
+
+def parse_reservations(payload, target_date, store_name=None):
+    """
+    JSON 응답에서 예약 정보 추출
+
+    Args:
+        payload: JSON 응답 (dict 또는 list)
+        target_date (str): 예약 날짜 (YYYY-MM-DD)
+        store_name (str): 상호명, 쉼표로 구분한 여러 상호명 또는 ALL_STORES
+            (지정하면 상호 정보가 있는 레코드 중 일치하는 것만)
+
+    Returns:
+        list: extract_reservation_details와 같은 형식의 예약 정보 리스트 (store 필드 포함)
+    """
+    stores = split_stores(store_name) if store_name else ALL_STORES
+    # 상호 정보가 없는 레코드는 지정한 상호가 하나일 때 그 상호로 표시
+    default_store = stores[0] if stores != ALL_STORES and len(stores) == 1 else ''
+    reservations = []
+
+    for record in _iter_records(payload):
+        record_store = _record_store(record)
+        if stores != ALL_STORES and record_store is not None and record_store not in stores:
+            continue
+
+        reservation = {'date': target_date, 'store': record_store or default_store}
+        for field in RESERVATION_FIELDS:
+            reservation[field] = _to_text(field, _first_value(record, RESERVATION_JSON_KEYS[field]))
+
+        reservations.append(reservation)
+
+    return reservations
+
+
+class NetworkCapture:
+    """CDP 네트워크 이벤트로 JSON 응답을 수집하는 클래스"""
+
+    def __init__(self, driver, url_patterns=None, log_listener=None):
+        """
+        초기화
+
+        Args:
+            driver: 성능 로그가 활성화된 Chrome WebDriver
+            url_patterns (list): 수집할 응답 URL 정규식 목록 (없으면 config.API_URL_PATTERNS)
+            log_listener (callable): 읽은 성능 로그 message를 함께 전달받을 함수 (트래픽 통계 등)
+        """
+        self.driver = driver
+        self.log_listener = log_listener
+        patterns = config.API_URL_PATTERNS if url_patterns is None else url_patterns
+        self.url_patterns = [re.compile(pattern) for pattern in patterns]
+        self.logger = logging.getLogger(__name__)
+
+    def start(self):
+        """CDP 네트워크 도메인 활성화"""
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.clear()
+        self.logger.info("네트워크 캡처 시작")
+
+    def clear(self):
+        """지금까지 쌓인 성능 로그 비우기"""
+        try:
+            self._read_messages()
+        except Exception as e:
+            self.logger.debug(f"성능 로그 비우기 실패: {e}")
+
+    def _read_messages(self):
+        """
+        성능 로그를 읽어 CDP message 리스트로 변환 (log_listener에도 전달)
+
+        Returns:
+            list: [{'method': str, 'params': dict}, ...]
+        """
+        messages = []
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+
+            if self.log_listener:
+                self.log_listener(message)
+            messages.append(message)
+
+        return messages
+
+    def _matches(self, url):
+        """수집 대상 URL인지 확인"""
+        if not self.url_patterns:
+            return True
+        return any(pattern.search(url) for pattern in self.url_patterns)
+
+    def collect(self):
+        """
+        마지막 호출 이후 완료된 JSON 응답 수집
+
+        Returns:
+            list: [{'url': str, 'status': int, 'body': dict|list}, ...]
+        """
+        pending = {}
+        finished = []
+
+        for message in self._read_messages():
+            method = message.get('method')
+            params = message.get('params', {})
+
+            if method == 'Network.responseReceived':
+                response = params.get('response', {})
+                url = response.get('url', '')
+                if 'json' in response.get('mimeType', '') and self._matches(url):
+                    pending[params.get('requestId')] = {'url': url, 'status': response.get('status')}
+
+            elif method == 'Network.loadingFinished' and params.get('requestId') in pending:
+                finished.append(params['requestId'])
+
+        responses = []
+        for request_id in finished:
+            info = pending[request_id]
+            try:
+                result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                info['body'] = json.loads(result.get('body', ''))
+                responses.append(info)
+            except Exception as e:
+                self.logger.debug(f"응답 본문 읽기 실패 ({info['url']}): {e}")
+
+        self.logger.info(f"네트워크 응답 수집: {len(responses)}건")
+        return responses
+
+    def collect_reservations(self, target_date, store_name=None):
+        """
+        수집된 JSON 응답에서 예약 정보 추출
+
+        Args:
+            target_date (str): 예약 날짜 (YYYY-MM-DD)
+            store_name (str): 상호명, 쉼표로 구분한 여러 상호명 또는 ALL_STORES
+
+        Returns:
+            list: 예약 정보 리스트 (예약번호 기준 중복 제거)
+        """
+        reservations = []
+        seen = set()
+
+        for response in self.collect():
+            for reservation in parse_reservations(response['body'], target_date, store_name):
+                key = reservation['reservation_number']
+                if key:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                reservations.append(reservation)
+
+        return reservations
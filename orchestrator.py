@@ -0,0 +1,393 @@
+"""
+크롤링 오케스트레이터 모듈
+(상호, 날짜)마다 작업을 만들고, 정해진 수의 브라우저/HTTP 슬롯에서 asyncio로 동시에 실행
+사이트로 보내는 작업 시작 횟수를 전역으로 제한하고, 끝난 작업 결과를 바로 전달
+연속 실패가 이어지면 회로 차단기에 따라 작업 시작을 멈추거나 남은 작업을 실패로 처리하고 중단
+"""
+
+import asyncio
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from http_crawler import HttpReservationCrawler
+from resilience import CircuitBreaker, CircuitOpenError, current_budget
+from metrics import current_run
+import config
+
+
+class CrawlTask:
+    """(상호, 날짜) 크롤링 작업"""
+
+    def __init__(self, store_name, date, priority=0):
+        """
+        초기화
+
+        Args:
+            store_name (str): 상호명, 쉼표로 구분한 여러 상호명 또는 ALL_STORES (날짜 한 번 선택으로 모두 수집)
+            date (str): 날짜 (YYYY-MM-DD)
+            priority (int): 우선순위 (작을수록 먼저 실행)
+        """
+        self.store_name = store_name
+        self.date = date
+        self.priority = priority
+
+    def __repr__(self):
+        return f"CrawlTask({self.store_name!r}, {self.date!r})"
+
+
+class CrawlResult:
+    """작업 결과"""
+
+    def __init__(self, task, reservations, success, error=None):
+        self.task = task
+        self.reservations = reservations
+        self.success = success
+        self.error = error
+        self.empty = success and not reservations  # 예약이 없는 날짜 (실패와 구분)
+
+    @property
+    def date(self):
+        return self.task.date
+
+    @property
+    def store_name(self):
+        return self.task.store_name
+
+
+class RateLimiter:
+    """전역 작업 시작 간격 제한 (초당 rate회)"""
+
+    def __init__(self, rate):
+        """
+        초기화
+
+        Args:
+            rate (float): 초당 최대 작업 시작 수 (0 또는 None이면 제한 없음)
+        """
+        self.interval = 1.0 / rate if rate else 0
+        self._next_time = 0
+
+    async def acquire(self):
+        """다음 작업을 시작해도 될 때까지 대기 (이벤트 루프 안에서만 호출되므로 잠금 불필요)"""
+        if not self.interval:
+            return
+
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_time)
+        self._next_time = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class BrowserSlot:
+    """브라우저 한 개로 작업을 실행하는 슬롯"""
+
+    def __init__(self, crawler=None, crawler_factory=None, sink=None):
+        """
+        초기화
+
+        Args:
+            crawler (KTourCrawler): 사용할 크롤러 (호출한 쪽에서 종료)
+            crawler_factory (callable): 크롤러 생성 함수 (슬롯이 로그인과 종료까지 담당)
+            sink (ReservationSink): 크롤러가 예약 정보를 추출할 때마다 전달할 저장소 (슬롯 간 공유)
+        """
+        self.crawler = crawler
+        self.crawler_factory = crawler_factory
+        self.sink = sink
+        self.owns_crawler = crawler is None
+        self._used = False
+
+    def open(self):
+        """크롤러 준비 (브라우저 실행 및 로그인이 안 되어 있으면 수행)"""
+        if self.crawler is None:
+            self.crawler = self.crawler_factory()
+        if self.sink:
+            self.crawler.sink = self.sink
+
+        if self.crawler.driver is None:
+            self.crawler.setup_driver()
+            self.crawler.login()
+
+    def crawl(self, task):
+        """
+        작업 실행
+
+        Args:
+            task (CrawlTask): 작업
+
+        Returns:
+            tuple: (예약 정보 리스트, 성공 여부)
+        """
+        # 첫 작업이 아니면 메인 페이지로 이동하여 상태 초기화
+        if self._used:
+            self.crawler.return_to_main_page()
+        self._used = True
+
+        success = self.crawler.crawl_date(task.date, task.store_name)
+        return list(self.crawler.date_reservations), success
+
+    def close(self):
+        """슬롯이 만든 크롤러 종료"""
+        if self.owns_crawler and self.crawler:
+            self.crawler.close()
+
+
+class HttpSlot:
+    """데이터 API로 작업을 실행하는 슬롯 (실패하면 브라우저 슬롯으로 대체)"""
+
+    def __init__(self, http_crawler, fallback=None, fallback_lock=None, sink=None):
+        """
+        초기화
+
+        Args:
+            http_crawler (HttpReservationCrawler): HTTP 크롤러 (슬롯 간 공유, 슬롯 종료 시 세션 종료)
+            fallback (BrowserSlot): HTTP 조회 실패 시 사용할 브라우저 슬롯
+            fallback_lock (threading.Lock): 대체 브라우저 슬롯 공유용 잠금
+            sink (ReservationSink): 조회한 예약 정보를 전달할 저장소 (대체 브라우저 슬롯은 크롤러가 직접 전달)
+        """
+        self.http_crawler = http_crawler
+        self.fallback = fallback
+        self.fallback_lock = fallback_lock or threading.Lock()
+        self.sink = sink
+        self.logger = logging.getLogger(__name__)
+
+    def open(self):
+        pass
+
+    def crawl(self, task):
+        """
+        작업 실행
+
+        Args:
+            task (CrawlTask): 작업
+
+        Returns:
+            tuple: (예약 정보 리스트, 성공 여부)
+        """
+        try:
+            reservations = self.http_crawler.fetch_date(task.date, task.store_name)
+        except (requests.RequestException, ValueError) as e:
+            self.logger.error(f"HTTP 조회 실패 ({task.date}): {e}")
+            if not self.fallback:
+                return [], False
+        else:
+            if self.sink:
+                self.sink.write_many(reservations)
+                self.sink.flush()
+            return reservations, True
+
+        self.logger.warning(f"HTTP 조회 실패 날짜를 브라우저로 재시도: {task.date}")
+        with self.fallback_lock:
+            return self.fallback.crawl(task)
+
+    def close(self):
+        """HTTP 세션 종료 (슬롯끼리 공유하므로 여러 번 호출되어도 안전)"""
+        self.http_crawler.close()
+
+
+def build_slots(crawler, backend='browser', workers=1, crawler_factory=None, sink=None):
+    """
+    실행 방식에 맞는 슬롯 목록 생성
+
+    Args:
+        crawler (KTourCrawler): 첫 번째 슬롯(또는 HTTP 로그인/대체용)으로 사용할 크롤러
+        backend (str): browser, http
+        workers (int): 브라우저 슬롯 수
+        crawler_factory (callable): 추가 브라우저 슬롯용 크롤러 생성 함수
+        sink (ReservationSink): 예약 정보를 추출할 때마다 전달할 저장소 (모든 슬롯이 공유)
+
+    Returns:
+        list: 슬롯 리스트
+    """
+    logger = logging.getLogger(__name__)
+    primary = BrowserSlot(crawler, sink=sink)
+
+    if backend == 'http':
+        if config.API_RESERVATIONS_URL:
+            primary.open()
+            http_crawler = HttpReservationCrawler.from_crawler(crawler)
+            lock = threading.Lock()
+            return [HttpSlot(http_crawler, primary, lock, sink) for _ in range(http_crawler.workers)]
+
+        logger.warning("API_RESERVATIONS_URL이 설정되지 않아 브라우저로 크롤링합니다")
+
+    slots = [primary]
+    for _ in range(max(1, int(workers)) - 1):
+        slots.append(BrowserSlot(crawler_factory=crawler_factory, sink=sink))
+    return slots
+
+
+class CrawlOrchestrator:
+    """슬롯 기반 비동기 크롤링 스케줄러 클래스"""
+
+    def __init__(self, slots, rate_limit=None, breaker=None):
+        """
+        초기화
+
+        Args:
+            slots (list): BrowserSlot/HttpSlot 리스트 (슬롯마다 동시에 한 작업씩 실행)
+            rate_limit (float): 초당 최대 작업 시작 수 (없으면 config.SITE_RATE_LIMIT)
+            breaker (CircuitBreaker): 회로 차단기 (없으면 config 값과 현재 실행의 재시도 예산으로 생성)
+        """
+        self.slots = list(slots)
+        self.rate_limiter = RateLimiter(config.SITE_RATE_LIMIT if rate_limit is None else rate_limit)
+        self.breaker = breaker or CircuitBreaker(budget=current_budget())
+        self.logger = logging.getLogger(__name__)
+
+    async def stream(self, tasks):
+        """
+        작업을 실행하며 끝나는 순서대로 결과 전달
+
+        Args:
+            tasks (list): CrawlTask 리스트
+
+        Yields:
+            CrawlResult: 작업 결과
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return
+
+        queue = asyncio.PriorityQueue()
+        for order, task in enumerate(tasks):
+            queue.put_nowait((task.priority, order, task))
+
+        results = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=len(self.slots), thread_name_prefix='crawl-slot')
+        active = [len(self.slots)]
+
+        self.logger.info(f"오케스트레이터 시작: 슬롯 {len(self.slots)}개, 작업 {len(tasks)}개")
+
+        async def run_slot(slot_id, slot):
+            try:
+                try:
+                    await loop.run_in_executor(executor, slot.open)
+                except Exception as e:
+                    self.logger.error(f"슬롯 {slot_id} 시작 실패: {e}")
+                    return
+
+                while True:
+                    # 회로가 열려 있으면 재개 시각까지 작업 시작 보류
+                    if self.breaker.aborted:
+                        return
+                    pause = self.breaker.pause_remaining()
+                    if pause:
+                        await asyncio.sleep(pause)
+                        continue
+
+                    try:
+                        _, _, task = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+
+                    await self.rate_limiter.acquire()
+                    try:
+                        reservations, success = await loop.run_in_executor(executor, slot.crawl, task)
+                        result = CrawlResult(task, reservations, success)
+                    except Exception as e:
+                        self.logger.error(f"슬롯 {slot_id}: {task.date} 처리 실패: {e}")
+                        result = CrawlResult(task, [], False, e)
+
+                    self.breaker.record(result.success)
+                    await results.put(result)
+            finally:
+                # 마지막 슬롯이 끝났는데 남은 작업이 있으면(모든 슬롯 시작 실패, 회로 차단 등) 실패로 처리
+                active[0] -= 1
+                if active[0] == 0:
+                    error = CircuitOpenError(self.breaker.abort_reason) if self.breaker.aborted else None
+                    while not queue.empty():
+                        _, _, task = queue.get_nowait()
+                        await results.put(CrawlResult(task, [], False, error))
+
+        runners = [asyncio.ensure_future(run_slot(i, slot)) for i, slot in enumerate(self.slots, 1)]
+
+        try:
+            for _ in range(len(tasks)):
+                yield await results.get()
+        finally:
+            for runner in runners:
+                runner.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, tasks, on_result=None):
+        """
+        작업을 모두 실행 (동기 호출용)
+
+        Args:
+            tasks (list): CrawlTask 리스트
+            on_result (callable): 작업이 끝날 때마다 CrawlResult를 받아 호출
+
+        Returns:
+            list: 작업 순서대로 정렬된 CrawlResult 리스트
+        """
+        tasks = list(tasks)
+
+        async def consume():
+            collected = {}
+            async for result in self.stream(tasks):
+                collected[id(result.task)] = result
+                if on_result:
+                    on_result(result)
+            return collected
+
+        try:
+            collected = asyncio.run(consume())
+        finally:
+            for slot in self.slots:
+                try:
+                    slot.close()
+                except Exception as e:
+                    self.logger.debug(f"슬롯 종료 실패: {e}")
+
+        return [collected[id(task)] for task in tasks if id(task) in collected]
+
+
+def crawl_with_orchestrator(slots, store_name, dates, on_result=None, rate_limit=None, breaker=None,
+                            keep_results=True):
+    """
+    (상호, 날짜) 작업을 슬롯들로 실행하여 날짜 순서대로 병합
+
+    Args:
+        slots (list): 슬롯 리스트 (build_slots 참고)
+        store_name (str): 상호명, 쉼표로 구분한 여러 상호명 또는 ALL_STORES
+        dates (list): 날짜 리스트 (YYYY-MM-DD)
+        on_result (callable): 작업이 끝날 때마다 CrawlResult를 받아 호출
+        rate_limit (float): 초당 최대 작업 시작 수
+        breaker (CircuitBreaker): 회로 차단기
+        keep_results (bool): 예약 정보를 모아서 반환할지 여부 (False면 빈 리스트 반환, build_slots의 sink로만 저장)
+
+    Returns:
+        tuple: (예약 정보 리스트, 실패 날짜 리스트)
+    """
+    tasks = [CrawlTask(store_name, target_date) for target_date in dates]
+
+    empty_dates = []
+
+    def handle_result(result):
+        if result.empty:
+            empty_dates.append(result.date)
+            current_run().increment('empty_dates')
+        if on_result:
+            on_result(result)
+        if not keep_results:
+            result.reservations = []
+
+    results = CrawlOrchestrator(slots, rate_limit, breaker).run(tasks, handle_result)
+
+    reservations = []
+    failed_dates = []
+    for result in results:
+        reservations.extend(result.reservations)
+        if not result.success:
+            failed_dates.append(result.date)
+
+    if empty_dates:
+        logging.getLogger(__name__).info(
+            f"예약 없는 날짜 {len(empty_dates)}개 (실패 아님): {', '.join(sorted(empty_dates))}"
+        )
+
+    return reservations, failed_dates
@@ -0,0 +1,166 @@
+"""
+SQLite 예약 저장소 모듈
+실행마다 흩어지는 출력 파일 대신, 예약번호 기준으로 최신 상태를 유지하는 내장 데이터베이스
+"""
+
+import os
+import sqlite3
+import threading
+import logging
+from datetime import datetime
+
+import config
+from utils import RESERVATION_FIELDS
+
+
+# 저장/조회 컬럼 (크롤러가 만드는 예약 정보와 같은 순서)
+COLUMNS = ('date', 'store') + RESERVATION_FIELDS
+
+# 조회 조건으로 자주 쓰는 컬럼 (인덱스 생성)
+INDEXED_COLUMNS = ('date', 'store', 'team', 'channel', 'country')
+
+
+class ReservationStore:
+    """SQLite 예약 저장소 클래스 (웹 앱 스레드에서도 쓰므로 잠금 사용)"""
+
+    def __init__(self, path=None):
+        """
+        초기화
+
+        Args:
+            path (str): 데이터베이스 파일 경로 (없으면 config.RESERVATION_DB_FILE)
+        """
+        self.path = path or config.RESERVATION_DB_FILE
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        """테이블/인덱스 생성 (WAL 모드: 크롤링 중에도 다른 프로세스가 읽기 가능)"""
+        with self._lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            columns = ', '.join(f"{column} TEXT" for column in COLUMNS)
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS reservations ("
+                f"id INTEGER PRIMARY KEY, record_key TEXT NOT NULL UNIQUE, {columns}, updated_at TEXT)"
+            )
+            for column in INDEXED_COLUMNS:
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_reservations_{column} ON reservations ({column})"
+                )
+
+    @staticmethod
+    def record_key(reservation):
+        """
+        예약 정보의 고유 키
+        예약번호가 있으면 예약번호, 없으면 날짜+상호+팀+고객명
+
+        Args:
+            reservation (dict): 예약 정보
+
+        Returns:
+            str: 고유 키
+        """
+        number = reservation.get('reservation_number')
+        if number:
+            return f"no|{number}"
+        return '|'.join(
+            ['key'] + [str(reservation.get(field) or '') for field in ('date', 'store', 'team', 'customer_name')]
+        )
+
+    def upsert(self, reservations, replace_dates=None):
+        """
+        예약 정보 저장 (같은 키가 있으면 최신 내용으로 갱신)
+
+        Args:
+            reservations (list): 예약 정보 리스트
+            replace_dates (list): 날짜 단위로 교체할 날짜 (이번 예약 정보에 없는 기존 예약은 삭제)
+
+        Returns:
+            int: 저장한 건수
+        """
+        updated_at = datetime.now().isoformat(timespec='seconds')
+        # 크롤러와 같이 값이 없는 필드는 빈 문자열로 저장
+        rows = [
+            (self.record_key(r),)
+            + tuple('' if r.get(column) is None else r[column] for column in COLUMNS)
+            + (updated_at,)
+            for r in reservations
+        ]
+
+        placeholders = ', '.join('?' for _ in range(len(COLUMNS) + 2))
+        updates = ', '.join(f"{column}=excluded.{column}" for column in COLUMNS + ('updated_at',))
+        with self._lock, self.conn:
+            if replace_dates:
+                self.conn.executemany(
+                    "DELETE FROM reservations WHERE date = ?", [(d,) for d in replace_dates]
+                )
+            self.conn.executemany(
+                f"INSERT INTO reservations (record_key, {', '.join(COLUMNS)}, updated_at) "
+                f"VALUES ({placeholders}) ON CONFLICT(record_key) DO UPDATE SET {updates}",
+                rows
+            )
+        return len(rows)
+
+    def query(self, start_date=None, end_date=None, stores=None, team=None, channel=None, country=None):
+        """
+        예약 정보 조회 (조건은 모두 AND, 날짜/상호 순)
+
+        Args:
+            start_date (str): 시작 날짜 (YYYY-MM-DD)
+            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            stores (list): 상호 목록
+            team (str): 팀
+            channel (str): 채널 약자
+            country (str): 국가
+
+        Returns:
+            list: 크롤러와 같은 형식의 예약 정보 딕셔너리 리스트
+        """
+        conditions = []
+        params = []
+        if start_date:
+            conditions.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            conditions.append("date <= ?")
+            params.append(end_date)
+        if stores:
+            conditions.append(f"store IN ({', '.join('?' for _ in stores)})")
+            params.extend(stores)
+        for column, value in (('team', team), ('channel', channel), ('country', country)):
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        sql = f"SELECT {', '.join(COLUMNS)} FROM reservations"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY date, store, id"
+
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def count(self):
+        """저장된 예약 건수"""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM reservations").fetchone()[0]
+
+    def close(self):
+        """데이터베이스 닫기"""
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,147 @@
+"""
+재시도 예산 및 회로 차단기 모듈
+실행 전체에서 공유하는 재시도 횟수 상한과, 연속 실패가 이어지면 크롤링을 잠시 멈추거나 중단하는 회로 차단기
+"""
+
+import time
+import threading
+import logging
+
+import config
+from metrics import current_run
+
+
+class CircuitOpenError(Exception):
+    """회로 차단기가 크롤링을 중단했을 때 남은 작업에 기록되는 예외"""
+    pass
+
+
+class RetryBudget:
+    """실행 전체가 공유하는 재시도 횟수 예산 (여러 슬롯 스레드에서 호출)"""
+
+    def __init__(self, limit):
+        """
+        초기화
+
+        Args:
+            limit (int): 실행 전체 최대 재시도 횟수 (0 또는 None이면 제한 없음)
+        """
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def consume(self):
+        """
+        재시도 1회 사용
+
+        Returns:
+            bool: 재시도 가능 여부 (예산이 남아 있으면 True)
+        """
+        with self._lock:
+            if self.limit and self.used >= self.limit:
+                return False
+            self.used += 1
+
+        current_run().increment('retry_budget_used')
+        return True
+
+    @property
+    def exhausted(self):
+        return bool(self.limit) and self.used >= self.limit
+
+    @property
+    def remaining(self):
+        return max(0, self.limit - self.used) if self.limit else None
+
+
+class CircuitBreaker:
+    """연속 실패 시 작업 시작을 멈추고, 반복되면 크롤링을 중단하는 회로 차단기"""
+
+    def __init__(self, failure_threshold=None, cooldown=None, max_pauses=None, budget=None):
+        """
+        초기화
+
+        Args:
+            failure_threshold (int): 회로를 여는 연속 실패 작업 수 (0이면 사용 안 함)
+            cooldown (float): 회로가 열렸을 때 작업 시작을 멈추는 시간(초)
+            max_pauses (int): 허용하는 일시 정지 횟수 (초과하면 크롤링 중단)
+            budget (RetryBudget): 소진되면 크롤링을 중단할 재시도 예산
+        """
+        self.failure_threshold = config.CIRCUIT_FAILURE_THRESHOLD if failure_threshold is None else failure_threshold
+        self.cooldown = config.CIRCUIT_COOLDOWN if cooldown is None else cooldown
+        self.max_pauses = config.CIRCUIT_MAX_PAUSES if max_pauses is None else max_pauses
+        self.budget = budget
+
+        self.consecutive_failures = 0
+        self.pauses = 0
+        self.open_until = 0
+        self.abort_reason = None
+        self.logger = logging.getLogger(__name__)
+
+    def record(self, success):
+        """
+        작업 결과 기록
+
+        Args:
+            success (bool): 작업 성공 여부
+        """
+        if success:
+            self.consecutive_failures = 0
+            return
+
+        self.consecutive_failures += 1
+        if not self.failure_threshold or self.consecutive_failures < self.failure_threshold:
+            return
+
+        if self.pauses >= self.max_pauses:
+            self._abort(f"연속 {self.consecutive_failures}개 작업 실패")
+            return
+
+        self.pauses += 1
+        self.open_until = time.monotonic() + self.cooldown
+        # 재개 후 첫 작업이 또 실패하면 바로 다시 열림 (half-open)
+        self.consecutive_failures = self.failure_threshold - 1
+        current_run().increment('circuit_pauses')
+        self.logger.warning(
+            f"연속 실패로 {self.cooldown}초 동안 크롤링 일시 정지 ({self.pauses}/{self.max_pauses})"
+        )
+
+    def pause_remaining(self):
+        """작업 시작을 기다려야 하는 남은 시간(초)"""
+        return max(0, self.open_until - time.monotonic())
+
+    @property
+    def aborted(self):
+        """크롤링 중단 여부"""
+        if self.abort_reason is None and self.budget is not None and self.budget.exhausted:
+            self._abort(f"재시도 예산 소진 ({self.budget.used}회)")
+        return self.abort_reason is not None
+
+    def _abort(self, reason):
+        self.abort_reason = reason
+        current_run().increment('circuit_aborts')
+        self.logger.error(f"회로 차단: {reason}, 남은 작업을 실패로 처리하고 크롤링 중단")
+
+
+# 현재 실행의 재시도 예산 (진입점에서 start_run()으로 새로 시작)
+_budget = RetryBudget(None)
+
+
+def start_run(limit=None):
+    """
+    새 실행의 재시도 예산 시작
+
+    Args:
+        limit (int): 실행 전체 최대 재시도 횟수 (없으면 config.RETRY_BUDGET)
+
+    Returns:
+        RetryBudget: 새 예산
+    """
+    global _budget
+    _budget = RetryBudget(config.RETRY_BUDGET if limit is None else limit)
+    return _budget
+
+
+def current_budget():
+    """현재 실행의 재시도 예산"""
+    return _budget
@@ -0,0 +1,140 @@
+"""
+로그인 세션 캐시 모듈
+로그인 후 쿠키/localStorage를 디스크에 저장하고 다음 실행 시 복원
+"""
+
+import os
+import json
+import time
+import logging
+
+import config
+
+
+class SessionStore:
+    """로그인 세션 저장소 클래스"""
+
+    def __init__(self, path=None, max_age=None):
+        """
+        초기화
+
+        Args:
+            path (str): 세션 파일 경로 (없으면 config.SESSION_FILE)
+            max_age (int): 세션 최대 보관 시간(초) (없으면 config.SESSION_MAX_AGE)
+        """
+        self.path = path or config.SESSION_FILE
+        self.max_age = config.SESSION_MAX_AGE if max_age is None else max_age
+        self.logger = logging.getLogger(__name__)
+
+    def save(self, driver):
+        """
+        현재 브라우저의 인증 상태(쿠키, localStorage) 저장
+
+        Args:
+            driver: Selenium WebDriver
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            session = {
+                'base_url': config.BASE_URL,
+                'saved_at': time.time(),
+                'cookies': driver.get_cookies(),
+                'local_storage': driver.execute_script(
+                    'return Object.assign({}, window.localStorage);'
+                ) or {}
+            }
+
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            # 인증 정보이므로 소유자만 읽을 수 있도록 저장
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(session, f, ensure_ascii=False)
+
+            self.logger.info(f"로그인 세션 저장 완료: {self.path}")
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"로그인 세션 저장 실패: {e}")
+            return False
+
+    def load(self):
+        """
+        저장된 세션 읽기
+
+        Returns:
+            dict: 세션 정보 (없거나 만료/불일치 시 None)
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"로그인 세션 파일 읽기 실패: {e}")
+            return None
+
+        if session.get('base_url') != config.BASE_URL:
+            self.logger.info("저장된 세션의 사이트가 다릅니다")
+            return None
+
+        if self.max_age and time.time() - session.get('saved_at', 0) > self.max_age:
+            self.logger.info("저장된 세션이 만료되었습니다")
+            return None
+
+        return session
+
+    def restore(self, driver):
+        """
+        저장된 세션을 브라우저에 복원 (검증은 호출자가 수행)
+
+        Args:
+            driver: Selenium WebDriver
+
+        Returns:
+            bool: 복원 시도 여부 (저장된 세션이 없으면 False)
+        """
+        session = self.load()
+        if not session:
+            return False
+
+        try:
+            # 쿠키를 설정하려면 먼저 해당 도메인에 접속해야 함
+            driver.get(config.BASE_URL)
+
+            for cookie in session.get('cookies', []):
+                cookie = dict(cookie)
+                # sameSite 값이 비표준이면 add_cookie가 실패하므로 제거
+                if cookie.get('sameSite') not in ('Strict', 'Lax', 'None'):
+                    cookie.pop('sameSite', None)
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as e:
+                    self.logger.debug(f"쿠키 복원 실패 ({cookie.get('name')}): {e}")
+
+            local_storage = session.get('local_storage', {})
+            if local_storage:
+                driver.execute_script(
+                    'for (const [k, v] of Object.entries(arguments[0])) {'
+                    ' window.localStorage.setItem(k, v); }',
+                    local_storage
+                )
+
+            driver.refresh()
+            self.logger.info("저장된 로그인 세션 복원")
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"로그인 세션 복원 실패: {e}")
+            return False
+
+    def clear(self):
+        """저장된 세션 삭제"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+            self.logger.info(f"로그인 세션 삭제: {self.path}")
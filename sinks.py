@@ -0,0 +1,160 @@
+"""
+예약 정보 스트리밍 저장 모듈
+크롤링 중 예약 정보가 추출될 때마다 파일(NDJSON/CSV)이나 콜백으로 바로 전달
+날짜가 끝날 때마다 flush하므로 실행 중에도 결과를 tail로 확인 가능
+"""
+
+import os
+import csv
+import json
+import threading
+
+from utils import RESERVATION_FIELDS
+
+
+# CSV 출력 컬럼 순서
+CSV_COLUMNS = ('date', 'store') + RESERVATION_FIELDS
+
+
+class ReservationSink:
+    """예약 정보 스트리밍 저장 기본 클래스 (여러 슬롯 스레드에서 호출되므로 잠금 사용)"""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def write(self, reservation):
+        """
+        예약 정보 1건 전달
+
+        Args:
+            reservation (dict): 예약 정보
+        """
+        with self._lock:
+            self._write(reservation)
+            self.count += 1
+
+    def write_many(self, reservations):
+        """예약 정보 여러 건 전달"""
+        with self._lock:
+            for reservation in reservations:
+                self._write(reservation)
+                self.count += 1
+
+    def flush(self):
+        """지금까지 전달된 예약 정보를 저장소에 반영 (날짜가 끝날 때마다 호출)"""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """저장 종료"""
+        with self._lock:
+            self._flush()
+            self._close()
+
+    def _write(self, reservation):
+        raise NotImplementedError
+
+    def _flush(self):
+        pass
+
+    def _close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class NdjsonSink(ReservationSink):
+    """한 줄에 예약 1건씩 JSON으로 추가하는 파일 저장"""
+
+    def __init__(self, path):
+        """
+        초기화
+
+        Args:
+            path (str): 파일 경로 (있으면 이어서 추가)
+        """
+        super().__init__()
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _write(self, reservation):
+        self._file.write(json.dumps(reservation, ensure_ascii=False) + '\n')
+
+    def _flush(self):
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class CsvSink(ReservationSink):
+    """예약 정보를 CSV 행으로 추가하는 파일 저장 (Excel 호환 UTF-8 BOM)"""
+
+    def __init__(self, path, columns=CSV_COLUMNS):
+        """
+        초기화
+
+        Args:
+            path (str): 파일 경로 (있으면 헤더 없이 이어서 추가)
+            columns (tuple): 컬럼 순서 (그 외 필드는 무시)
+        """
+        super().__init__()
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'a', encoding='utf-8' if exists else 'utf-8-sig', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=list(columns), extrasaction='ignore')
+        if not exists:
+            self._writer.writeheader()
+
+    def _write(self, reservation):
+        self._writer.writerow(reservation)
+
+    def _flush(self):
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class CallbackSink(ReservationSink):
+    """예약 정보를 함수로 전달"""
+
+    def __init__(self, callback):
+        """
+        초기화
+
+        Args:
+            callback (callable): 예약 정보(dict)를 받아 호출
+        """
+        super().__init__()
+        self.callback = callback
+
+    def _write(self, reservation):
+        self.callback(reservation)
+
+
+def open_sink(path):
+    """
+    확장자에 맞는 파일 저장 생성
+
+    Args:
+        path (str): .csv 또는 .ndjson/.jsonl 파일 경로
+
+    Returns:
+        ReservationSink: CsvSink 또는 NdjsonSink
+    """
+    if path.lower().endswith('.csv'):
+        return CsvSink(path)
+    return NdjsonSink(path)
@@ -0,0 +1,94 @@
+"""
+예약 요약 통계 집계 모듈
+예약 정보가 추출될 때마다 건수를 더해 두므로, 결과 크기와 무관하게 크롤링 중에도 요약 통계를 바로 조회 가능
+"""
+
+import threading
+from collections import Counter
+
+
+# 건수를 세는 필드 (요약 통계 키: by_<필드>)
+SUMMARY_FIELDS = ('date', 'store', 'team', 'channel', 'country')
+
+
+class SummaryAggregator:
+    """예약 요약 통계 누적 집계 클래스 (슬롯 스레드와 웹 요청 스레드에서 함께 쓰므로 잠금 사용)"""
+
+    def __init__(self, reservations=None):
+        """
+        초기화
+
+        Args:
+            reservations (iterable): 처음부터 집계할 예약 정보
+        """
+        self.total_count = 0
+        self.counts = {field: Counter() for field in SUMMARY_FIELDS}
+        self._lock = threading.Lock()
+
+        if reservations:
+            self.add_many(reservations)
+
+    def add(self, reservation):
+        """
+        예약 정보 1건 집계
+
+        Args:
+            reservation (dict): 예약 정보
+        """
+        with self._lock:
+            self._add(reservation)
+
+    def add_many(self, reservations):
+        """예약 정보 여러 건 집계"""
+        with self._lock:
+            for reservation in reservations:
+                self._add(reservation)
+
+    def _add(self, reservation):
+        self.total_count += 1
+        for field in SUMMARY_FIELDS:
+            # 값이 없는 필드는 세지 않음 (pandas groupby와 같음)
+            value = reservation.get(field)
+            if value is not None:
+                self.counts[field][value] += 1
+
+    def merge(self, other):
+        """
+        다른 집계 결과 합치기 (병렬 작업자별 집계를 모을 때 사용)
+
+        Args:
+            other (SummaryAggregator): 합칠 집계
+
+        Returns:
+            SummaryAggregator: 자기 자신
+        """
+        with other._lock:
+            total_count = other.total_count
+            counts = {field: Counter(counter) for field, counter in other.counts.items()}
+
+        with self._lock:
+            self.total_count += total_count
+            for field, counter in counts.items():
+                self.counts[field].update(counter)
+        return self
+
+    def snapshot(self):
+        """
+        현재까지의 요약 통계 (DataSaver.get_summary_statistics와 같은 형식)
+        예약 건수가 아니라 서로 다른 값의 수에만 비례하므로 크롤링 중에 자주 호출해도 됨
+
+        Returns:
+            dict: 통계 정보
+        """
+        with self._lock:
+            dates = self.counts['date']
+            summary = {
+                'total_count': self.total_count,
+                'date_range': {
+                    'start': min(dates) if dates else None,
+                    'end': max(dates) if dates else None
+                },
+            }
+            for field in SUMMARY_FIELDS:
+                summary[f"by_{field}"] = dict(sorted(self.counts[field].items()))
+        return summary
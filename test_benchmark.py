@@ -0,0 +1,112 @@
+"""
+벤치마크용 대체 사이트 테스트 스크립트
+대체 사이트의 로그인/예약 API를 HTTP 크롤러로 확인하고, Chrome이 있으면 짧은 벤치마크를 실행
+"""
+
+import sys
+
+
+def test_fake_site_api():
+    """대체 사이트 로그인 후 HTTP 슬롯으로 예약 조회 테스트"""
+    print("=" * 60)
+    print("1. 대체 사이트 API 테스트")
+    print("=" * 60)
+
+    import requests
+    from fake_ktour_site import FakeKTourSite
+    from http_crawler import HttpReservationCrawler
+    from orchestrator import HttpSlot, crawl_with_orchestrator
+
+    site = FakeKTourSite(teams_per_day=4, empty_every=3)
+    site.start()
+
+    try:
+        # 로그인 폼 제출로 세션 쿠키 발급
+        session = requests.Session()
+        session.post(site.url + 'login', data={'email': 'a@example.com', 'password': 'pw'})
+        cookies = [{'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path} for c in session.cookies]
+
+        http_crawler = HttpReservationCrawler(cookies, endpoint=site.api_url, workers=2, store_name=site.store_name)
+        closed = []
+        close_session = http_crawler.close
+        http_crawler.close = lambda: (closed.append(True), close_session())
+
+        dates = ['2025-12-01', '2025-12-02', '2025-12-03']
+        slots = [HttpSlot(http_crawler) for _ in range(http_crawler.workers)]
+        reservations, failed = crawl_with_orchestrator(slots, site.store_name, dates, rate_limit=0)
+
+        expected = site.expected_reservations(dates)
+        assert len(reservations) == expected and not failed, \
+            f"예약 수 불일치: {len(reservations)}/{expected}건, 실패 {failed}"
+
+        # 오케스트레이터가 끝나면 슬롯 종료와 함께 HTTP 세션도 닫혀야 함
+        assert closed, "HTTP 세션이 닫히지 않음"
+
+        print(f"[OK] 대체 사이트에서 {len(reservations)}건 조회")
+
+    finally:
+        site.stop()
+
+
+def _browser_available():
+    """WebDriver를 실제로 시작할 수 있는지 확인 (Chrome/ChromeDriver가 없으면 False)"""
+    from crawler import KTourCrawler
+
+    crawler = KTourCrawler(headless=True, use_session_cache=False)
+    try:
+        crawler.setup_driver()
+        return True
+    except Exception:
+        return False
+    finally:
+        crawler.close()
+
+
+def test_benchmark_run():
+    """대체 사이트에서 브라우저 크롤링 벤치마크 테스트 (Chrome 필요)"""
+    print("\n" + "=" * 60)
+    print("2. 브라우저 벤치마크 테스트")
+    print("=" * 60)
+
+    from benchmark import run_benchmark
+
+    if not _browser_available():
+        print("[SKIP] WebDriver를 시작할 수 없음 (Chrome 미설치)")
+        return
+
+    result = run_benchmark(['2025-12-05', '2025-12-06'], teams_per_day=3, render_delay=0.05)
+
+    assert result['reservations'] == result['expected_reservations'] and not result['failed_dates'], \
+        f"수집 결과 불일치: {result['reservations']}/{result['expected_reservations']}건"
+
+    print(f"[OK] {result['dates_per_minute']} 날짜/분, {result['reservations_per_minute']} 예약/분")
+
+
+def main():
+    """모든 테스트 실행 (assert 실패나 예외가 나면 실패)"""
+    tests = [
+        ("대체 사이트 API", test_fake_site_api),
+        ("브라우저 벤치마크", test_benchmark_run),
+    ]
+
+    results = []
+    for name, func in tests:
+        try:
+            func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"[FAIL] {name}: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("테스트 결과 요약")
+    print("=" * 60)
+    for name, result in results:
+        print(f"{'[PASS]' if result else '[FAIL]'} - {name}")
+
+    return all(result for _, result in results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,305 @@
+"""
+데이터 저장 테스트 스크립트
+"""
+
+import os
+import csv
+import shutil
+import tempfile
+
+from data_saver import DataSaver
+
+
+def make_reservations(date, numbers, store='테스트상호'):
+    """테스트용 예약 정보 생성"""
+    return [
+        {'date': date, 'store': store, 'reservation_number': number, 'team': 'A'}
+        for number in numbers
+    ]
+
+
+def read_rows(filepath):
+    with open(filepath, encoding='utf-8-sig', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_append_csv():
+    """CSV 추가 모드가 기존 행을 다시 쓰지 않고 새 행만 추가하는지 테스트"""
+    print("=" * 60)
+    print("1. CSV 추가 모드 테스트")
+    print("=" * 60)
+
+    output_dir = tempfile.mkdtemp()
+    try:
+        saver = DataSaver(output_dir)
+        filepath = saver.append_to_csv(make_reservations('2025-12-01', ['R1', 'R2']), 'append.csv')
+        with open(filepath, 'rb') as f:
+            first = f.read()
+
+        saver.append_to_csv(make_reservations('2025-12-02', ['R3']), 'append.csv')
+        with open(filepath, 'rb') as f:
+            content = f.read()
+
+        assert content.startswith(first) and content.count(b'\xef\xbb\xbf') == 1, "기존 내용이 바뀌었거나 BOM이 중간에 추가됨"
+
+        # 기존 헤더의 일부 컬럼만 있는 행은 빈 값으로 추가
+        saver.append_to_csv([{'date': '2025-12-03', 'reservation_number': 'R4'}], 'append.csv')
+        rows = read_rows(filepath)
+        assert [row['reservation_number'] for row in rows] == ['R1', 'R2', 'R3', 'R4'] and rows[-1]['store'] == '', \
+            f"추가 결과가 다름: {rows}"
+        print(f"[OK] 새 행만 추가 ({len(rows)}행, BOM 1개)")
+
+        # 헤더에 없는 컬럼이 있으면 전체를 다시 작성
+        saver.append_to_csv([{'date': '2025-12-04', 'reservation_number': 'R5', 'memo': '메모'}], 'append.csv')
+        rows = read_rows(filepath)
+        assert len(rows) == 5 and rows[-1]['memo'] == '메모' and rows[0]['memo'] == '', f"컬럼 병합 결과가 다름: {rows}"
+        print("[OK] 새 컬럼은 파일 전체를 다시 작성해 병합")
+
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def test_append_csv_dedup():
+    """예약번호 인덱스로 중복 행을 제외하는지 테스트"""
+    print("\n" + "=" * 60)
+    print("2. CSV 중복 제외 테스트")
+    print("=" * 60)
+
+    output_dir = tempfile.mkdtemp()
+    try:
+        saver = DataSaver(output_dir)
+        saver.append_to_csv(make_reservations('2025-12-01', ['R1', 'R2']), 'dedup.csv', dedup=True)
+        filepath = saver.append_to_csv(
+            make_reservations('2025-12-01', ['R2', 'R3', 'R3']), 'dedup.csv', dedup=True
+        )
+
+        numbers = [row['reservation_number'] for row in read_rows(filepath)]
+        assert numbers == ['R1', 'R2', 'R3'], f"중복이 제외되지 않음: {numbers}"
+        print("[OK] 이미 기록된 예약번호 제외")
+
+        # 파일을 직접 수정하면 인덱스를 다시 만듦
+        with open(filepath, 'a', encoding='utf-8', newline='') as f:
+            f.write('2025-12-02,테스트상호,R9,A\n')
+        saver.append_to_csv(make_reservations('2025-12-02', ['R9', 'R10']), 'dedup.csv', dedup=True)
+
+        numbers = [row['reservation_number'] for row in read_rows(filepath)]
+        assert numbers == ['R1', 'R2', 'R3', 'R9', 'R10'], f"직접 수정한 파일의 인덱스가 갱신되지 않음: {numbers}"
+        print("[OK] 파일이 바뀌면 인덱스 다시 생성")
+
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def test_parquet_dataset():
+    """Parquet 데이터셋이 날짜 단위로 교체되고 날짜 범위로 읽히는지 테스트"""
+    print("\n" + "=" * 60)
+    print("3. Parquet 데이터셋 테스트")
+    print("=" * 60)
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("[SKIP] pyarrow가 설치되어 있지 않음")
+        return
+
+    output_dir = tempfile.mkdtemp()
+    try:
+        saver = DataSaver(output_dir)
+        data = []
+        for day in ('2025-12-01', '2025-12-02', '2025-12-03'):
+            data += make_reservations(day, [f'{day}-1'])
+            data += make_reservations(day, [f'{day}-2'], store='A/B')
+        dataset_dir = saver.save_to_parquet(data)
+
+        part = os.path.join(dataset_dir, 'date=2025-12-01', 'store=테스트상호', 'part-0.parquet')
+        changed = os.path.join(dataset_dir, 'date=2025-12-02', 'store=테스트상호', 'part-0.parquet')
+        # 파티션은 임시 파일을 교체하므로 다시 쓰면 inode가 바뀜
+        inodes = (os.stat(part).st_ino, os.stat(changed).st_ino)
+
+        # 12-02 테스트상호만 바뀐 채로 다시 저장
+        saver.save_to_parquet(data + make_reservations('2025-12-02', ['NEW']))
+        assert os.stat(part).st_ino == inodes[0] and os.stat(changed).st_ino != inodes[1], "바뀐 파티션만 다시 쓰지 않음"
+        print("[OK] 바뀐 파티션만 교체")
+
+        df = saver.read_parquet(start_date='2025-12-02', end_date='2025-12-02')
+        numbers = sorted(df['reservation_number'])
+        assert numbers == ['2025-12-02-1', '2025-12-02-2', 'NEW'] and set(df['store']) == {'테스트상호', 'A/B'}, \
+            f"날짜 범위 읽기 결과가 다름: {numbers}"
+
+        df = saver.read_parquet(stores=['A/B'])
+        assert len(df) == 3 and str(df['date'].iloc[0]) == '2025-12-01', f"상호 필터 결과가 다름: {df}"
+        print(f"[OK] 날짜/상호 범위 읽기 ({len(df)}건)")
+
+        # 날짜 단위 교체: 다시 크롤링한 날짜에 없는 상호, 예약이 없어진 날짜는 삭제
+        saver.save_to_parquet(make_reservations('2025-12-01', ['2025-12-01-1']), dates=['2025-12-01', '2025-12-03'])
+        df = saver.read_parquet()
+        remaining = sorted(zip(df['date'].astype(str), df['store']))
+        expected = [('2025-12-01', '테스트상호'), ('2025-12-02', 'A/B'), ('2025-12-02', '테스트상호'),
+                    ('2025-12-02', '테스트상호')]
+        assert remaining == expected, f"날짜 단위로 교체되지 않음: {remaining}"
+        print("[OK] 다시 저장한 날짜의 없어진 상호/날짜 파티션 삭제")
+
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def test_sqlite_store():
+    """SQLite 저장소가 예약번호/대체 키로 갱신하고 조건으로 조회하는지 테스트"""
+    print("\n" + "=" * 60)
+    print("4. SQLite 저장소 테스트")
+    print("=" * 60)
+
+    output_dir = tempfile.mkdtemp()
+    try:
+        from reservation_store import ReservationStore
+
+        saver = DataSaver(output_dir)
+        data = make_reservations('2025-12-01', ['R1', 'R2']) + make_reservations('2025-12-02', [''])
+        data[1]['team'] = 'B'
+        filepath = saver.save_to_sqlite(data)
+
+        # 같은 예약번호와 예약번호 없는 예약(날짜+상호+팀+고객명)은 갱신
+        data[0]['channel'] = 'KK'
+        data[2]['country'] = 'JP'
+        saver.save_to_sqlite([data[0], data[2]] + make_reservations('2025-12-03', ['R3']))
+
+        with ReservationStore(filepath) as store:
+            mode = store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+            assert store.count() == 4 and mode == 'wal', f"저장 결과가 다름: {store.count()}건, {mode}"
+            print("[OK] 예약번호/대체 키로 갱신 (4건, WAL)")
+
+            rows = store.query(start_date='2025-12-01', end_date='2025-12-02', team='A')
+            expected = {'date': '2025-12-01', 'store': '테스트상호', 'team': 'A', 'customer_name': '',
+                        'reservation_number': 'R1', 'channel': 'KK', 'people_count': '', 'country': '',
+                        'product': '', 'time_request': ''}
+            assert len(rows) == 2 and rows[0] == expected and rows[1]['country'] == 'JP', f"조회 결과가 다름: {rows}"
+            print(f"[OK] 날짜/팀 조건 조회 ({len(rows)}건)")
+
+        # 다시 크롤링한 날짜는 날짜 단위로 교체 (없어진 예약 삭제, 예약이 없는 날짜도 비움)
+        saver.save_to_sqlite(make_reservations('2025-12-01', ['R1']), dates=['2025-12-01', '2025-12-03'])
+        with ReservationStore(filepath) as store:
+            numbers = [(r['date'], r['reservation_number']) for r in store.query()]
+            assert numbers == [('2025-12-01', 'R1'), ('2025-12-02', '')], f"날짜 단위 교체 결과가 다름: {numbers}"
+            print("[OK] 다시 저장한 날짜의 없어진 예약 삭제")
+
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def test_excel_split():
+    """Excel 출력이 이터레이터를 받아 월별 시트로 나누는지 테스트"""
+    print("\n" + "=" * 60)
+    print("5. Excel 시트 나누기 테스트")
+    print("=" * 60)
+
+    output_dir = tempfile.mkdtemp()
+    try:
+        from openpyxl import load_workbook
+
+        saver = DataSaver(output_dir)
+        data = make_reservations('2025-11-30', ['R1']) + make_reservations('2025-12-01', ['R2', 'R3'])
+        data[0]['customer_name'] = '아주 긴 고객 이름' * 10
+        filepath = saver.save_to_excel(iter(data), 'split', split_by='month')
+
+        workbook = load_workbook(filepath)
+        assert workbook.sheetnames == ['2025-11', '2025-12'] and workbook['2025-12'].max_row == 3, \
+            f"시트 나누기 결과가 다름: {workbook.sheetnames}"
+
+        worksheet = workbook['2025-11']
+        header = [cell.value for cell in worksheet[1]]
+        width = worksheet.column_dimensions['E'].width
+        assert header[:3] == ['date', 'store', 'reservation_number'] and header[4] == 'customer_name' and width == 50, \
+            f"헤더/열 너비가 다름: {header}, {width}"
+        print(f"[OK] 월별 시트 {len(workbook.sheetnames)}개, 열 너비 상한 적용")
+
+        assert saver.save_to_excel(iter([]), 'empty') is None, "빈 데이터로 파일을 만듦"
+        print("[OK] 빈 데이터는 저장하지 않음")
+
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def test_summary_aggregator():
+    """누적 집계가 전체 데이터 요약 통계와 같고 작업자별 집계를 합칠 수 있는지 테스트"""
+    print("\n" + "=" * 60)
+    print("6. 요약 통계 누적 집계 테스트")
+    print("=" * 60)
+
+    from summary_aggregator import SummaryAggregator
+
+    data = make_reservations('2025-12-02', ['R1', 'R2']) + make_reservations('2025-12-01', ['R3'], store='B')
+    data[1]['team'] = 'B'
+    data[2]['channel'] = 'KK'
+
+    expected = {
+        'total_count': 3,
+        'date_range': {'start': '2025-12-01', 'end': '2025-12-02'},
+        'by_date': {'2025-12-01': 1, '2025-12-02': 2},
+        'by_store': {'B': 1, '테스트상호': 2},
+        'by_team': {'A': 2, 'B': 1},
+        'by_channel': {'KK': 1},
+        'by_country': {},
+    }
+    summary = DataSaver(tempfile.mkdtemp()).get_summary_statistics(data)
+    assert summary == expected, f"요약 통계가 다름: {summary}"
+    print("[OK] 요약 통계 형식 유지")
+
+    # 작업자 두 개가 나눠 집계한 결과 합치기
+    first = SummaryAggregator(data[:1])
+    second = SummaryAggregator()
+    second.add_many(data[1:])
+    partial = first.snapshot()
+    assert partial['total_count'] == 1 and first.merge(second).snapshot() == expected, \
+        f"집계 합치기 결과가 다름: {first.snapshot()}"
+    print("[OK] 진행 중 조회 및 작업자별 집계 합치기")
+
+
+def main():
+    """모든 테스트 실행 (assert 실패나 예외가 나면 실패)"""
+    print("\n")
+    print("=" * 60)
+    print(" " * 15 + "데이터 저장 테스트 시작")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("CSV 추가 모드", test_append_csv),
+        ("CSV 중복 제외", test_append_csv_dedup),
+        ("Parquet 데이터셋", test_parquet_dataset),
+        ("SQLite 저장소", test_sqlite_store),
+        ("Excel 시트 나누기", test_excel_split),
+        ("요약 통계 집계", test_summary_aggregator),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            results.append((test_name, True))
+        except Exception as e:
+            print(f"\n[FAIL] {test_name}: {e}")
+            results.append((test_name, False))
+
+    # 결과 요약
+    print("\n" + "=" * 60)
+    print("테스트 결과 요약")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for test_name, result in results:
+        status = "[PASS]" if result else "[FAIL]"
+        print(f"{status} - {test_name}")
+
+    print("\n" + "=" * 60)
+    print(f"전체: {passed}/{total} 테스트 통과")
+    print("=" * 60)
+
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -61,6 +61,16 @@ def test_retry_decorator():
             return "성공!"
 
         result = failing_function()
+
+        # 지수 백오프: 시도마다 2배, 최대값 제한, 지터는 대기 시간을 줄이기만 함
+        from utils import backoff_delay
+        if backoff_delay(3, 1, backoff=2, max_delay=30, jitter=0) != 4 or backoff_delay(10, 1, backoff=2, max_delay=30, jitter=0) != 30:
+            print("[FAIL] 백오프 대기 시간 불일치")
+            return False
+        if not 1 <= backoff_delay(2, 1, backoff=2, max_delay=30, jitter=0.5) <= 2:
+            print("[FAIL] 지터 범위 불일치")
+            return False
+
         print(f"[OK] Retry 데코레이터 동작 확인 (시도 횟수: {attempt_count})")
         print(f"  - 결과: {result}")
         return True
@@ -143,6 +153,103 @@ def test_crawler_initialization():
         return False
 
 
+def test_freshness_ledger():
+    """증분 크롤링 원장이 크롤링 당시 기준으로 TTL을 적용하는지 테스트"""
+    print("\n" + "=" * 60)
+    print("5. 증분 크롤링 원장 테스트")
+    print("=" * 60)
+
+    import os
+    import tempfile
+    from datetime import datetime, timedelta
+    from freshness_ledger import FreshnessLedger
+
+    ledger = FreshnessLedger(os.path.join(tempfile.mkdtemp(), 'ledger.json'))
+    today = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    yesterday = (today - timedelta(days=1)).strftime('%Y-%m-%d')
+    two_days_ago = (today - timedelta(days=2)).strftime('%Y-%m-%d')
+
+    # 어제 날짜를 그 전날(D-1) 크롤링: 오늘(D+1) 보면 최종 결과가 아니므로 다시 크롤링
+    ledger.record('상호', yesterday, [])
+    ledger.entries[ledger._key('상호', yesterday)]['crawled_at'] = (today - timedelta(days=2)).timestamp()
+    assert not ledger.is_fresh('상호', yesterday), "날짜가 지나기 전에 크롤링한 결과를 최종 결과로 판단"
+    print("[OK] D-1에 크롤링한 날짜는 D+1에 다시 크롤링")
+
+    # 날짜가 지난 뒤(D+1) 크롤링한 결과는 만료되지 않음
+    ledger.record('상호', two_days_ago, [])
+    ledger.entries[ledger._key('상호', two_days_ago)]['crawled_at'] = (today - timedelta(days=1)).timestamp()
+    assert ledger.is_fresh('상호', two_days_ago), "날짜가 지난 뒤 크롤링한 결과를 다시 크롤링"
+    print("[OK] 날짜가 지난 뒤 크롤링한 결과는 유지")
+
+    # 증분 크롤링 요약 통계: 크롤링에 성공한 날짜는 결과가 올 때, 나머지는 병합할 때 한 번씩만 집계
+    from freshness_ledger import crawl_incremental
+    from summary_aggregator import SummaryAggregator
+
+    today_str = today.strftime('%Y-%m-%d')
+    ledger.record('상호', two_days_ago, [{'date': two_days_ago, 'team': 'A'}])
+    ledger.entries[ledger._key('상호', two_days_ago)]['crawled_at'] = (today - timedelta(days=1)).timestamp()
+    ledger.record('상호', yesterday, [{'date': yesterday, 'team': 'B'}, {'date': yesterday, 'team': 'B'}])
+    ledger.entries[ledger._key('상호', yesterday)]['crawled_at'] = (today - timedelta(days=2)).timestamp()
+
+    aggregator = SummaryAggregator()
+
+    def crawl_func(stale_dates):
+        # yesterday는 일부만 수집하고 실패, 오늘은 성공
+        partial = [{'date': yesterday, 'team': 'C'}]
+        crawled = [{'date': today_str, 'team': 'D'}]
+        aggregator.add_many(crawled)
+        return partial + crawled, [yesterday]
+
+    merged, failed = crawl_incremental(
+        ledger, '상호', [two_days_ago, yesterday, today_str], crawl_func,
+        on_merged=lambda _, rows: aggregator.add_many(rows)
+    )
+    summary = aggregator.snapshot()
+    assert failed == [yesterday] and summary['total_count'] == len(merged) \
+        and summary['by_team'] == {'A': 1, 'B': 2, 'D': 1}, \
+        f"증분 요약 통계 불일치: {summary['by_team']}, 병합 {len(merged)}건"
+    print("[OK] 원장에서 가져온 날짜만 병합할 때 집계")
+
+
+def test_browser_pool_reuse():
+    """옵션 없이 미리 준비한 세션을 기본 옵션 요청이 재사용하는지 테스트"""
+    print("\n" + "=" * 60)
+    print("6. 브라우저 세션 풀 재사용 테스트")
+    print("=" * 60)
+
+    from browser_pool import WarmBrowserPool
+
+    class FakeCrawler:
+        def reset_results(self):
+            pass
+
+        def close(self):
+            pass
+
+    class FakePool(WarmBrowserPool):
+        """브라우저 없이 생성/점검만 흉내 내는 세션 풀"""
+        created = 0
+
+        def _create(self, options):
+            FakePool.created += 1
+            return FakeCrawler()
+
+        def _prepare(self, crawler):
+            return True
+
+    pool = FakePool(size=1, idle_timeout=60)
+    try:
+        pool.warm_up()
+        crawler = pool.acquire(capture_network=False, profile=None)
+        pool.release(crawler)
+    finally:
+        pool.close()
+
+    assert FakePool.created == 1, f"미리 준비한 세션을 재사용하지 않음 (세션 {FakePool.created}개 생성)"
+
+    print("[OK] 미리 준비한 세션 재사용 (세션 1개 생성)")
+
+
 def main():
     """모든 테스트 실행"""
     print("\n")
@@ -156,6 +263,8 @@ def main():
         ("재시도 로직", test_retry_decorator),
         ("패스워드 필터", test_password_filter),
         ("크롤러 초기화", test_crawler_initialization),
+        ("증분 크롤링 원장", test_freshness_ledger),
+        ("세션 풀 재사용", test_browser_pool_reuse),
     ]
 
     results = []
@@ -163,7 +272,8 @@ def main():
     for test_name, test_func in tests:
         try:
             result = test_func()
-            results.append((test_name, result))
+            # assert로 검증하는 테스트는 None 반환
+            results.append((test_name, result is not False))
         except Exception as e:
             print(f"\n예외 발생: {e}")
             results.append((test_name, False))
@@ -0,0 +1,181 @@
+"""
+네트워크 캡처 모드 테스트 스크립트
+로컬 대체 서버가 사이트와 같은 형식의 JSON을 제공하고, CDP로 수집한 응답에서 예약 정보를 추출
+"""
+
+import sys
+import json
+import time
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+
+# 사이트 응답을 흉내 낸 JSON
+SAMPLE_PAYLOAD = {
+    'data': {
+        'stores': [
+            {
+                'storeName': '마리엠헤어',
+                'reservations': [
+                    {
+                        'reservationNumber': 'R-1001',
+                        'customerName': 'John Smith',
+                        'team': {'name': 'Team A'},
+                        'channel': {'code': 'KK'},
+                        'people': {'adult': 2, 'kid': 1},
+                        'country': 'US',
+                        'product': 'AB: Hair Styling',
+                        'timeRequest': 'Time Request: 10:30',
+                        'storeName': '마리엠헤어'
+                    },
+                    {
+                        'reservationNumber': 'R-1002',
+                        'customerName': 'Jane Doe',
+                        'teamName': 'Team B',
+                        'channel': 'VT',
+                        'storeName': '마리엠헤어'
+                    }
+                ]
+            },
+            {
+                'storeName': '다른상호',
+                'reservations': [
+                    {'reservationNumber': 'R-9999', 'customerName': 'Other', 'storeName': '다른상호'}
+                ]
+            }
+        ]
+    }
+}
+
+# JSON을 fetch로 불러오는 페이지
+SAMPLE_PAGE = """<!DOCTYPE html>
+<html><body><div id="status">loading</div>
+<script>
+fetch('/api/reservations?date=2025-12-05')
+    .then(r => r.json())
+    .then(() => { document.getElementById('status').textContent = 'done'; });
+</script></body></html>"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """로컬 대체 서버 핸들러"""
+
+    def do_GET(self):
+        if self.path.startswith('/api/'):
+            body = json.dumps(SAMPLE_PAYLOAD, ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json; charset=utf-8'
+        else:
+            body = SAMPLE_PAGE.encode('utf-8')
+            content_type = 'text/html; charset=utf-8'
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_parse_reservations():
+    """JSON 응답 → 예약 정보 변환 테스트"""
+    print("=" * 60)
+    print("1. JSON 예약 정보 변환 테스트")
+    print("=" * 60)
+
+    from network_capture import parse_reservations
+
+    reservations = parse_reservations(SAMPLE_PAYLOAD, '2025-12-05', store_name='마리엠헤어')
+
+    expected_keys = ['date', 'store', 'team', 'customer_name', 'reservation_number', 'channel',
+                     'people_count', 'country', 'product', 'time_request']
+
+    assert len(reservations) == 2, f"예약 건수 불일치: {len(reservations)}건"
+
+    first = reservations[0]
+    assert list(first.keys()) == expected_keys, f"필드 구성 불일치: {list(first.keys())}"
+    assert first['product'] == 'Hair Styling' and first['time_request'] == '10:30', \
+        f"접두어 제거 실패: {first['product']}, {first['time_request']}"
+    assert first['team'] == 'Team A' and first['channel'] == 'KK' and first['people_count'] == 'Ad 2 Kd 1', \
+        f"중첩 값 변환 실패: {first}"
+
+    # 여러 상호/모든 상호 지정 시 상호별 태그
+    stores = [r['store'] for r in parse_reservations(SAMPLE_PAYLOAD, '2025-12-05', store_name='*')]
+    assert stores == ['마리엠헤어', '마리엠헤어', '다른상호'], f"상호 태그 불일치: {stores}"
+    assert len(parse_reservations(SAMPLE_PAYLOAD, '2025-12-05', store_name='다른상호,없는상호')) == 1, \
+        "여러 상호 필터 불일치"
+
+    print("[OK] JSON 예약 정보 변환 확인")
+    for reservation in reservations:
+        print(f"  - {reservation}")
+
+
+def test_capture_from_local_server():
+    """로컬 대체 서버 응답을 CDP로 캡처하는 테스트 (Chrome 필요)"""
+    print("\n" + "=" * 60)
+    print("2. 로컬 서버 네트워크 캡처 테스트")
+    print("=" * 60)
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from network_capture import NetworkCapture, enable_performance_logging
+
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    enable_performance_logging(chrome_options)
+    try:
+        driver = webdriver.Chrome(options=chrome_options)
+    except Exception as e:
+        print(f"[SKIP] WebDriver를 시작할 수 없음: {e}")
+        return
+
+    server = HTTPServer(('127.0.0.1', 0), StandInHandler)
+    try:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}/"
+
+        capture = NetworkCapture(driver, url_patterns=[r'/api/'])
+        capture.start()
+
+        driver.get(base_url)
+        time.sleep(1)
+
+        reservations = capture.collect_reservations('2025-12-05', store_name='마리엠헤어')
+        assert len(reservations) == 2, f"추출 건수 불일치: {len(reservations)}건"
+        print(f"[OK] 네트워크 캡처로 {len(reservations)}건 추출")
+
+    finally:
+        driver.quit()
+        server.shutdown()
+
+
+def main():
+    """모든 테스트 실행 (assert 실패나 예외가 나면 실패)"""
+    tests = [
+        ("JSON 변환", test_parse_reservations),
+        ("네트워크 캡처", test_capture_from_local_server),
+    ]
+
+    results = []
+    for name, func in tests:
+        try:
+            func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"[FAIL] {name}: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("테스트 결과 요약")
+    print("=" * 60)
+    for name, result in results:
+        print(f"{'[PASS]' if result else '[FAIL]'} - {name}")
+
+    return all(result for _, result in results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,342 @@
+"""
+크롤링 오케스트레이터 테스트 스크립트
+브라우저 대신 가짜 슬롯으로 동시 실행, 속도 제한, 결과 순서, 슬롯 시작 실패, 회로 차단, 스트리밍 저장, 빈 날짜 판단을 확인
+"""
+
+import sys
+import time
+import threading
+
+
+class FakeSlot:
+    """날짜마다 정해진 시간 동안 일하는 가짜 슬롯"""
+
+    def __init__(self, delay=0.05, fail_dates=(), fail_open=False, empty_dates=()):
+        self.delay = delay
+        self.fail_dates = set(fail_dates)
+        self.empty_dates = set(empty_dates)
+        self.fail_open = fail_open
+        self.closed = False
+        self.crawled = []
+
+    def open(self):
+        if self.fail_open:
+            raise RuntimeError("로그인 실패")
+
+    def crawl(self, task):
+        time.sleep(self.delay)
+        self.crawled.append(task.date)
+        if task.date in self.fail_dates:
+            raise RuntimeError("크롤링 실패")
+        if task.date in self.empty_dates:
+            return [], True
+        return [{'date': task.date, 'team': threading.current_thread().name}], True
+
+    def close(self):
+        self.closed = True
+
+
+DATES = [f"2025-12-{day:02d}" for day in range(1, 9)]
+
+
+def test_parallel_slots():
+    """슬롯 수만큼 동시에 실행되고 결과는 날짜 순서대로 병합되는지 테스트"""
+    print("=" * 60)
+    print("1. 동시 실행 및 결과 순서 테스트")
+    print("=" * 60)
+
+    from orchestrator import crawl_with_orchestrator
+
+    slots = [FakeSlot(delay=0.2) for _ in range(4)]
+    streamed = []
+
+    started = time.time()
+    reservations, failed = crawl_with_orchestrator(
+        slots, '마리엠헤어', DATES, on_result=lambda r: streamed.append(r.date), rate_limit=0
+    )
+    elapsed = time.time() - started
+
+    assert [r['date'] for r in reservations] == DATES and not failed, \
+        f"결과 순서/실패 불일치: {[r['date'] for r in reservations]}, {failed}"
+
+    assert len(streamed) == len(DATES) and elapsed <= 1.0, \
+        f"동시 실행되지 않음: {elapsed:.2f}초, 전달 {len(streamed)}건"
+
+    assert all(slot.closed for slot in slots), "슬롯이 종료되지 않음"
+
+    print(f"[OK] 슬롯 4개로 {len(DATES)}일 {elapsed:.2f}초")
+
+
+def test_rate_limit():
+    """초당 작업 시작 수 제한 테스트"""
+    print("\n" + "=" * 60)
+    print("2. 속도 제한 테스트")
+    print("=" * 60)
+
+    from orchestrator import crawl_with_orchestrator
+
+    slots = [FakeSlot(delay=0) for _ in range(4)]
+
+    started = time.time()
+    crawl_with_orchestrator(slots, '마리엠헤어', DATES[:5], rate_limit=10)
+    elapsed = time.time() - started
+
+    # 5개 작업, 초당 10개 → 첫 작업 이후 최소 0.4초
+    assert elapsed >= 0.35, f"속도 제한 미적용: {elapsed:.2f}초"
+
+    print(f"[OK] 초당 10개 제한으로 5개 작업 {elapsed:.2f}초")
+
+
+def test_failures():
+    """작업 실패와 슬롯 시작 실패 처리 테스트"""
+    print("\n" + "=" * 60)
+    print("3. 실패 처리 테스트")
+    print("=" * 60)
+
+    from orchestrator import crawl_with_orchestrator
+
+    # 한 슬롯은 시작 실패, 나머지 슬롯이 모든 작업 처리
+    healthy = FakeSlot(delay=0.01, fail_dates=['2025-12-03'])
+    slots = [FakeSlot(fail_open=True), healthy]
+    reservations, failed = crawl_with_orchestrator(slots, '마리엠헤어', DATES, rate_limit=0)
+
+    assert failed == ['2025-12-03'] and len(reservations) == len(DATES) - 1, \
+        f"실패 날짜 불일치: {failed}, {len(reservations)}건"
+
+    # 모든 슬롯이 시작에 실패하면 전체 날짜를 실패로 기록
+    reservations, failed = crawl_with_orchestrator([FakeSlot(fail_open=True)], '마리엠헤어', DATES, rate_limit=0)
+    assert failed == DATES and not reservations, f"전체 실패 처리 불일치: {failed}"
+
+    print("[OK] 실패 날짜 기록 확인")
+
+
+def test_circuit_breaker():
+    """연속 실패 시 일시 정지 후 중단, 재시도 예산 소진 시 중단 테스트"""
+    print("\n" + "=" * 60)
+    print("4. 회로 차단 테스트")
+    print("=" * 60)
+
+    from orchestrator import crawl_with_orchestrator
+    from resilience import CircuitBreaker, CircuitOpenError, RetryBudget
+
+    # 2개 연속 실패 → 0.2초 정지 → 재개 후 첫 실패에 중단
+    slot = FakeSlot(delay=0.01, fail_dates=DATES)
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=0.2, max_pauses=1)
+    errors = []
+    started = time.perf_counter()
+    _, failed = crawl_with_orchestrator(
+        [slot], '마리엠헤어', DATES, on_result=lambda result: errors.append(result.error),
+        rate_limit=0, breaker=breaker
+    )
+    elapsed = time.perf_counter() - started
+
+    assert failed == DATES and len(slot.crawled) == 3 and elapsed >= 0.2, \
+        f"회로 차단 불일치: 실행 {slot.crawled}, {elapsed:.2f}초"
+    assert sum(isinstance(error, CircuitOpenError) for error in errors) == len(DATES) - 3, \
+        f"중단된 날짜 오류 불일치: {errors}"
+
+    # 재시도 예산이 소진되면 다음 작업부터 중단
+    budget = RetryBudget(2)
+    budget.consume()
+    budget.consume()
+    slot = FakeSlot(delay=0.01)
+    _, failed = crawl_with_orchestrator(
+        [slot], '마리엠헤어', DATES, rate_limit=0, breaker=CircuitBreaker(budget=budget)
+    )
+    assert not budget.consume() and not slot.crawled and failed == DATES, \
+        f"재시도 예산 소진 처리 불일치: {slot.crawled}"
+
+    print("[OK] 일시 정지 후 중단, 예산 소진 시 중단 확인")
+
+
+def test_streaming_sink():
+    """날짜가 끝날 때마다 NDJSON/CSV 파일에 추가되는지 테스트"""
+    print("\n" + "=" * 60)
+    print("5. 스트리밍 저장 테스트")
+    print("=" * 60)
+
+    import os
+    import csv
+    import json
+    import tempfile
+    from orchestrator import build_slots, crawl_with_orchestrator
+    from sinks import open_sink, CsvSink
+    from checkpoint import CrawlCheckpoint
+    from crawler import KTourCrawler
+
+    class FakeCrawler(KTourCrawler):
+        """브라우저 없이 날짜마다 예약 2건을 추출하는 크롤러 (실제 추출 경로로 저장소에 전달)"""
+
+        def __init__(self):
+            super().__init__(headless=True, use_session_cache=False, buffer_results=False)
+            self.driver = object()  # 로그인된 것으로 간주
+            self.counts_seen = []
+
+        def crawl_date(self, target_date, store_name=None):
+            self.date_reservations = []
+            for team in ('A', 'B'):
+                self._add_reservation({'date': target_date, 'team': team})
+                # 예약 정보를 추출할 때마다 바로 저장소에 전달
+                self.counts_seen.append(self.sink.count)
+            self.sink.flush()
+            return True
+
+        def return_to_main_page(self):
+            pass
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'stream.ndjson')
+        lines_seen = []
+
+        # 스트림 파일이 결과이므로 체크포인트에는 날짜별 건수만 기록
+        checkpoint = CrawlCheckpoint('stream_test', directory)
+        checkpoint.start(DATES, keep_reservations=False)
+
+        # 날짜 결과를 받을 때 이미 파일에 기록되어 있어야 함
+        def on_result(result):
+            with open(path, encoding='utf-8') as f:
+                lines_seen.append(len(f.readlines()))
+            checkpoint.record_date(result.date, result.reservations, result.success)
+
+        crawler = FakeCrawler()
+        with open_sink(path) as sink:
+            slots = build_slots(crawler, sink=sink)
+            reservations, failed = crawl_with_orchestrator(
+                slots, '마리엠헤어', DATES, on_result, rate_limit=0, keep_results=False
+            )
+
+        with open(path, encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f]
+
+        expected_dates = [target_date for target_date in DATES for _ in range(2)]
+        # 결과를 받는 동안 슬롯은 다음 날짜를 진행하므로 끝난 날짜까지는 기록되어 있어야 함
+        assert not reservations and not failed and [row['date'] for row in rows] == expected_dates, \
+            f"NDJSON 스트림 불일치: {len(rows)}행"
+        assert all(seen >= 2 * i for i, seen in enumerate(lines_seen, 1)), f"결과 전달 전에 기록되지 않음: {lines_seen}"
+
+        assert crawler.counts_seen == list(range(1, 2 * len(DATES) + 1)) and not crawler.reservations, \
+            f"예약 정보마다 전달되지 않음: {crawler.counts_seen}"
+
+        resumed = CrawlCheckpoint.load('stream_test', directory)
+        assert not resumed.pending_dates() and not resumed.completed_reservations() \
+            and resumed.state['completed'][DATES[0]] == 2, f"스트리밍 체크포인트 불일치: {resumed.state['completed']}"
+
+        # CSV는 처음 만들 때만 헤더 기록, 이어서 추가
+        csv_path = os.path.join(directory, 'stream.csv')
+        for target_date in DATES[:2]:
+            with CsvSink(csv_path) as sink:
+                sink.write({'date': target_date, 'team': 'A', 'customer_name': '홍길동'})
+        with open(csv_path, encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.DictReader(f))
+
+        assert [row['date'] for row in rows] == DATES[:2] and rows[0]['customer_name'] == '홍길동', \
+            f"CSV 스트림 불일치: {rows}"
+
+    print("[OK] 예약 정보마다 전달, 날짜 단위 flush 확인")
+
+
+class EmptyPageDriver:
+    """상호가 나타나지 않고 요청 수도 변하지 않는 날짜 화면을 흉내 내는 드라이버"""
+
+    def __init__(self, marker=False, pending=0, headings=('예약 현황',)):
+        """
+        Args:
+            marker (bool): 예약 없음 안내 문구 표시 여부
+            pending (int): 진행 중인 요청 수 (None이면 요청 추적 스크립트가 없는 페이지)
+            headings (tuple): 화면에 있는 h6 제목 (상호가 아닌 제목 포함)
+        """
+        self.marker = marker
+        self.pending = pending
+        self.headings = headings
+
+    def find_elements(self, by, selector):
+        if self.marker and 'contains(text()' in selector:
+            return ['예약이 없습니다']
+        if selector.startswith('//h6'):
+            # //h6[text()="상호"] | ... 중 글자가 같은 제목만
+            return [heading for heading in self.headings if f'//h6[text()="{heading}"]' in selector]
+        return []
+
+    def execute_script(self, script):
+        return ['complete', 12, self.pending]
+
+
+def test_empty_dates():
+    """예약 없는 날짜를 빠르게 판단하고 실패와 구분해 보고하는지 테스트"""
+    print("\n" + "=" * 60)
+    print("6. 빈 날짜 판단 테스트")
+    print("=" * 60)
+
+    from orchestrator import crawl_with_orchestrator
+    from selenium.common.exceptions import TimeoutException
+    from waits import WaitEngine
+    import metrics
+
+    # 상호가 없는 화면은 조회가 조용해진 직후, 안내 문구가 있으면 즉시 빈 날짜로 판단
+    for marker in (False, True):
+        engine = WaitEngine(EmptyPageDriver(marker), timeout=15, poll_interval=0.05)
+        started = time.perf_counter()
+        state = engine.until('date_result', WaitEngine.date_result_settled(settle_time=0.3))
+        elapsed = time.perf_counter() - started
+        assert state == 'empty' and elapsed <= 1, f"빈 날짜 판단 지연: {state}, {elapsed:.2f}초"
+
+    # 상호가 아닌 제목만 있으면 상호 목록으로 보지 않고, 상호명과 같은 제목이 나타나면 바로 상호 목록
+    engine = WaitEngine(EmptyPageDriver(headings=('예약 현황', '마리엠헤어')), timeout=15, poll_interval=0.05)
+    state = engine.until('date_result', WaitEngine.date_result_settled(settle_time=0.3, stores=['마리엠헤어']))
+    assert state == 'stores', f"상호 목록 판단 불일치: {state}"
+
+    # 날짜 조회 요청이 아직 진행 중이거나 요청을 추적할 수 없으면 짧은 대기로 빈 날짜라 판단하지 않음
+    for pending in (1, None):
+        engine = WaitEngine(EmptyPageDriver(pending=pending), timeout=1, poll_interval=0.05)
+        try:
+            state = engine.until('date_result', WaitEngine.date_result_settled(settle_time=0.3))
+        except TimeoutException:
+            continue
+        raise AssertionError(f"응답 전에 빈 날짜로 판단: 진행 중 요청 {pending}, {state}")
+
+    run_metrics = metrics.start_run('empty_dates_test')
+    slot = FakeSlot(delay=0.01, fail_dates=['2025-12-02'], empty_dates=['2025-12-03', '2025-12-05'])
+    results = []
+    _, failed = crawl_with_orchestrator([slot], '마리엠헤어', DATES, results.append, rate_limit=0)
+    empty = [result.date for result in results if result.empty]
+
+    assert failed == ['2025-12-02'] and empty == ['2025-12-03', '2025-12-05'], \
+        f"빈 날짜/실패 구분 불일치: 빈 날짜 {empty}, 실패 {failed}"
+    counters = run_metrics.report()['counters']
+    assert counters.get('empty_dates') == 2, f"빈 날짜 측정값 불일치: {counters}"
+
+    print("[OK] 1초 이내 빈 날짜 판단, 응답 대기 중에는 판단 보류, 실패와 구분 확인")
+
+
+def main():
+    """모든 테스트 실행"""
+    tests = [
+        ("동시 실행", test_parallel_slots),
+        ("속도 제한", test_rate_limit),
+        ("실패 처리", test_failures),
+        ("회로 차단", test_circuit_breaker),
+        ("스트리밍 저장", test_streaming_sink),
+        ("빈 날짜 판단", test_empty_dates),
+    ]
+
+    results = []
+    for name, func in tests:
+        try:
+            func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"[FAIL] {name}: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("테스트 결과 요약")
+    print("=" * 60)
+    for name, result in results:
+        print(f"{'[PASS]' if result else '[FAIL]'} - {name}")
+
+    return all(result for _, result in results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -3,19 +3,29 @@
 """
 
 from functools import wraps
+from datetime import datetime, timedelta
 import time
+import random
 import logging
 import config
+from metrics import current_run
+from resilience import current_budget
 
 
-def retry(max_attempts=3, delay=2, exceptions=(Exception,)):
+def retry(max_attempts=3, delay=2, exceptions=(Exception,), backoff=None, max_delay=None, jitter=None):
     """
     함수 실행 실패 시 자동 재시도 데코레이터
+    대기 시간은 시도마다 backoff배씩 늘어나고(최대 max_delay), jitter 비율만큼 무작위로 줄여
+    여러 슬롯이 동시에 재시도하지 않도록 함. 재시도마다 실행 전체의 재시도 예산을 사용하며,
+    예산이 소진되면 더 이상 재시도하지 않고 예외를 그대로 전달
 
     Args:
         max_attempts (int): 최대 시도 횟수
-        delay (int): 재시도 사이 대기 시간(초)
+        delay (int): 첫 재시도 전 대기 시간(초)
         exceptions (tuple): 재시도할 예외 타입들
+        backoff (float): 재시도마다 대기 시간 배수 (없으면 config.RETRY_BACKOFF)
+        max_delay (float): 최대 대기 시간(초) (없으면 config.RETRY_MAX_DELAY)
+        jitter (float): 대기 시간을 무작위로 줄이는 비율 0~1 (없으면 config.RETRY_JITTER)
 
     Returns:
         decorator: 데코레이터 함수
@@ -33,14 +43,136 @@ def retry(max_attempts=3, delay=2, exceptions=(Exception,)):
                         logger.error(f"{func.__name__} 실패 (최대 시도 횟수 도달): {e}")
                         raise
 
+                    if not current_budget().consume():
+                        logger.error(f"{func.__name__} 실패 (재시도 예산 소진): {e}")
+                        raise
+
                     logger.warning(f"{func.__name__} 실패 (시도 {attempt}/{max_attempts}): {e}")
-                    logger.info(f"{delay}초 후 재시도...")
-                    time.sleep(delay)
+                    current_run().record_retry(func.__name__)
+                    wait = backoff_delay(attempt, delay, backoff, max_delay, jitter)
+                    logger.info(f"{wait:.1f}초 후 재시도...")
+                    time.sleep(wait)
 
         return wrapper
     return decorator
 
 
+def backoff_delay(attempt, delay, backoff=None, max_delay=None, jitter=None):
+    """
+    지수 백오프 + 지터 대기 시간 계산
+
+    Args:
+        attempt (int): 실패한 시도 번호 (1부터)
+        delay (float): 첫 재시도 전 대기 시간(초)
+        backoff (float): 재시도마다 대기 시간 배수 (없으면 config.RETRY_BACKOFF)
+        max_delay (float): 최대 대기 시간(초) (없으면 config.RETRY_MAX_DELAY)
+        jitter (float): 대기 시간을 무작위로 줄이는 비율 0~1 (없으면 config.RETRY_JITTER)
+
+    Returns:
+        float: 대기 시간(초)
+    """
+    backoff = config.RETRY_BACKOFF if backoff is None else backoff
+    max_delay = config.RETRY_MAX_DELAY if max_delay is None else max_delay
+    jitter = config.RETRY_JITTER if jitter is None else jitter
+
+    wait = min(max_delay, delay * backoff ** (attempt - 1))
+    return wait * (1 - jitter * random.random())
+
+
+# 예약 정보 필드 (date 제외, 출력 컬럼 순서)
+RESERVATION_FIELDS = (
+    'team',
+    'customer_name',
+    'reservation_number',
+    'channel',
+    'people_count',
+    'country',
+    'product',
+    'time_request',
+)
+
+
+# 날짜 화면에 표시된 모든 상호를 크롤링할 때의 상호 지정값
+ALL_STORES = '*'
+
+
+def split_stores(store_name=None):
+    """
+    상호 지정값을 상호명 리스트로 변환
+
+    Args:
+        store_name (str|list): 상호명, 쉼표로 구분한 여러 상호명, 상호명 리스트,
+            또는 '*'/'all' (모든 상호). 없으면 config.DEFAULT_STORE_NAME
+
+    Returns:
+        list|str: 상호명 리스트 (모든 상호이면 ALL_STORES)
+    """
+    store_name = store_name or config.DEFAULT_STORE_NAME
+    if isinstance(store_name, str):
+        if store_name.strip().lower() in (ALL_STORES, 'all'):
+            return ALL_STORES
+        store_name = store_name.split(',')
+
+    return [name.strip() for name in store_name if name and name.strip()]
+
+
+def join_stores(stores):
+    """
+    상호명 리스트를 상호 지정값(쉼표 구분 문자열)으로 변환 (체크포인트/원장 키, 작업 지정용)
+
+    Args:
+        stores (str|list): split_stores가 받는 형식
+
+    Returns:
+        str: 'A,B' 또는 ALL_STORES
+    """
+    stores = split_stores(stores)
+    return ALL_STORES if stores == ALL_STORES else ','.join(stores)
+
+
+def clean_field_value(field, text):
+    """
+    예약 필드 값 후처리
+
+    Args:
+        field (str): 필드명
+        text (str): 원본 텍스트
+
+    Returns:
+        str: 정리된 값 ("AB: ", "Time Request: " 접두어 제거)
+    """
+    text = text.strip()
+
+    # 예약상품 "AB: ", 예약시간 "Time Request: " 제거
+    if field in ('product', 'time_request') and ':' in text:
+        text = text.split(':', 1)[1].strip()
+
+    return text
+
+
+def generate_dates(start_date, end_date):
+    """
+    시작~종료 날짜 사이의 모든 날짜 생성 (양 끝 포함)
+
+    Args:
+        start_date (str): 시작 날짜 (YYYY-MM-DD)
+        end_date (str): 종료 날짜 (YYYY-MM-DD)
+
+    Returns:
+        list: 날짜 문자열 리스트 (YYYY-MM-DD)
+    """
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+
+    dates = []
+    current = start
+    while current <= end:
+        dates.append(current.strftime('%Y-%m-%d'))
+        current += timedelta(days=1)
+
+    return dates
+
+
 class PasswordFilter(logging.Filter):
     """
     로그에서 패스워드를 마스킹하는 필터
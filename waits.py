@@ -0,0 +1,389 @@
+"""
+조건 기반 대기 모듈
+고정 time.sleep 대신 실제 DOM 상태(선택기 열림, 팀 목록 렌더링, 상세 패널 변경, 네트워크 유휴)를 기다림
+"""
+
+import time
+import logging
+from collections import defaultdict
+from contextlib import contextmanager
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+import config
+
+
+# 대기 조건에서 사용하는 셀렉터
+DATE_DISPLAY_SELECTOR = 'p.MuiTypography-root.MuiTypography-body1.css-1a5pbt3'
+PICKER_HEADER_SELECTOR = 'div.MuiPickersCalendarHeader-label.css-1v994a0'
+TEAM_ITEM_SELECTOR = 'div.MuiBox-root.css-k008qs'
+DETAIL_SIGNATURE_SELECTORS = (
+    'h6.MuiTypography-root.MuiTypography-subtitle1.css-qdk4z1',
+    'h6.MuiTypography-root.MuiTypography-subtitle2.css-1r042ka',
+)
+
+
+@contextmanager
+def no_implicit_wait(driver):
+    """
+    암묵적 대기를 잠시 끄는 컨텍스트 매니저 (요소가 없을 때 바로 빈 결과를 받기 위함)
+
+    Args:
+        driver: Selenium WebDriver
+    """
+    driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        driver.implicitly_wait(0 if config.CONDITION_WAITS else config.IMPLICIT_WAIT)
+
+
+# 페이지의 fetch/XHR 요청 중 아직 끝나지 않은 수를 세는 스크립트
+# (리소스 타이밍 항목은 요청이 끝난 뒤에야 생기므로 진행 중인 요청을 알 수 없음)
+REQUEST_TRACKER_SCRIPT = """
+(function () {
+    if (window.__ktourRequestTracker) { return; }
+    var tracker = window.__ktourRequestTracker = {pending: 0, finished: 0};
+    function done() {
+        tracker.pending = Math.max(0, tracker.pending - 1);
+        tracker.finished += 1;
+    }
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            tracker.pending += 1;
+            return originalFetch.apply(this, arguments).then(
+                function (response) { done(); return response; },
+                function (error) { done(); throw error; }
+            );
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        tracker.pending += 1;
+        this.addEventListener('loadend', done, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+})();
+"""
+
+
+def install_request_tracker(driver):
+    """
+    진행 중인 요청 추적 스크립트 설치 (이후 열리는 문서와 현재 문서 모두)
+
+    Args:
+        driver: Selenium WebDriver
+
+    Returns:
+        bool: 이후 문서에도 설치되었는지 여부 (CDP를 쓸 수 없으면 False)
+    """
+    installed = True
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': REQUEST_TRACKER_SCRIPT})
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"요청 추적 스크립트 등록 실패, 네트워크 유휴 판단이 느려집니다: {e}")
+        installed = False
+
+    driver.execute_script(REQUEST_TRACKER_SCRIPT)
+    return installed
+
+
+class NetworkIdle:
+    """진행 중인 요청이 없고 리소스 요청 수가 일정 시간 동안 변하지 않으면 유휴 상태로 판단하는 대기 조건"""
+
+    def __init__(self, quiet_period=None, untracked_period=None):
+        """
+        초기화
+
+        Args:
+            quiet_period (float): 요청 수가 변하지 않아야 하는 시간(초)
+            untracked_period (float): 요청 추적 스크립트가 없는 페이지에서 대신 쓸 시간(초, 없으면 quiet_period)
+        """
+        self.quiet_period = config.NETWORK_IDLE_TIME if quiet_period is None else quiet_period
+        self.untracked_period = self.quiet_period if untracked_period is None else untracked_period
+        self.tracked = False
+        self.last_count = None
+        self.stable_since = None
+
+    def __call__(self, driver):
+        state = driver.execute_script(
+            'var tracker = window.__ktourRequestTracker;'
+            'return [document.readyState, performance.getEntriesByType("resource").length,'
+            ' tracker ? tracker.pending : null];'
+        )
+        ready_state, count, pending = state[0], state[1], state[2]
+        now = time.monotonic()
+        self.tracked = pending is not None
+
+        if ready_state != 'complete' or count != self.last_count or pending:
+            self.last_count = count
+            self.stable_since = now
+            return False
+
+        quiet_period = self.quiet_period if self.tracked else self.untracked_period
+        return now - self.stable_since >= quiet_period
+
+
+def store_xpath(stores):
+    """
+    상호명 h6를 찾는 XPath (글자가 상호명과 같은 h6만, 다른 MUI 제목은 상호로 보지 않음)
+
+    Args:
+        stores (list): 상호명 리스트
+
+    Returns:
+        str: XPath (상호가 없으면 빈 문자열)
+    """
+    return ' | '.join(f'//h6[text()="{store}"]' for store in stores)
+
+
+class DateResultSettled:
+    """날짜 조회 결과가 표시되었거나(상호 목록) 예약이 없다고 판단되면 참이 되는 대기 조건"""
+
+    def __init__(self, settle_time=None, fallback_time=None, stores=None):
+        """
+        초기화
+
+        Args:
+            settle_time (float): 조회 요청이 모두 끝난 뒤 상호 없이 기다리는 시간(초)
+            fallback_time (float): 요청 추적이 안 되는 페이지에서 상호 없이 네트워크가 조용해야 하는 시간(초)
+            stores (list): 찾을 상호명 (없으면 config.STORE_NAMES)
+        """
+        self.store_xpath = store_xpath(stores or config.STORE_NAMES)
+        self.idle = NetworkIdle(
+            config.EMPTY_DATE_SETTLE_TIME if settle_time is None else settle_time,
+            config.EMPTY_DATE_FALLBACK_TIME if fallback_time is None else fallback_time
+        )
+        self.marker_xpath = ' | '.join(f'//*[contains(text(), "{marker}")]' for marker in config.EMPTY_DATE_MARKERS)
+
+    def __call__(self, driver):
+        if self.store_xpath and driver.find_elements(By.XPATH, self.store_xpath):
+            return 'stores'
+        if self.marker_xpath and driver.find_elements(By.XPATH, self.marker_xpath):
+            return 'empty'
+        # 안내 문구가 없는 화면: 조회 요청이 모두 끝난 뒤에도 상호가 나타나지 않으면 빈 날짜
+        # (진행 중인 요청이 있는 동안은 빈 날짜로 판단하지 않음)
+        return 'empty' if self.idle(driver) else False
+
+
+class WaitEngine:
+    """조건 기반 대기 엔진 클래스 (대기 시간 기록 포함)"""
+
+    def __init__(self, driver, timeout=None, poll_interval=None):
+        """
+        초기화
+
+        Args:
+            driver: Selenium WebDriver
+            timeout (float): 기본 대기 제한 시간(초)
+            poll_interval (float): 조건 확인 주기(초)
+        """
+        self.driver = driver
+        self.timeout = config.EXPLICIT_WAIT if timeout is None else timeout
+        self.poll_interval = config.WAIT_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.timings = defaultdict(list)
+        self.logger = logging.getLogger(__name__)
+
+    def until(self, name, condition, timeout=None):
+        """
+        조건이 참이 될 때까지 대기
+
+        Args:
+            name (str): 대기 이름 (시간 기록용)
+            condition (callable): driver를 받아 참/거짓(또는 요소)을 반환하는 조건
+            timeout (float): 대기 제한 시간(초)
+
+        Returns:
+            조건 함수의 반환값
+
+        Raises:
+            TimeoutException: 제한 시간 내에 조건이 충족되지 않은 경우
+        """
+        wait = WebDriverWait(
+            self.driver,
+            self.timeout if timeout is None else timeout,
+            poll_frequency=self.poll_interval,
+            ignored_exceptions=(StaleElementReferenceException,)
+        )
+
+        start = time.monotonic()
+        try:
+            return wait.until(condition)
+        finally:
+            elapsed = time.monotonic() - start
+            self.timings[name].append(elapsed)
+            self.logger.debug(f"대기 완료: {name} ({elapsed:.3f}초)")
+
+    def probe(self, by, selector, timeout=None, parent=None):
+        """
+        선택 항목 빠른 확인 (없으면 짧은 시간 후 None 반환)
+
+        Args:
+            by: 셀렉터 종류 (By.CSS_SELECTOR 등)
+            selector (str): 셀렉터
+            timeout (float): 확인 제한 시간(초)
+            parent: 검색 기준 요소 (없으면 문서 전체)
+
+        Returns:
+            WebElement: 찾은 요소 (없으면 None)
+        """
+        root = parent or self.driver
+        timeout = config.OPTIONAL_PROBE_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with no_implicit_wait(self.driver):
+            while True:
+                elements = root.find_elements(by, selector)
+                if elements:
+                    return elements[0]
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(self.poll_interval)
+
+    # ------------------------------------------------------------------
+    # 대기 조건
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def page_ready():
+        """메인 페이지의 날짜 표시 요소가 렌더링됨"""
+        def condition(driver):
+            elements = driver.find_elements(By.CSS_SELECTOR, DATE_DISPLAY_SELECTOR)
+            return elements[0] if elements and elements[0].is_displayed() else False
+        return condition
+
+    @staticmethod
+    def picker_open():
+        """날짜 선택기가 열리고 년월 헤더가 표시됨"""
+        def condition(driver):
+            elements = driver.find_elements(By.CSS_SELECTOR, PICKER_HEADER_SELECTOR)
+            return elements[0] if elements and elements[0].text else False
+        return condition
+
+    @staticmethod
+    def picker_closed():
+        """날짜 선택기가 닫힘"""
+        def condition(driver):
+            return not driver.find_elements(By.CSS_SELECTOR, PICKER_HEADER_SELECTOR)
+        return condition
+
+    @staticmethod
+    def picker_month_changed(previous_label):
+        """날짜 선택기의 년월 헤더가 이전 값에서 바뀜"""
+        def condition(driver):
+            elements = driver.find_elements(By.CSS_SELECTOR, PICKER_HEADER_SELECTOR)
+            if not elements:
+                return False
+            label = elements[0].text
+            return label if label and label != previous_label else False
+        return condition
+
+    @staticmethod
+    def picker_month_is(target_label):
+        """날짜 선택기의 년월 헤더가 목표 값이 됨"""
+        def condition(driver):
+            elements = driver.find_elements(By.CSS_SELECTOR, PICKER_HEADER_SELECTOR)
+            return bool(elements) and elements[0].text == target_label
+        return condition
+
+    @staticmethod
+    def element_has_class(element, class_name):
+        """요소에 특정 클래스가 추가됨 (예: 날짜 버튼의 Mui-selected)"""
+        def condition(driver):
+            return class_name in (element.get_attribute('class') or '')
+        return condition
+
+    @staticmethod
+    def team_list_rendered():
+        """팀 목록이 렌더링됨"""
+        def condition(driver):
+            elements = driver.find_elements(By.CSS_SELECTOR, TEAM_ITEM_SELECTOR)
+            return elements if elements else False
+        return condition
+
+    @staticmethod
+    def detail_signature(driver):
+        """
+        현재 상세 패널의 식별 문자열 (고객명 + 예약번호)
+
+        Args:
+            driver: Selenium WebDriver
+
+        Returns:
+            str: 상세 패널 식별 문자열 (패널이 없으면 빈 문자열)
+        """
+        parts = []
+        for selector in DETAIL_SIGNATURE_SELECTORS:
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            parts.append(elements[0].text if elements else '')
+        return '|'.join(parts) if any(parts) else ''
+
+    @classmethod
+    def detail_changed(cls, previous_signature):
+        """상세 패널 내용이 이전 상태에서 바뀜"""
+        def condition(driver):
+            signature = cls.detail_signature(driver)
+            return signature if signature and signature != previous_signature else False
+        return condition
+
+    @staticmethod
+    def date_result_settled(settle_time=None, fallback_time=None, stores=None):
+        """날짜 조회 결과가 확정됨 ('stores': 상호 목록 표시, 'empty': 예약 없음)"""
+        return DateResultSettled(settle_time, fallback_time, stores)
+
+    @staticmethod
+    def network_idle(quiet_period=None):
+        """네트워크 요청이 일정 시간 동안 발생하지 않음"""
+        return NetworkIdle(quiet_period)
+
+    def get_timing_summary(self):
+        """
+        대기 시간 요약
+
+        Returns:
+            dict: 대기 이름별 {count, total, min, avg, max} (초)
+        """
+        summary = {}
+        for name, values in self.timings.items():
+            summary[name] = {
+                'count': len(values),
+                'total': round(sum(values), 3),
+                'min': round(min(values), 3),
+                'avg': round(sum(values) / len(values), 3),
+                'max': round(max(values), 3)
+            }
+        return summary
+
+
+def wait_or_sleep(waits, name, delay, condition=None, timeout=None, soft=False):
+    """
+    조건 대기 엔진이 있으면 조건을 기다리고, 없으면 고정 시간 대기
+
+    Args:
+        waits (WaitEngine): 대기 엔진 (None이면 time.sleep 사용)
+        name (str): 대기 이름
+        delay (float): 대기 엔진이 없을 때의 고정 대기 시간(초)
+        condition (callable): 대기 조건 (None이면 대기 엔진 사용 시 대기하지 않음)
+        timeout (float): 대기 제한 시간(초)
+        soft (bool): True면 시간 초과 시 예외 대신 경고만 기록
+
+    Returns:
+        조건 함수의 반환값 (고정 대기 또는 시간 초과 시 None)
+    """
+    if waits is None:
+        time.sleep(delay)
+        return None
+
+    if condition is None:
+        return None
+
+    try:
+        return waits.until(name, condition, timeout)
+    except TimeoutException:
+        if not soft:
+            raise
+        waits.logger.warning(f"대기 시간 초과, 계속 진행: {name}")
+        return None
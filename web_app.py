@@ -6,10 +6,17 @@ from flask import Flask, render_template, request, jsonify, send_file
 from datetime import datetime, timedelta
 import os
 import threading
-import json
 
 from crawler import KTourCrawler
+from browser_pool import WarmBrowserPool
+from orchestrator import build_slots, crawl_with_orchestrator
+from checkpoint import CrawlCheckpoint, merge_with_checkpoint
+from browser_profile import BROWSER_PROFILES
+from metrics import start_run
+import resilience
 from data_saver import DataSaver
+from summary_aggregator import SummaryAggregator
+from utils import ALL_STORES, join_stores, split_stores
 from google_sheets_manager import GoogleSheetsManager
 import config
 
@@ -22,9 +29,17 @@ crawling_status = {
     'total': 0,
     'current_date': '',
     'message': '',
-    'result_file': None
+    'result_file': None,
+    'run_id': None,
+    'metrics_file': None,
+    'empty_dates': [],
+    'failed_dates': [],
+    'summary': None
 }
 
+# 작업 사이에 로그인된 브라우저를 유지하는 세션 풀
+browser_pool = WarmBrowserPool() if config.WARM_POOL_ENABLED else None
+
 
 def generate_date_range(start_date, end_date, mode='daily'):
     """
@@ -68,66 +83,158 @@ def generate_date_range(start_date, end_date, mode='daily'):
     return dates
 
 
-def run_crawler_task(store_name, start_date, end_date, mode, output_format, google_sheets=False, sheets_url=''):
+def checkout_crawler(capture_network=False, profile=None):
+    """
+    로그인된 크롤러 준비 (세션 풀이 있으면 대기 중인 세션을 빌려옴)
+
+    Args:
+        capture_network (bool): 네트워크 응답(JSON)에서 예약 정보 추출 여부
+        profile (str): 브라우저 프로필 full, lean
+
+    Returns:
+        KTourCrawler: 로그인된 크롤러
+    """
+    if browser_pool:
+        crawling_status['message'] = '브라우저 세션 준비 중...'
+        return browser_pool.acquire(capture_network=capture_network, profile=profile)
+
+    crawler = KTourCrawler(headless=True, capture_network=capture_network, profile=profile)
+    try:
+        crawling_status['message'] = 'WebDriver 설정 중...'
+        crawler.setup_driver()
+
+        crawling_status['message'] = '로그인 중...'
+        crawler.login()
+    except Exception:
+        crawler.close()
+        raise
+
+    return crawler
+
+
+def checkin_crawler(crawler, discard=False):
+    """
+    크롤러 반납 (세션 풀이 없으면 종료)
+
+    Args:
+        crawler (KTourCrawler): checkout_crawler()로 준비한 크롤러
+        discard (bool): 오류 등으로 상태를 알 수 없어 재사용하지 않을지 여부
+    """
+    if browser_pool:
+        browser_pool.release(crawler, discard=discard)
+    else:
+        crawler.close()
+
+
+def run_crawler_task(store_name, start_date, end_date, mode, output_format, google_sheets=False, sheets_url='',
+                     workers=1, capture_network=False, backend='browser', resume_run_id=None,
+                     profile=None):
     """
     백그라운드에서 크롤러 실행
 
     Args:
-        store_name (str): 상호명
+        store_name (str): 상호명, 쉼표로 구분한 여러 상호명 또는 ALL_STORES (날짜마다 한 번 선택으로 모두 수집)
         start_date (str): 시작 날짜
         end_date (str): 종료 날짜
         mode (str): daily, weekly, monthly
         output_format (str): csv, excel, json
         google_sheets (bool): 구글 시트 저장 여부
         sheets_url (str): 구글 시트 URL
+        workers (int): 동시에 실행할 브라우저 수
+        capture_network (bool): 네트워크 응답(JSON)에서 예약 정보 추출 여부
+        backend (str): browser, http
+        resume_run_id (str): 이어서 진행할 실행 ID (없으면 새 실행)
+        profile (str): 브라우저 프로필 full, lean (없으면 config 값)
     """
     global crawling_status
 
     crawler = None
+    checkpoint = None
+    task_failed = False
+    run_metrics = None
 
     try:
         # 상태 초기화
         crawling_status['is_running'] = True
         crawling_status['progress'] = 0
         crawling_status['message'] = '크롤러 초기화 중...'
+        crawling_status['empty_dates'] = []
+        crawling_status['failed_dates'] = []
+        crawling_status['summary'] = None
+
+        if resume_run_id:
+            # 중단된 실행 이어서 진행
+            checkpoint = CrawlCheckpoint.load(resume_run_id)
+            all_dates = checkpoint.dates
+        else:
+            # 날짜 범위 생성
+            all_dates = generate_date_range(start_date, end_date, mode)
+            checkpoint = CrawlCheckpoint()
+            checkpoint.start(all_dates, {
+                'store_name': store_name,
+                'start_date': start_date,
+                'end_date': end_date,
+                'mode': mode
+            })
+
+        crawling_status['run_id'] = checkpoint.run_id
+        run_metrics = start_run(checkpoint.run_id)
+        resilience.start_run()
+
+        # 이미 완료된 날짜는 건너뜀
+        previous = checkpoint.completed_reservations()
+        dates = checkpoint.pending_dates()
+        crawling_status['total'] = len(all_dates)
+        crawling_status['progress'] = len(all_dates) - len(dates)
 
-        # 날짜 범위 생성
-        dates = generate_date_range(start_date, end_date, mode)
-        crawling_status['total'] = len(dates)
-
-        # 크롤러 초기화
-        crawler = KTourCrawler(headless=True)
         saver = DataSaver(output_dir=config.OUTPUT_DIR)
 
-        crawling_status['message'] = 'WebDriver 설정 중...'
-        crawler.setup_driver()
+        # 요약 통계는 날짜가 끝날 때마다 누적 (/api/status에서 진행 중에도 조회)
+        aggregator = SummaryAggregator(r for date_reservations in previous.values() for r in date_reservations)
+        crawling_status['summary'] = aggregator
+
+        def on_result(result):
+            # 날짜가 끝날 때마다 체크포인트 기록 및 진행 상황 갱신
+            checkpoint.record_date(result.date, result.reservations, result.success)
+            aggregator.add_many(result.reservations)
+            crawling_status['current_date'] = result.date
+            crawling_status['progress'] += 1
+            if result.empty:
+                crawling_status['empty_dates'].append(result.date)
+                crawling_status['message'] = f'{result.date} 예약 없음'
+            elif result.success:
+                crawling_status['message'] = f'{result.date} 완료 ({len(result.reservations)}건)'
+            else:
+                crawling_status['failed_dates'].append(result.date)
+                crawling_status['message'] = f'{result.date} 크롤링 실패'
 
-        crawling_status['message'] = '로그인 중...'
-        crawler.login()
+        # 로그인된 크롤러 준비 (세션 풀 재사용, HTTP 방식에서는 로그인과 대체 크롤링용)
+        crawler = checkout_crawler(capture_network, profile)
 
-        # 각 날짜 크롤링
-        for idx, date in enumerate(dates):
-            crawling_status['current_date'] = date
-            crawling_status['message'] = f'{date} 크롤링 중...'
+        def crawler_factory():
+            return KTourCrawler(headless=True, capture_network=capture_network, profile=profile)
 
-            try:
-                # 날짜 크롤링
-                crawler.crawl_date(date)
+        if workers > 1 and backend != 'http':
+            crawling_status['message'] = f'{workers}개 브라우저로 크롤링 중...'
+        else:
+            crawling_status['message'] = f'{len(dates)}개 날짜 크롤링 중...'
 
-                crawling_status['progress'] = idx + 1
+        slots = build_slots(crawler, backend=backend, workers=workers, crawler_factory=crawler_factory)
+        reservations, _ = crawl_with_orchestrator(slots, store_name, dates, on_result)
 
-            except Exception as e:
-                crawling_status['message'] = f'{date} 크롤링 실패: {str(e)}'
-                continue
+        # 이전 실행에서 완료된 날짜의 결과와 병합
+        reservations = merge_with_checkpoint(all_dates, previous, reservations)
+        checkpoint.finish('completed' if not checkpoint.pending_dates() else 'incomplete')
 
         # 데이터 저장
         crawling_status['message'] = '데이터 저장 중...'
-        reservations = crawler.get_reservations()
 
         if reservations:
             # 파일명 생성
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"reservations_{store_name}_{start_date}_to_{end_date}_{timestamp}"
+            stores = split_stores(store_name)
+            store_label = 'all_stores' if stores == ALL_STORES else '_'.join(stores)
+            filename = f"reservations_{store_label}_{start_date}_to_{end_date}_{timestamp}"
 
             # 형식에 따라 저장
             if output_format == 'csv':
@@ -138,7 +245,7 @@ def run_crawler_task(store_name, start_date, end_date, mode, output_format, goog
                 result_file = saver.save_to_json(reservations, f"{filename}.json")
 
             # 요약 통계도 저장
-            saver.save_summary(reservations, f"summary_{filename}.json")
+            saver.save_summary(filename=f"summary_{filename}.json", summary=aggregator.snapshot())
 
             # 구글 시트에 저장
             if google_sheets and sheets_url:
@@ -172,10 +279,17 @@ def run_crawler_task(store_name, start_date, end_date, mode, output_format, goog
     except Exception as e:
         crawling_status['message'] = f'오류 발생: {str(e)}'
         crawling_status['result_file'] = None
+        task_failed = True
+        if checkpoint:
+            checkpoint.finish('failed')
 
     finally:
         if crawler:
-            crawler.close()
+            checkin_crawler(crawler, discard=task_failed)
+
+        # 단계별 소요 시간 보고서 저장
+        if run_metrics and config.METRICS_ENABLED:
+            crawling_status['metrics_file'] = run_metrics.save()
 
         crawling_status['is_running'] = False
         crawling_status['progress'] = crawling_status['total']
@@ -202,12 +316,35 @@ def start_crawling():
     # 요청 데이터 파싱
     data = request.json
     store_name = data.get('store_name', '마리엠헤어')
+    if data.get('stores'):
+        # 여러 상호: 상호명 리스트, 쉼표 구분 문자열 또는 "all"
+        store_name = join_stores(data['stores'])
     start_date = data.get('start_date')
     end_date = data.get('end_date')
     mode = data.get('mode', 'daily')  # daily, weekly, monthly
     output_format = data.get('output_format', 'csv')
     google_sheets = data.get('google_sheets', False)
     sheets_url = data.get('sheets_url', '')
+    workers = data.get('workers', 1)
+    capture_network = bool(data.get('capture_network', False))
+    backend = data.get('backend', 'browser')
+    resume_run_id = data.get('resume_run_id')
+    profile = data.get('profile') or None
+
+    # 이어서 실행하는 경우 체크포인트에 저장된 옵션 사용
+    if resume_run_id:
+        try:
+            params = CrawlCheckpoint.load(resume_run_id).params
+        except (FileNotFoundError, ValueError) as e:
+            return jsonify({
+                'success': False,
+                'message': f'체크포인트를 불러올 수 없습니다: {str(e)}'
+            }), 404
+
+        store_name = params.get('store_name', store_name)
+        start_date = params.get('start_date', start_date)
+        end_date = params.get('end_date', end_date)
+        mode = params.get('mode', mode)
 
     # 필수 필드 확인
     if not start_date or not end_date:
@@ -226,10 +363,34 @@ def start_crawling():
             'message': '날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)'
         }), 400
 
+    if backend not in ('browser', 'http'):
+        return jsonify({
+            'success': False,
+            'message': '크롤링 방식은 browser 또는 http여야 합니다'
+        }), 400
+
+    if profile is not None and profile not in BROWSER_PROFILES:
+        return jsonify({
+            'success': False,
+            'message': '브라우저 프로필은 full 또는 lean이어야 합니다'
+        }), 400
+
+    # 워커 수 검증
+    try:
+        workers = int(workers)
+        if workers < 1:
+            raise ValueError
+    except (TypeError, ValueError):
+        return jsonify({
+            'success': False,
+            'message': '워커 수는 1 이상의 정수여야 합니다'
+        }), 400
+
     # 백그라운드 스레드로 크롤링 시작
     thread = threading.Thread(
         target=run_crawler_task,
-        args=(store_name, start_date, end_date, mode, output_format, google_sheets, sheets_url)
+        args=(store_name, start_date, end_date, mode, output_format, google_sheets, sheets_url, workers, capture_network,
+              backend, resume_run_id, profile)
     )
     thread.daemon = True
     thread.start()
@@ -251,7 +412,12 @@ def get_status():
         'total': crawling_status['total'],
         'current_date': crawling_status['current_date'],
         'message': crawling_status['message'],
-        'result_file': crawling_status['result_file']
+        'result_file': crawling_status['result_file'],
+        'run_id': crawling_status['run_id'],
+        'metrics_file': crawling_status['metrics_file'],
+        'empty_dates': crawling_status['empty_dates'],
+        'failed_dates': crawling_status['failed_dates'],
+        'summary': crawling_status['summary'].snapshot() if crawling_status['summary'] else None
     })
 
 
@@ -314,4 +480,10 @@ if __name__ == '__main__':
     print("=" * 60)
     print("\n브라우저에서 http://localhost:5000 접속하세요\n")
 
+    # 디버그 리로더의 실제 서버 프로세스에서만 세션을 미리 로그인
+    if browser_pool and config.WARM_POOL_PREWARM and os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        prewarm = threading.Thread(target=browser_pool.warm_up)
+        prewarm.daemon = True
+        prewarm.start()
+
     app.run(debug=True, host='0.0.0.0', port=5000)